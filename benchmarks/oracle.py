@@ -0,0 +1,444 @@
+"""
+Differential oracle: every accelerated path against the reference strategies.
+
+    python -m benchmarks.oracle --profile quick --seed 0
+    python -m benchmarks.oracle --profile full --only sharded --output report.json
+
+Seeded random problems (constant columns, negative and huge values, integer
+ties, duplicate options, zero weights, single options, scenario outcomes) are
+scored by the pure-Python reference, i.e. each strategy's evaluate() on
+OptionEvaluation lists (a plain loop for scenario regret, which has no
+pure-Python path), and by every registered FastPath. The report gives the largest score
+deviation and the number of rank disagreements per path; every failing case
+is shrunk to a minimal reproducer in core.problems JSON form. Exits with
+status 1 when a path fails.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import Callable
+
+import numpy as np
+
+from core.agent import risk_aware_agent
+from core.batch import evaluate_batch
+from core.cache import CachedStrategy
+from core.fused import compare_strategies
+from core.hierarchy import CriteriaGroup, HierarchicalScorer
+from core.incremental import IncrementalScorer
+from core.matrix import DecisionMatrix
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.precision import Float32Strategy
+from core.problems import problem_to_dict
+from core.scoring import weighted_columns
+from core.sensitivity import sensitivity_sweep
+from core.sharding import sharded_evaluate
+from core.strategies import StrategyFactory, ScenarioRegretStrategy
+
+PROFILES = {
+    "quick": {"cases": 40, "max_options": 300, "max_criteria": 8},
+    "full": {"cases": 300, "max_options": 20_000, "max_criteria": 20},
+}
+REFERENCE_STRATEGIES = ("expected_value", "risk_averse", "regret_minimization")
+STRATEGIES = REFERENCE_STRATEGIES + ("scenario_regret",)
+# Evaluations one shrink may spend before settling for what it has.
+MAX_SHRINK_STEPS = 2_000
+
+
+@dataclass(frozen=True, eq=False)
+class Case:
+    options: list[OptionEvaluation]
+    criteria: list[Criterion]
+    strategy: str
+    risk_weight: float
+
+    @cached_property
+    def matrix(self) -> DecisionMatrix:
+        return DecisionMatrix.from_evaluations(self.options, self.criteria)
+
+    @cached_property
+    def reference(self) -> dict[str, float]:
+        if self.strategy == "scenario_regret":
+            return scenario_regret_reference(self.options, self.criteria)
+        return StrategyFactory.get_strategy(self.strategy).evaluate(self.options, self.criteria, self.risk_weight)
+
+    def to_dict(self) -> dict:
+        return {"strategy": self.strategy, "risk_weight": self.risk_weight, **problem_to_dict(self.options, self.criteria)}
+
+
+@dataclass(frozen=True)
+class FastPath:
+    """
+    One accelerated way to score a Case. run returns scores and, when the path
+    orders options itself, its ranking (names, best first; may be a prefix).
+    score_tolerance None checks rankings only; rank_tolerance is the score gap
+    under which two options may come in either order.
+    """
+    name: str
+    run: Callable[[Case], tuple[dict[str, float], list[str] | None]]
+    strategies: tuple[str, ...] = REFERENCE_STRATEGIES
+    score_tolerance: float | None = 0.0
+    rank_tolerance: float = 0.0
+
+
+@dataclass
+class Check:
+    deviation: float
+    disagreements: int
+    error: str | None = None
+
+    def failed(self, path: FastPath) -> bool:
+        return (
+            self.error is not None
+            or self.disagreements > 0
+            or (path.score_tolerance is not None and not self.deviation <= path.score_tolerance)
+        )
+
+
+@dataclass
+class PathReport:
+    cases: int = 0
+    max_deviation: float = 0.0
+    rank_disagreements: int = 0
+    failures: list[dict] = field(default_factory=list)
+
+
+# -------------------------
+# Fast paths
+# -------------------------
+def _strategy(case: Case):
+    return StrategyFactory.get_strategy(case.strategy)
+
+
+def _agent_result(result: dict) -> tuple[dict[str, float], list[str]]:
+    return dict(result["scores"]), [name for name, _ in result["ranking"]]
+
+
+def _batch(case: Case):
+    # a second, smaller problem of the same shape makes the window pack a padded batch
+    problems = [
+        (case.options, case.criteria, _strategy(case), case.risk_weight),
+        (case.options[: max(1, len(case.options) // 2)], case.criteria, _strategy(case), case.risk_weight),
+    ]
+    return _agent_result(next(evaluate_batch(problems)))
+
+
+def _sharded(case: Case):
+    third = max(1, len(case.options) // 3)
+    # one list shard and one matrix shard; a single option makes a single shard
+    shards = [case.options[:third], case.matrix.rows(slice(third, None))][: 1 + (len(case.options) > 1)]
+    result = sharded_evaluate(
+        shards, case.criteria, _strategy(case), case.risk_weight, k=len(case.options), chunk_size=7, return_scores=True
+    )
+    return result.scores, [name for name, _ in result.ranking]
+
+
+def _three_point(case: Case):
+    # scenario regret on the same outcomes without their scenarios is three-point regret
+    options = [_map_outcomes(opt, lambda o: replace(o, scenarios=None)) for opt in case.options]
+    return ScenarioRegretStrategy().evaluate(options, case.criteria, case.risk_weight), None
+
+
+def _incremental(case: Case):
+    rng = random.Random(len(case.options))
+    shuffled = case.options[:]
+    rng.shuffle(shuffled)
+    scorer = IncrementalScorer(case.criteria, case.risk_weight, shuffled)
+    # churn: drop and re-add a few options, moving the anchors
+    for opt in shuffled[: len(shuffled) // 4]:
+        scorer.remove(opt.option.name)
+    for opt in shuffled[: len(shuffled) // 4]:
+        scorer.add(opt)
+    return scorer.scores(), None
+
+
+def _hierarchy(case: Case):
+    half = max(1, len(case.criteria) // 2)
+    groups = [case.criteria[:half], case.criteria[half:]]
+    root = CriteriaGroup("root", children=tuple(
+        CriteriaGroup(f"group{g}", 1.0, tuple(group)) for g, group in enumerate(groups) if group
+    ))
+    return HierarchicalScorer(root, case.options, _strategy(case), case.risk_weight).scores(), None
+
+
+def _cached(case: Case):
+    strategy = CachedStrategy(_strategy(case))
+    strategy.evaluate(case.options, case.criteria, case.risk_weight)
+    return strategy.evaluate(case.options, case.criteria, case.risk_weight), None
+
+
+PATHS: list[FastPath] = [
+    FastPath("matrix", lambda c: (_strategy(c).evaluate(c.matrix, None, c.risk_weight), None), STRATEGIES),
+    FastPath("sweep", lambda c: (
+        dict(sensitivity_sweep(c.options, c.criteria, _strategy(c), [0.0, c.risk_weight]).as_dict()[c.risk_weight]),
+        None,
+    ), STRATEGIES),
+    FastPath("fused", lambda c: (
+        compare_strategies(c.options, c.criteria, (c.strategy,), c.risk_weight).table()[c.strategy], None
+    ), STRATEGIES),
+    FastPath("batch", _batch, STRATEGIES),
+    FastPath("sharded", _sharded),
+    FastPath("cached", _cached, STRATEGIES),
+    FastPath("float32", lambda c: (
+        Float32Strategy(_strategy(c)).evaluate(c.matrix, None, c.risk_weight), None
+    ), score_tolerance=None),
+    FastPath("incremental", _incremental, ("expected_value", "risk_averse"), 1e-9, 1e-9),
+    FastPath("hierarchy", _hierarchy, STRATEGIES, 1e-12, 1e-12),
+    FastPath("scenario_regret:three_point", _three_point, ("regret_minimization",)),
+    FastPath("agent", lambda c: _agent_result(
+        risk_aware_agent(c.options, c.criteria, _strategy(c), c.risk_weight)
+    ), STRATEGIES),
+    FastPath("agent:matrix", lambda c: _agent_result(
+        risk_aware_agent(c.matrix, c.criteria, _strategy(c), c.risk_weight)
+    ), STRATEGIES),
+    FastPath("agent:top_k", lambda c: _agent_result(
+        risk_aware_agent(c.options, c.criteria, _strategy(c), c.risk_weight, top_k=3)
+    ), STRATEGIES),
+]
+
+
+def register(path: FastPath) -> FastPath:
+    """Add a path to every later run"""
+    PATHS.append(path)
+    return path
+
+
+# -------------------------
+# Problems
+# -------------------------
+def make_case(rng: random.Random, max_options: int, max_criteria: int) -> tuple[list[OptionEvaluation], list[Criterion]]:
+    """
+    One random problem; each edge case is switched on with some probability:
+    tiny option sets, constant columns, degenerate outcomes, integer values
+    (ties), duplicated options, huge or tiny scales, zero weights, and
+    criteria whose outcomes carry scenario vectors.
+    """
+    n = rng.choice([1, 2, 3, rng.randint(4, 30), rng.randint(4, max(4, max_options))])
+    m = rng.choice([1, 2, rng.randint(1, max_criteria)])
+    scale = rng.choice([1.0, 1e-3, 1e3, 1e9])
+    integers = rng.random() < 0.3
+    constant = {j for j in range(m) if rng.random() < 0.15}
+    degenerate = rng.random() < 0.2
+    n_scenarios = rng.choice([1, 2, 5, 50])
+    scenario = {j for j in range(m) if rng.random() < 0.2}
+
+    def value():
+        v = rng.uniform(-scale, scale)
+        return float(round(v / scale * 5)) if integers else v
+
+    def outcome(j):
+        if j in scenario:
+            return Outcome.from_scenarios([value() for _ in range(n_scenarios)])
+        if degenerate and rng.random() < 0.5:
+            v = value()
+            return Outcome(v, v, v)
+        worst, expected, best = sorted(value() for _ in range(3))
+        return Outcome(best, expected, worst)
+
+    names = [f"c{j}" for j in range(m)]
+    fixed = {j: outcome(j) for j in constant}
+    rows = [[fixed[j] if j in fixed else outcome(j) for j in range(m)] for _ in range(n)]
+    for i in range(n):
+        if i and rng.random() < 0.1:
+            rows[i] = list(rows[rng.randrange(i)])
+    options = [
+        OptionEvaluation(Option(f"opt{i}"), dict(zip(names, row))) for i, row in enumerate(rows)
+    ]
+    weights = [0.0 if rng.random() < 0.1 else rng.random() for _ in range(m)]
+    total = sum(weights) or 1.0
+    criteria = [Criterion(name, w / total, rng.random() < 0.6) for name, w in zip(names, weights)]
+    return options, criteria
+
+
+# -------------------------
+# Checking and shrinking
+# -------------------------
+def check(path: FastPath, case: Case) -> Check:
+    try:
+        scores, ranking = path.run(case)
+    except Exception as error:  # a crash is a disagreement too
+        return Check(float("inf"), 0, f"{type(error).__name__}: {error}")
+    reference = case.reference
+    deviation = max(
+        (abs(scores[name] - value) if name in scores else float("inf") for name, value in reference.items()),
+        default=0.0,
+    )
+    if ranking is None:
+        ranking = sorted(scores, key=scores.get, reverse=True)
+    return Check(deviation, rank_disagreements(reference, ranking, path.rank_tolerance))
+
+
+def rank_disagreements(reference: dict[str, float], ranking: list[str], tolerance: float = 0.0) -> int:
+    """
+    Options placed below one they clearly beat (by more than tolerance on the
+    reference scores), plus options left out of a prefix ranking that clearly
+    beat one kept in it.
+    """
+    count = 0
+    lowest = float("inf")
+    for name in ranking:
+        value = reference.get(name, float("-inf"))
+        if lowest < value - tolerance:
+            count += 1
+        lowest = min(lowest, value)
+    kept = set(ranking)
+    count += sum(1 for name, value in reference.items() if name not in kept and value - tolerance > lowest)
+    return count
+
+
+def shrink(path: FastPath, case: Case, max_steps: int = MAX_SHRINK_STEPS) -> Case:
+    """
+    Greedy delta debugging: drop option chunks, then criteria, then simplify
+    the risk weight, weights and outcome values, keeping every step that
+    still fails, until nothing more can be removed.
+    """
+    steps = 0
+
+    def fails(candidate: Case) -> bool:
+        nonlocal steps
+        steps += 1
+        return check(path, candidate).failed(path)
+
+    def variants(current: Case):
+        options, criteria = current.options, current.criteria
+        size = len(options) // 2
+        while size >= 1:
+            for start in range(0, len(options), size):
+                kept = options[:start] + options[start + size:]
+                if kept:
+                    yield Case(kept, criteria, current.strategy, current.risk_weight)
+            size //= 2
+        if len(criteria) > 1:
+            for j, dropped in enumerate(criteria):
+                kept = [_map_outcomes(opt, None, dropped.name) for opt in options]
+                yield Case(kept, criteria[:j] + criteria[j + 1:], current.strategy, current.risk_weight)
+        for risk_weight in (0.0, 0.5, 1.0):
+            if risk_weight != current.risk_weight:
+                yield Case(options, criteria, current.strategy, risk_weight)
+        equal = [Criterion(c.name, 1.0 / len(criteria), c.maximize) for c in criteria]
+        if equal != criteria:
+            yield Case(options, equal, current.strategy, current.risk_weight)
+        rounded = [_map_outcomes(opt, lambda o: Outcome(*(float(round(v)) for v in (o.best, o.expected, o.worst))))
+                   for opt in options]
+        if rounded != options:
+            yield Case(rounded, criteria, current.strategy, current.risk_weight)
+        for i, opt in enumerate(options):
+            flat = _map_outcomes(opt, lambda o: Outcome(o.expected, o.expected, o.expected))
+            if flat != opt:
+                yield Case(options[:i] + [flat] + options[i + 1:], criteria, current.strategy, current.risk_weight)
+
+    progress = True
+    while progress and steps < max_steps:
+        progress = False
+        for candidate in variants(case):
+            if steps >= max_steps:
+                break
+            if fails(candidate):
+                case, progress = candidate, True
+                break
+    return case
+
+
+def scenario_regret_reference(options: list[OptionEvaluation], criteria: list[Criterion]) -> dict[str, float]:
+    """
+    ScenarioRegretStrategy() ("max" aggregation) in plain Python: per
+    criterion, the largest regret over scenarios where outcomes have them,
+    worst-case regret otherwise, normalized and weighted by weighted_columns.
+    """
+    scores = {opt.option.name: 0.0 for opt in options}
+    for criterion in criteria:
+        def regrets(outcomes, maximize=criterion.maximize):
+            if outcomes[0].scenarios is None:
+                best_worst = max(out.worst for out in outcomes)
+                return [max(0.0, best_worst - out.worst) for out in outcomes]
+            columns = list(zip(*(out.scenarios for out in outcomes)))
+            anchors = [max(column) if maximize else min(column) for column in columns]
+            return [
+                max(a - v if maximize else v - a for a, v in zip(anchors, out.scenarios)) for out in outcomes
+            ]
+
+        part = weighted_columns(options, [criterion], regrets, maximize=False).scores
+        for name in scores:
+            scores[name] += part[name]
+    return scores
+
+
+def _map_outcomes(opt: OptionEvaluation, fn=None, drop: str | None = None) -> OptionEvaluation:
+    return OptionEvaluation(
+        opt.option, {name: fn(o) if fn else o for name, o in opt.outcomes.items() if name != drop}
+    )
+
+
+# -------------------------
+# Runner
+# -------------------------
+def run(profile_name: str = "quick", seed: int = 0, only: str | None = None, log=None) -> dict:
+    profile = PROFILES[profile_name]
+    rng = random.Random(seed)
+    paths = [p for p in PATHS if only is None or only in p.name]
+    reports = {p.name: PathReport() for p in paths}
+    for number in range(profile["cases"]):
+        options, criteria = make_case(rng, profile["max_options"], profile["max_criteria"])
+        risk_weight = rng.choice([0.0, 0.5, 1.0, round(rng.random(), 3)])
+        for strategy in STRATEGIES:
+            case = Case(options, criteria, strategy, risk_weight)
+            for path in paths:
+                if strategy not in path.strategies:
+                    continue
+                report = reports[path.name]
+                result = check(path, case)
+                report.cases += 1
+                report.max_deviation = max(report.max_deviation, result.deviation)
+                report.rank_disagreements += result.disagreements
+                if result.failed(path):
+                    minimal = shrink(path, case)
+                    failure = {
+                        "case": number,
+                        "strategy": strategy,
+                        "deviation": result.deviation,
+                        "disagreements": result.disagreements,
+                        "error": result.error,
+                        "reproducer": minimal.to_dict(),
+                    }
+                    report.failures.append(failure)
+                    if log is not None:
+                        print(f"FAIL {path.name} case {number} {strategy}: {json.dumps(failure['reproducer'])}", file=log)
+    if log is not None:
+        for name, report in reports.items():
+            print(
+                f"{name:<28} {report.cases:6d} cases  max deviation {report.max_deviation:.3g}  "
+                f"rank disagreements {report.rank_disagreements}  failures {len(report.failures)}",
+                file=log,
+            )
+    return {
+        "meta": {
+            "profile": profile_name,
+            "seed": seed,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+        },
+        "paths": {name: vars(report) for name, report in reports.items()},
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.oracle")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", help="run only paths whose name contains this text")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    result = run(args.profile, args.seed, args.only, log=sys.stderr)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(json.dumps(result, indent=2) + "\n")
+    return 1 if any(report["failures"] for report in result["paths"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Synthetic-workload benchmarks with JSON baselines.
+
+    python -m benchmarks.suite run --profile quick --output results.json
+    python -m benchmarks.suite compare baseline.json results.json --threshold 0.15
+
+run times every target on seeded problems and records the best-of-N wall time,
+throughput (options per second) and peak traced memory. compare exits with
+status 1 when a case got slower than the baseline by more than the threshold.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from core.agent import risk_aware_agent
+from core.matrix import DecisionMatrix
+from core.models import Criterion
+from core.scoring import calculate_scores, calculate_scores_with_risk
+from core.sensitivity import sensitivity_analysis
+from core.strategies import StrategyFactory, RiskAverseStrategy
+
+PROFILES = {
+    "quick": {"options": [10, 1_000, 10_000], "criteria": [2, 20], "repeats": 3},
+    "full": {"options": [10, 1_000, 100_000, 1_000_000], "criteria": [2, 20, 200], "repeats": 5},
+}
+# Largest options x criteria cell run on OptionEvaluation lists / on a DecisionMatrix.
+MAX_OBJECT_CELLS = 200_000
+MAX_MATRIX_CELLS = 20_000_000
+
+
+@dataclass(frozen=True)
+class Workload:
+    n_options: int
+    n_criteria: int
+    kind: str  # "objects" or "matrix"
+    options: object
+    criteria: list[Criterion]
+
+
+@dataclass(frozen=True)
+class Target:
+    name: str
+    run: Callable[[Workload], object]
+    objects_only: bool = False
+
+
+def make_matrix(n_options: int, n_criteria: int, seed: int = 0) -> DecisionMatrix:
+    """Seeded synthetic problem: outcomes in [-50, 90], roughly half minimize criteria"""
+    rng = np.random.default_rng([seed, n_options, n_criteria])
+    worst = rng.uniform(-50, 50, (n_options, n_criteria))
+    expected = worst + rng.uniform(0, 20, worst.shape)
+    best = expected + rng.uniform(0, 20, worst.shape)
+    criteria = [
+        Criterion(f"c{j}", float(w), bool(m))
+        for j, (w, m) in enumerate(zip(rng.dirichlet(np.ones(n_criteria)), rng.random(n_criteria) < 0.5))
+    ]
+    return DecisionMatrix.from_arrays([f"opt{i}" for i in range(n_options)], criteria, best, expected, worst)
+
+
+def workloads(profile: dict, seed: int = 0):
+    for n in profile["options"]:
+        for m in profile["criteria"]:
+            if n * m > MAX_MATRIX_CELLS:
+                continue
+            matrix = make_matrix(n, m, seed)
+            if n * m <= MAX_OBJECT_CELLS:
+                yield Workload(n, m, "objects", matrix.to_evaluations(), matrix.criteria)
+            yield Workload(n, m, "matrix", matrix, matrix.criteria)
+
+
+def targets() -> list[Target]:
+    result = [
+        Target(f"strategy:{name}", lambda w, s=StrategyFactory.get_strategy(name): s.evaluate(w.options, w.criteria, 0.5))
+        for name in StrategyFactory.names()
+    ]
+    return result + [
+        Target("calculate_scores", lambda w: calculate_scores(w.options, w.criteria)),
+        Target("calculate_scores_with_risk", lambda w: calculate_scores_with_risk(w.options, w.criteria, 0.5)),
+        Target("sensitivity_analysis", lambda w: sensitivity_analysis(w.options, w.criteria, RiskAverseStrategy())),
+        # the agent validates OptionEvaluation objects, so it only runs on lists
+        Target("risk_aware_agent", lambda w: risk_aware_agent(w.options, w.criteria, RiskAverseStrategy()), True),
+    ]
+
+
+def measure(target: Target, workload: Workload, repeats: int) -> dict:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        target.run(workload)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        target.run(workload)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds": best,
+        "throughput": workload.n_options / best if best > 0 else float("inf"),
+        "peak_bytes": peak,
+    }
+
+
+def run(profile_name: str = "quick", seed: int = 0, only: str | None = None, log=None) -> dict:
+    profile = PROFILES[profile_name]
+    results = {}
+    for workload in workloads(profile, seed):
+        for target in targets():
+            if target.objects_only and workload.kind != "objects":
+                continue
+            if only is not None and only not in target.name:
+                continue
+            case = f"{target.name}/{workload.kind}/n={workload.n_options}/m={workload.n_criteria}"
+            results[case] = measure(target, workload, profile["repeats"])
+            if log is not None:
+                r = results[case]
+                print(f"{case:<70} {r['seconds'] * 1e3:10.3f} ms {r['peak_bytes'] / 2**20:9.2f} MiB", file=log)
+    return {
+        "meta": {
+            "profile": profile_name,
+            "seed": seed,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.15) -> list[dict]:
+    """
+    Cases present in both runs whose time grew by more than threshold
+    (0.15 = 15% slower), worst first.
+    """
+    regressions = []
+    for case, base in baseline["results"].items():
+        now = current["results"].get(case)
+        if now is None or base["seconds"] <= 0:
+            continue
+        ratio = now["seconds"] / base["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append({
+                "case": case,
+                "baseline_seconds": base["seconds"],
+                "seconds": now["seconds"],
+                "ratio": ratio,
+            })
+    return sorted(regressions, key=lambda r: r["ratio"], reverse=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the suite and write a JSON result file")
+    run_parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--only", help="run only targets whose name contains this text")
+    run_parser.add_argument("--output", default="-")
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        result = run(args.profile, args.seed, args.only, log=sys.stderr)
+        text = json.dumps(result, indent=2)
+        if args.output == "-":
+            print(text)
+        else:
+            with open(args.output, "w") as f:
+                f.write(text + "\n")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r['case']}: {r['baseline_seconds'] * 1e3:.3f} ms -> {r['seconds'] * 1e3:.3f} ms (x{r['ratio']:.2f})")
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,44 +1,151 @@
+import heapq
+from collections.abc import Mapping
+from typing import Callable, Iterable, Iterator
 from core.strategies import Strategy
 from core.models import OptionEvaluation, Criterion
-from core.normalization import normalize
+from core.uncertainty import risk_adjusted_score
+from core.instrumentation import stage
+
+
+class Breakdown(Mapping):
+    """
+    Read-only mapping option name -> {criterion: raw value the strategy normalized}.
+    Rows are built only when accessed.
+    """
+
+    def __init__(self, names: Iterable[str], row: Callable[[str], dict[str, float]]):
+        self._names = list(names)
+        self._known = set(self._names)
+        self._row = row
+
+    def __getitem__(self, name: str) -> dict[str, float]:
+        if name not in self._known:
+            raise KeyError(name)
+        return self._row(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def __reduce__(self):
+        # row may be a closure; crossing a process boundary materializes it
+        return dict, (dict(self),)
+
 
 def risk_aware_agent(
     options: list[OptionEvaluation],
     criteria: list[Criterion],
     strategy: Strategy,
-    risk_weight: float = 0.5
+    risk_weight: float = 0.5,
+    top_k: int | None = None,
+    prune_dominated: bool = False
 ) -> dict:
     """
     Compute scores + breakdown + explanation.
+    top_k: only rank and explain the k best options.
+    prune_dominated: for risk-adjusted strategies (Strategy.risk_adjusted), drop
+    options Pareto-dominated on the risk-adjusted criterion values the strategy
+    scores, then score the rest; the result reports "pruned" (always 0 for other
+    strategies, which score different values). Scores are computed on the reduced
+    set, so the min-max anchors, and with them the scores and even the order of
+    the kept options, can differ from an unpruned call.
     """
+    size = {"n_options": len(options), "n_criteria": len(criteria)}
+
     # 1 validation
     from core.validation import validate_options
-    validate_options(options, criteria)
+    with stage("agent.validation", **size):
+        validate_options(options, criteria)
 
-    # 2 scoring
-    scores = strategy.evaluate(options, criteria, risk_weight=risk_weight)
+    pruned = 0
+    if prune_dominated and strategy.risk_adjusted:
+        with stage("agent.pruning", **size):
+            kept = non_dominated(options, criteria, risk_weight)
+        pruned = len(options) - len(kept)
+        options = kept
+
+    # 2 scoring, keeping the strategy's per-criterion intermediates
+    with stage("agent.scoring", strategy=type(strategy).__name__, **size):
+        evaluation = strategy.evaluate_detailed(options, criteria, risk_weight=risk_weight)
+    scores = evaluation.scores
 
     # 3 ranking
-    ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-
-    # 4 breakdown per option for human explanation
-    breakdown = {}
-    for opt_eval in options:
-        option_name = opt_eval.option.name
-        bd = {}
-        for crit in criteria:
-            out = opt_eval.outcomes[crit.name]
-            # risk-aware adjustment
-            spread = out.best - out.worst
-            if crit.maximize:
-                raw_score = out.expected - risk_weight * spread
-            else:
-                raw_score = out.expected + risk_weight * spread
-            bd[crit.name] = raw_score
-        breakdown[option_name] = bd
-
-    return {
+    with stage("agent.ranking", **size):
+        if top_k is None:
+            ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        else:
+            ranked = heapq.nlargest(top_k, scores.items(), key=lambda x: x[1])
+
+    # 4 breakdown per option for human explanation, built on access; the
+    # agent.breakdown stage times each row when it is materialized
+    if evaluation.raw is not None and not evaluation.risk_adjusted:
+        row = evaluation.row
+    else:
+        # risk-adjusted strategies, and strategies without intermediates, are explained
+        # by risk-adjusted values in the criterion's direction (spread added to costs)
+        by_name = {}
+
+        def row(name):
+            if not by_name:
+                by_name.update((opt_eval.option.name, opt_eval) for opt_eval in options)
+            outcomes = by_name[name].outcomes
+            bd = {}
+            for crit in criteria:
+                out = outcomes[crit.name]
+                spread = out.best - out.worst
+                if crit.maximize:
+                    bd[crit.name] = out.expected - risk_weight * spread
+                else:
+                    bd[crit.name] = out.expected + risk_weight * spread
+            return bd
+
+    def timed_row(name):
+        with stage("agent.breakdown", **size):
+            return row(name)
+
+    breakdown = Breakdown(scores if top_k is None else [name for name, _ in ranked], timed_row)
+
+    result = {
         "scores": scores,
         "ranking": ranked,
         "breakdown": breakdown
     }
+    if prune_dominated:
+        result["pruned"] = pruned
+    return result
+
+
+def non_dominated(
+    options: list[OptionEvaluation],
+    criteria: list[Criterion],
+    risk_weight: float = 0.5
+) -> list[OptionEvaluation]:
+    """
+    Options not Pareto-dominated on risk-adjusted values, in input order.
+    Candidates are visited by descending total so a dominator is always seen
+    before the options it dominates; each is checked against the kept front only.
+    """
+    signs = [1.0 if crit.maximize else -1.0 for crit in criteria]
+    points = [
+        tuple(
+            sign * risk_adjusted_score(opt.outcomes[crit.name], risk_weight)
+            for crit, sign in zip(criteria, signs)
+        )
+        for opt in options
+    ]
+    # rounding keeps sums monotone; the tuple settles equal sums lexicographically
+    order = sorted(range(len(options)), key=lambda i: (sum(points[i]), points[i]), reverse=True)
+    front: list[int] = []
+    for i in order:
+        p = points[i]
+        dominated = any(
+            all(a >= b for a, b in zip(points[f], p)) and points[f] != p for f in front
+        )
+        if not dominated:
+            front.append(i)
+    return [options[i] for i in sorted(front)]
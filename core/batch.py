@@ -0,0 +1,218 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+
+from core.models import OptionEvaluation, Criterion
+from core.matrix import DecisionMatrix, weighted_sum
+from core.normalization import MinMaxNormalizer, get_normalizer, using_normalizer
+from core.scenarios import ScenarioMatrix
+from core.strategies import Strategy
+from core.validation import validate_options
+
+Problem = tuple[Sequence[OptionEvaluation], Sequence[Criterion], Strategy, float]
+
+
+@dataclass(frozen=True, eq=False)
+class PaddedBatch:
+    """
+    Problems sharing one criteria list, packed into padded tensors.
+    best / expected / worst have shape (problems, max options, criteria);
+    mask marks the real option slots, risk_weights holds one value per problem.
+    scenarios holds, per problem, the ScenarioMatrix scenario columns, or None
+    when that problem has no scenario outcomes.
+    """
+    option_names: tuple[tuple[str, ...], ...]
+    criterion_names: tuple[str, ...]
+    best: np.ndarray
+    expected: np.ndarray
+    worst: np.ndarray
+    mask: np.ndarray
+    weights: np.ndarray
+    maximize: np.ndarray
+    risk_weights: np.ndarray
+    scenarios: tuple[tuple[np.ndarray | None, ...] | None, ...] = ()
+
+    @classmethod
+    def pack(
+        cls, problems: Sequence[tuple[Sequence[OptionEvaluation], float]], criteria: Sequence[Criterion]
+    ) -> "PaddedBatch":
+        names = [c.name for c in criteria]
+        width = max(len(options) for options, _ in problems)
+        shape = (len(problems), width, len(names))
+        best, expected, worst = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+        mask = np.zeros(shape[:2], dtype=bool)
+        scenarios = []
+        for p, (options, _) in enumerate(problems):
+            rows = [[opt.outcomes[name] for name in names] for opt in options]
+            n = len(rows)
+            best[p, :n] = [[o.best for o in row] for row in rows]
+            expected[p, :n] = [[o.expected for o in row] for row in rows]
+            worst[p, :n] = [[o.worst for o in row] for row in rows]
+            mask[p, :n] = True
+            has_scenarios = any(o.scenarios is not None for row in rows for o in row)
+            scenarios.append(ScenarioMatrix.from_evaluations(options, criteria).scenarios if has_scenarios else None)
+        return cls(
+            option_names=tuple(tuple(opt.option.name for opt in options) for options, _ in problems),
+            criterion_names=tuple(names),
+            best=best,
+            expected=expected,
+            worst=worst,
+            mask=mask,
+            weights=np.array([c.weight for c in criteria], dtype=float),
+            maximize=np.array([c.maximize for c in criteria], dtype=bool),
+            risk_weights=np.array([rw for _, rw in problems], dtype=float),
+            scenarios=tuple(scenarios),
+        )
+
+    def __len__(self) -> int:
+        return len(self.option_names)
+
+    def matrix(self, p: int) -> DecisionMatrix:
+        """The p-th problem as a DecisionMatrix, or a ScenarioMatrix when it has scenarios"""
+        n = len(self.option_names[p])
+        fields = dict(
+            option_names=self.option_names[p],
+            criterion_names=self.criterion_names,
+            best=self.best[p, :n],
+            expected=self.expected[p, :n],
+            worst=self.worst[p, :n],
+            weights=self.weights,
+            maximize=self.maximize,
+        )
+        if self.scenarios and self.scenarios[p] is not None:
+            return ScenarioMatrix(**fields, scenarios=self.scenarios[p])
+        return DecisionMatrix(**fields)
+
+
+def evaluate_batch(
+    problems: Iterable[Problem],
+    workers: int | None = None,
+    window: int = 1_024,
+) -> Iterator[dict]:
+    """
+    Evaluate many independent (options, criteria, strategy, risk_weight) problems
+    and yield one risk_aware_agent-shaped result per problem, in input order.
+
+    Problems are read window at a time. Inside a window, problems sharing the
+    same criteria and strategy configuration (Strategy.cache_key) are packed
+    into a PaddedBatch and scored by one Strategy.evaluate_padded call; the
+    rest go to a process pool when workers > 1, or are run inline otherwise.
+    """
+    iterator = iter(problems)
+    pool = ProcessPoolExecutor(workers) if workers and workers > 1 else None
+    try:
+        while True:
+            chunk = list(islice(iterator, window))
+            if not chunk:
+                return
+            yield from _evaluate_window(chunk, pool)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def _evaluate_window(chunk: list[Problem], pool: Executor | None) -> list[dict]:
+    groups: dict[tuple, list[int]] = {}
+    for i, (options, criteria, strategy, _) in enumerate(chunk):
+        validate_options(options, criteria)
+        key = (tuple((c.name, c.weight, c.maximize) for c in criteria), strategy.cache_key())
+        groups.setdefault(key, []).append(i)
+
+    results: list[dict | None] = [None] * len(chunk)
+    singles = []
+    for indices in groups.values():
+        if len(indices) == 1:
+            singles.append(indices[0])
+            continue
+        _, criteria, strategy, _ = chunk[indices[0]]
+        batch = PaddedBatch.pack([(chunk[i][0], chunk[i][3]) for i in indices], criteria)
+        for i, result in zip(indices, padded_results(batch, *strategy.evaluate_padded(batch))):
+            results[i] = result
+
+    if singles:
+        args = [chunk[i] for i in singles]
+        run = map if pool is None else pool.map
+        # workers do not share this process's normalizer, so it travels with each problem
+        normalizers = [get_normalizer()] * len(args)
+        for i, result in zip(singles, run(_agent, normalizers, *zip(*args))):
+            results[i] = result
+    return results
+
+
+def _agent(normalizer, *problem) -> dict:
+    from core.agent import risk_aware_agent
+    with using_normalizer(normalizer):
+        return risk_aware_agent(*problem)
+
+
+# -------------------------
+# Padded kernels
+# -------------------------
+def normalize_padded(values: np.ndarray, mask: np.ndarray, maximize: np.ndarray | bool = True) -> np.ndarray:
+    """
+    normalize_columns over the option axis of (problems, options, criteria) values,
+    ignoring padded slots. Padded slots come back as 0.
+    """
+    normalizer = get_normalizer()
+    if not isinstance(normalizer, MinMaxNormalizer):
+        # other normalizers need the real slots only, one problem at a time
+        normalized = np.zeros(values.shape)
+        for p, n in enumerate(mask.sum(axis=1).tolist()):
+            normalized[p, :n] = normalizer.columns(values[p, :n], maximize)
+        return normalized
+    real = mask[..., None]
+    min_val = np.where(real, values, np.inf).min(axis=1, keepdims=True)
+    max_val = np.where(real, values, -np.inf).max(axis=1, keepdims=True)
+    span = max_val - min_val
+    degenerate = span == 0
+    span = np.where(degenerate, 1.0, span)
+    normalized = np.where(maximize, (values - min_val) / span, (max_val - values) / span)
+    return np.where(real, np.where(degenerate, normalizer.constant, normalized), 0.0)
+
+
+def risk_adjusted_padded_values(batch: PaddedBatch) -> np.ndarray:
+    return batch.expected - batch.risk_weights[:, None, None] * (batch.best - batch.worst)
+
+
+def explained_padded_values(batch: PaddedBatch) -> np.ndarray:
+    """
+    The agent's breakdown of risk-adjusted strategies: expected - risk_weight * spread
+    on maximized criteria, expected + risk_weight * spread on minimized ones.
+    """
+    adjustment = batch.risk_weights[:, None, None] * (batch.best - batch.worst)
+    return np.where(batch.maximize, batch.expected - adjustment, batch.expected + adjustment)
+
+
+def risk_adjusted_padded(batch: PaddedBatch) -> tuple[np.ndarray, np.ndarray]:
+    """(problems, options) calculate_scores_with_risk scores of a PaddedBatch, and their breakdown values"""
+    values = risk_adjusted_padded_values(batch)
+    scores = weighted_sum(normalize_padded(values, batch.mask, batch.maximize), batch.weights)
+    return scores, explained_padded_values(batch)
+
+
+def regret_padded(batch: PaddedBatch) -> tuple[np.ndarray, np.ndarray]:
+    """(problems, options) RegretMinimizationStrategy scores of a PaddedBatch, and the regrets"""
+    best_worst = np.where(batch.mask[..., None], batch.worst, -np.inf).max(axis=1, keepdims=True)
+    regrets = np.maximum(0.0, best_worst - batch.worst)
+    return weighted_sum(normalize_padded(regrets, batch.mask, False), batch.weights), regrets
+
+
+def padded_results(batch: PaddedBatch, scores: np.ndarray, raw: np.ndarray) -> list[dict]:
+    """Build risk_aware_agent results (scores, ranking, breakdown) for every packed problem"""
+    order = np.argsort(np.where(batch.mask, -scores, np.inf), axis=1, kind="stable")
+    results = []
+    for p, names in enumerate(batch.option_names):
+        n = len(names)
+        row = scores[p, :n].tolist()
+        results.append({
+            "scores": dict(zip(names, row)),
+            "ranking": [(names[i], row[i]) for i in order[p, :n].tolist()],
+            "breakdown": {
+                name: dict(zip(batch.criterion_names, values))
+                for name, values in zip(names, raw[p, :n].tolist())
+            },
+        })
+    return results
@@ -0,0 +1,308 @@
+import heapq
+from dataclasses import dataclass, field
+from typing import List
+
+import numpy as np
+from numpy.polynomial import polynomial as P
+
+from core.models import OptionEvaluation, Criterion
+from core.matrix import DecisionMatrix, risk_adjusted_scores
+from core.normalization import MinMaxNormalizer, using_normalizer
+from core.scoring import as_decision_matrix
+
+# Two events closer than this (in risk_weight units) are treated as simultaneous.
+TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class Breakpoint:
+    """
+    A risk weight where the ranking structure changes.
+    anchors: criteria whose min or max normalization anchor switches option.
+    swaps: (rising, falling) option pairs that exchange adjacent rank.
+    """
+    risk_weight: float
+    anchors: tuple[str, ...] = ()
+    swaps: tuple[tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class RankingInterval:
+    """
+    Ranking (best first) that holds on the open interval (start, end), or,
+    when start == end, at that single risk weight only (a criterion whose
+    values all tie there normalizes to the constant 1.0).
+    """
+    start: float
+    end: float
+    ranking: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class RankingProfile:
+    breakpoints: list[Breakpoint] = field(default_factory=list)
+    intervals: list[RankingInterval] = field(default_factory=list)
+
+    def ranking_at(self, risk_weight: float) -> tuple[str, ...]:
+        """Ranking at risk_weight: its single-point interval, else the interval containing it (left-closed)"""
+        for interval in self.intervals:
+            if interval.start == interval.end == risk_weight:
+                return interval.ranking
+        for interval in self.intervals:
+            if interval.start <= risk_weight < interval.end:
+                return interval.ranking
+        return [i for i in self.intervals if i.start < i.end][-1].ranking
+
+    @property
+    def reversals(self) -> list[Breakpoint]:
+        """Breakpoints where at least two options swap rank"""
+        return [bp for bp in self.breakpoints if bp.swaps]
+
+
+def rank_breakpoints(
+    options: List[OptionEvaluation],
+    criteria: List[Criterion],
+    lo: float = 0.0,
+    hi: float = 1.0,
+) -> RankingProfile:
+    """
+    Exact ranking breakpoints of calculate_scores_with_risk / RiskAverseStrategy
+    over risk_weight in [lo, hi].
+
+    Each adjusted value expected - r * (best - worst) is a line in r, so every
+    criterion's min/max anchors follow the lower/upper envelope of those lines.
+    Between anchor changes each pairwise score difference is a rational function
+    of r, and a kinetic sort tracks the ranking: only adjacent pairs carry a
+    "next crossing" event, and each swap reschedules its new neighbours.
+    Where a criterion's span c + d * r reaches 0 its values all tie, and the
+    ranking at that exact point is evaluated directly; a differing one becomes
+    a single-point interval with a breakpoint naming the collapsed criteria.
+    The analysis is specific to min-max normalization (with 1.0 for constant
+    columns), whatever normalizer is active.
+    """
+    matrix = as_decision_matrix(options, criteria)
+    if matrix is None:
+        matrix = DecisionMatrix.from_evaluations(options, criteria)
+    return _Sweep(matrix, lo, hi).run()
+
+
+# -------------------------
+# Line envelopes (anchors)
+# -------------------------
+def _lower_envelope(a: np.ndarray, b: np.ndarray, lo: float, hi: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Lower envelope of the lines a + b * r on [lo, hi], by the convex hull trick.
+    Returns (piece start points, line index per piece).
+    """
+    hull: list[int] = []
+    starts: list[float] = []
+    # as r grows the minimum moves to ever smaller slopes
+    for i in np.lexsort((a, -b)).tolist():
+        if hull and b[hull[-1]] == b[i]:
+            continue  # parallel and not lower
+        while hull:
+            x = (a[i] - a[hull[-1]]) / (b[hull[-1]] - b[i])
+            if len(hull) > 1 and x <= starts[-1]:
+                hull.pop()
+                starts.pop()
+                continue
+            break
+        if hull:
+            starts.append(x)
+        hull.append(i)
+    bounds = np.array([-np.inf] + starts)
+    lines = np.array(hull)
+    # clip to [lo, hi]
+    first = np.searchsorted(bounds, lo, side="right") - 1
+    last = np.searchsorted(bounds, hi, side="left")
+    bounds, lines = bounds[first:last].copy(), lines[first:last]
+    bounds[0] = lo
+    return bounds, lines
+
+
+def _line_at(bounds: np.ndarray, lines: np.ndarray, r: float) -> int:
+    return int(lines[np.searchsorted(bounds, r, side="right") - 1])
+
+
+# -------------------------
+# Kinetic ranking sweep
+# -------------------------
+class _Sweep:
+    def __init__(self, matrix: DecisionMatrix, lo: float, hi: float):
+        if not lo < hi:
+            raise ValueError("lo must be smaller than hi")
+        self.matrix = matrix
+        self.names = matrix.option_names
+        self.criterion_names = matrix.criterion_names
+        self.a = matrix.expected
+        self.b = -(matrix.best - matrix.worst)
+        self.sign = np.where(matrix.maximize, 1.0, -1.0)
+        self.weights = matrix.weights
+        self.lo, self.hi = lo, hi
+        self.lower = [_lower_envelope(self.a[:, j], self.b[:, j], lo, hi) for j in range(matrix.n_criteria)]
+        self.upper = [_lower_envelope(-self.a[:, j], -self.b[:, j], lo, hi) for j in range(matrix.n_criteria)]
+
+        self.order: list[int] = []
+        self.position: list[int] = []
+        self.breakpoints: list[Breakpoint] = []
+        self.intervals: list[RankingInterval] = []
+        self.interval_start = lo
+        # risk weight -> criteria whose span is 0 there
+        self.collapses: dict[float, set[str]] = {}
+
+    def run(self) -> RankingProfile:
+        anchor_points: dict[float, set[str]] = {}
+        for j, name in enumerate(self.criterion_names):
+            for bounds, _ in (self.lower[j], self.upper[j]):
+                for x in bounds[1:].tolist():
+                    anchor_points.setdefault(x, set()).add(name)
+        cuts = sorted(anchor_points)
+        for t0, t1 in zip([self.lo] + cuts, cuts + [self.hi]):
+            self._prepare_interval(t0, t1)
+            if not self.order:
+                scores = self._scores(t0)
+                self.order = np.argsort(-scores, kind="stable").tolist()
+                self.position = [0] * len(self.order)
+                for pos, i in enumerate(self.order):
+                    self.position[i] = pos
+            self._run_interval(t0, t1, sorted(anchor_points.get(t0, ())))
+        self.intervals.append(RankingInterval(self.interval_start, self.hi, self._ranking()))
+        self._add_collapses()
+        return RankingProfile(self.breakpoints, self.intervals)
+
+    def _add_collapses(self) -> None:
+        """Rank exactly at every point where a span vanishes; keep those that differ from their interval"""
+        profile = RankingProfile(self.breakpoints, self.intervals)
+        known = {bp.risk_weight for bp in self.breakpoints}
+        for r, names in sorted(self.collapses.items()):
+            with using_normalizer(MinMaxNormalizer()):
+                scores = risk_adjusted_scores(self.matrix, r)
+            ranking = tuple(self.names[i] for i in np.argsort(-scores, kind="stable").tolist())
+            if ranking == profile.ranking_at(r):
+                continue
+            self.intervals.append(RankingInterval(r, r, ranking))
+            if r not in known:
+                self.breakpoints.append(Breakpoint(r, tuple(sorted(names))))
+        self.intervals.sort(key=lambda i: (i.start, i.end))
+        self.breakpoints.sort(key=lambda bp: bp.risk_weight)
+
+    def _prepare_interval(self, t0: float, t1: float) -> None:
+        """
+        Fix the anchor lines for (t0, t1) and precompute the common-denominator
+        polynomials used to find pairwise crossings.
+        """
+        mid = (t0 + t1) / 2
+        self.t1 = t1
+        m = len(self.criterion_names)
+        lo_idx = [_line_at(*self.lower[j], mid) for j in range(m)]
+        hi_idx = [_line_at(*self.upper[j], mid) for j in range(m)]
+        cols = np.arange(m)
+        # span of each criterion is the line c + d * r
+        c = self.a[hi_idx, cols] - self.a[lo_idx, cols]
+        d = self.b[hi_idx, cols] - self.b[lo_idx, cols]
+        anchor = np.where(self.sign > 0, self.a[lo_idx, cols], self.a[hi_idx, cols])
+        anchor_b = np.where(self.sign > 0, self.b[lo_idx, cols], self.b[hi_idx, cols])
+        self.c, self.d, self.anchor, self.anchor_b = c, d, anchor, anchor_b
+
+        # a span is positive inside the interval, so it can only vanish at an end
+        for j in np.flatnonzero(d != 0).tolist():
+            root = -c[j] / d[j]
+            for end in (t0, t1):
+                if abs(root - end) <= TOLERANCE:
+                    self.collapses.setdefault(end, set()).add(self.criterion_names[j])
+
+        # group criteria sharing a denominator so the crossing polynomial stays low-degree
+        active = ~((c == 0) & (d == 0))
+        groups: dict[float | None, int] = {}
+        group_of = np.full(m, -1)
+        scale = np.zeros(m)
+        denominators = []
+        for j in np.flatnonzero(active).tolist():
+            # span / |d| keeps every denominator positive inside the interval
+            key = None if d[j] == 0 else c[j] / d[j]
+            if key not in groups:
+                groups[key] = len(groups)
+                denominators.append(
+                    np.array([1.0]) if key is None else np.array([c[j], d[j]]) / abs(d[j])
+                )
+            group_of[j] = groups[key]
+            scale[j] = self.weights[j] * self.sign[j] / (c[j] if d[j] == 0 else abs(d[j]))
+        k = len(denominators)
+        membership = np.zeros((m, k))
+        membership[np.flatnonzero(active), group_of[active]] = 1.0
+        self.membership = membership * scale[:, None]
+        degree = k + 1
+        self.q = np.zeros((k, degree))
+        self.rq = np.zeros((k, degree))
+        for g in range(k):
+            poly = np.array([1.0])
+            for h in range(k):
+                if h != g:
+                    poly = P.polymul(poly, denominators[h])
+            self.q[g, : len(poly)] = poly
+            self.rq[g, 1 : len(poly) + 1] = poly
+
+    def _scores(self, r: float) -> np.ndarray:
+        values = self.a + self.b * r
+        span = self.c + self.d * r
+        span = np.where(span == 0, 1.0, span)
+        normalized = self.sign * (values - (self.anchor + self.anchor_b * r)) / span
+        normalized = np.where((self.c == 0) & (self.d == 0), 1.0, normalized)
+        return normalized @ self.weights
+
+    def _next_crossing(self, upper: int, lower: int, t: float) -> float | None:
+        """First r >= t in the interval where option lower overtakes option upper"""
+        da = (self.a[upper] - self.a[lower]) @ self.membership
+        db = (self.b[upper] - self.b[lower]) @ self.membership
+        poly = da @ self.q + db @ self.rq
+        reference = np.abs(da) @ np.abs(self.q) + np.abs(db) @ np.abs(self.rq)
+        poly = P.polytrim(poly, 1e-12 * max(float(reference.max(initial=0.0)), 1e-300))
+        if len(poly) == 1:
+            return t if poly[0] < 0 else None
+        roots = P.polyroots(poly)
+        real = roots.real[np.abs(roots.imag) <= 1e-9 * (1 + np.abs(roots.real))]
+        candidates = sorted(x for x in real.tolist() if t + TOLERANCE < x < self.t1)
+        points = [t] + candidates + [self.t1]
+        for start, end in zip(points, points[1:]):
+            if P.polyval((start + end) / 2, poly) < 0:
+                return start
+        return None
+
+    def _schedule(self, heap: list, pos: int, t: float) -> None:
+        if 0 <= pos < len(self.order) - 1:
+            upper, lower = self.order[pos], self.order[pos + 1]
+            when = self._next_crossing(upper, lower, t)
+            if when is not None:
+                heapq.heappush(heap, (when, upper, lower))
+
+    def _run_interval(self, t0: float, t1: float, anchors: list[str]) -> None:
+        heap: list = []
+        for pos in range(len(self.order) - 1):
+            self._schedule(heap, pos, t0)
+        now = t0
+        while True:
+            before = self._ranking()
+            swaps = []
+            while heap and heap[0][0] <= now + TOLERANCE:
+                _, upper, lower = heapq.heappop(heap)
+                pos = self.position[upper]
+                if pos + 1 >= len(self.order) or self.order[pos + 1] != lower:
+                    continue  # stale: pair no longer adjacent in this order
+                self.order[pos], self.order[pos + 1] = lower, upper
+                self.position[lower], self.position[upper] = pos, pos + 1
+                swaps.append((self.names[lower], self.names[upper]))
+                for p in (pos - 1, pos, pos + 1):
+                    self._schedule(heap, p, now)
+            # swaps at lo only settle ties in the starting ranking
+            if now > self.lo and (swaps or (now == t0 and anchors)):
+                self.intervals.append(RankingInterval(self.interval_start, now, before))
+                self.interval_start = now
+                self.breakpoints.append(
+                    Breakpoint(now, tuple(anchors) if now == t0 else (), tuple(swaps))
+                )
+            if not heap or heap[0][0] >= t1:
+                return
+            now = heap[0][0]
+
+    def _ranking(self) -> tuple[str, ...]:
+        return tuple(self.names[i] for i in self.order)
@@ -0,0 +1,318 @@
+import hashlib
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable, List, Dict
+
+from core.models import OptionEvaluation, Criterion
+from core.normalization import get_normalizer
+from core.scoring import Evaluation
+from core.strategies import Strategy
+
+
+def fingerprint(
+    options: List[OptionEvaluation],
+    criteria: List[Criterion],
+    strategy: Strategy,
+    risk_weight: float = 0.5,
+    namespace: str = ""
+) -> str:
+    """
+    Stable content hash of one evaluate() call.
+    Covers the strategy's cache_key() (its type and scoring configuration),
+    the active normalizer, the risk weight, every criterion and the outcomes
+    each option has for those criteria (scenarios included), in order; extra
+    outcomes are ignored. namespace separates anything cache_key() leaves out.
+    """
+    matrix_module = sys.modules.get("core.matrix")
+    matrix = None
+    if matrix_module is not None and isinstance(options, matrix_module.DecisionMatrix):
+        matrix = options if criteria is None else options.with_criteria(criteria)
+        criteria = matrix.criteria
+
+    digest = hashlib.sha256()
+
+    def text(value: str) -> None:
+        data = value.encode()
+        digest.update(struct.pack("<Q", len(data)))
+        digest.update(data)
+
+    text(repr(strategy.cache_key()))
+    text(namespace)
+    text(get_normalizer().key())
+    digest.update(struct.pack("<d", risk_weight))
+    for c in criteria:
+        text(c.name)
+        digest.update(struct.pack("<d?", c.weight, c.maximize))
+
+    if matrix is not None:
+        for name in matrix.option_names:
+            text(name)
+        for values in (matrix.best, matrix.expected, matrix.worst):
+            digest.update(values.astype("<f8").tobytes())
+        for values in getattr(matrix, "scenarios", ()):
+            if values is not None:
+                digest.update(b"s" + struct.pack("<QQ", *values.shape) + values.astype("<f8").tobytes())
+        return digest.hexdigest()
+
+    pack = struct.Struct("<3d").pack
+    for opt in options:
+        text(opt.option.name)
+        for c in criteria:
+            out = opt.outcomes[c.name]
+            digest.update(pack(out.best, out.expected, out.worst))
+            if out.scenarios is not None:
+                digest.update(b"s" + struct.pack(f"<Q{len(out.scenarios)}d", len(out.scenarios), *out.scenarios))
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    disk_evictions: int = 0
+
+
+class CachedStrategy(Strategy):
+    """
+    Memoizes evaluate() / evaluate_detailed() of any Strategy, keyed by fingerprint();
+    entries keep the per-criterion intermediates so breakdowns survive a hit.
+
+    max_entries bounds the in-memory LRU; ttl (seconds) expires entries in both
+    tiers; directory enables an on-disk JSON tier that survives restarts, and
+    max_disk_bytes bounds it: a write that takes the tier past the limit removes
+    the least recently used files (disk hits refresh a file's modified time). Hits share immutable raw / normalized
+    tuples and get their own scores dict.
+    namespace separates entries whose configuration cache_key() does not cover.
+    The vectorized hooks are passed through to the wrapped strategy uncached.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        max_entries: int = 1024,
+        ttl: float | None = None,
+        directory: str | None = None,
+        namespace: str = "",
+        clock: Callable[[], float] = time.time,
+        max_disk_bytes: int | None = 64 * 2 ** 20,
+    ):
+        self.strategy = strategy
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[float, Evaluation]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk_bytes: int | None = None  # counted on the first write
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def evaluate(
+        self, options: List[OptionEvaluation], criteria: List[Criterion], risk_weight: float = 0.5
+    ) -> Dict[str, float]:
+        return self.evaluate_detailed(options, criteria, risk_weight).scores
+
+    def evaluate_detailed(
+        self, options: List[OptionEvaluation], criteria: List[Criterion], risk_weight: float = 0.5
+    ) -> Evaluation:
+        key = fingerprint(options, criteria, self.strategy, risk_weight, self.namespace)
+        evaluation = self._lookup(key)
+        if evaluation is None:
+            evaluation = _plain(self.strategy.evaluate_detailed(options, criteria, risk_weight=risk_weight))
+            self._store(key, evaluation)
+        # callers get their own scores dict
+        return replace(evaluation, scores=dict(evaluation.scores))
+
+    @property
+    def risk_adjusted(self) -> bool:
+        return self.strategy.risk_adjusted
+
+    def cache_key(self) -> tuple:
+        # scores are the wrapped strategy's, so its configuration is the identity
+        return super().cache_key() + (self.strategy.cache_key(), self.namespace)
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (the disk tier is left alone)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -------------------------
+    # Pass-through vectorized hooks
+    # -------------------------
+    def evaluate_matrix(self, matrix, risk_weight: float = 0.5):
+        return self.strategy.evaluate_matrix(matrix, risk_weight)
+
+    def evaluate_sweep(self, matrix, risk_weights: List[float]):
+        return self.strategy.evaluate_sweep(matrix, risk_weights)
+
+    def evaluate_samples(self, matrix, samples):
+        return self.strategy.evaluate_samples(matrix, samples)
+
+    def evaluate_padded(self, batch):
+        return self.strategy.evaluate_padded(batch)
+
+    # -------------------------
+    # Tiers
+    # -------------------------
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and self.clock() - stored_at > self.ttl
+
+    def _lookup(self, key: str) -> Evaluation | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.stats.expirations += 1
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+            self._insert(key, entry)
+        return entry[1]
+
+    def _store(self, key: str, evaluation: Evaluation) -> None:
+        entry = (self.clock(), evaluation)
+        with self._lock:
+            self._insert(key, entry)
+        self._write_disk(key, entry)
+
+    def _insert(self, key: str, entry: tuple[float, Evaluation]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read_disk(self, key: str) -> tuple[float, Evaluation] | None:
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key)) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if self._expired(data["stored_at"]):
+            with self._lock:
+                self.stats.expirations += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            return None
+        _touch(self._path(key))
+        return data["stored_at"], Evaluation(
+            option_names=tuple(data["option_names"]),
+            criterion_names=tuple(data["criterion_names"]),
+            scores=data["scores"],
+            raw=_columns(data["raw"]),
+            normalized=_columns(data["normalized"]),
+            risk_adjusted=data.get("risk_adjusted", False),
+        )
+
+    def _write_disk(self, key: str, entry: tuple[float, Evaluation]) -> None:
+        if self.directory is None:
+            return
+        # write then rename so readers never see a partial file
+        tmp = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            stored_at, evaluation = entry
+            json.dump({
+                "stored_at": stored_at,
+                "option_names": evaluation.option_names,
+                "criterion_names": evaluation.criterion_names,
+                "scores": evaluation.scores,
+                "raw": evaluation.raw,
+                "normalized": evaluation.normalized,
+                "risk_adjusted": evaluation.risk_adjusted,
+            }, f)
+            size = f.tell()
+        os.replace(tmp, self._path(key))
+        _touch(self._path(key))
+        if self.max_disk_bytes is None:
+            return
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, _, size in self._disk_files())
+            else:
+                self._disk_bytes += size
+            if self._disk_bytes > self.max_disk_bytes:
+                self._sweep_disk()
+
+    def _disk_files(self) -> list[tuple[int, str, int]]:
+        """(modified time, path, size) of every entry file, oldest first"""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime_ns, entry.path, stat.st_size))
+        return sorted(files)
+
+    def _sweep_disk(self) -> None:
+        """Remove the least recently used entry files until the tier fits max_disk_bytes"""
+        files = self._disk_files()
+        total = sum(size for _, _, size in files)
+        for _, path, size in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self.stats.disk_evictions += 1
+        self._disk_bytes = total
+
+
+def _touch(path: str) -> None:
+    """Stamp path with the current time at full resolution (filesystem clocks are coarser)"""
+    now = time.time_ns()
+    try:
+        os.utime(path, ns=(now, now))
+    except OSError:
+        pass
+
+
+def _columns(values) -> tuple[tuple[float, ...], ...] | None:
+    return None if values is None else tuple(tuple(float(v) for v in column) for column in values)
+
+
+def _plain(evaluation: Evaluation) -> Evaluation:
+    """Copy an Evaluation into plain tuples and floats, detached from any arrays"""
+    return Evaluation(
+        option_names=tuple(evaluation.option_names),
+        criterion_names=tuple(evaluation.criterion_names),
+        scores=dict(evaluation.scores),
+        raw=_columns(evaluation.raw),
+        normalized=_columns(evaluation.normalized),
+        risk_adjusted=evaluation.risk_adjusted,
+    )
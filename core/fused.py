@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from typing import Callable, List, Sequence
+
+import numpy as np
+
+from core.models import OptionEvaluation, Criterion
+from core.matrix import DecisionMatrix, normalize_columns, weighted_sum, risk_adjusted_values, regret_values
+from core.scoring import as_decision_matrix
+from core.strategies import (
+    Strategy, StrategyFactory, ExpectedValueStrategy, RiskAverseStrategy, RegretMinimizationStrategy
+)
+from core.validation import validate_options
+from core.instrumentation import stage
+
+
+@dataclass(frozen=True, eq=False)
+class StrategyComparison:
+    """
+    Scores of several strategies on one problem.
+    scores has shape (strategies, options), rows aligned with strategy_names.
+    """
+    strategy_names: tuple[str, ...]
+    option_names: tuple[str, ...]
+    scores: np.ndarray
+
+    def table(self) -> dict[str, dict[str, float]]:
+        """strategy name -> {option name: score}"""
+        return {
+            name: dict(zip(self.option_names, row))
+            for name, row in zip(self.strategy_names, self.scores.tolist())
+        }
+
+    def ranking(self, strategy: str) -> list[tuple[str, float]]:
+        """(option, score) pairs of one strategy, best first; ties keep input order"""
+        row = self.scores[self.strategy_names.index(strategy)]
+        order = np.argsort(-row, kind="stable")
+        return [(self.option_names[i], float(row[i])) for i in order.tolist()]
+
+    def rankings(self) -> dict[str, list[tuple[str, float]]]:
+        return {name: self.ranking(name) for name in self.strategy_names}
+
+
+# Raw (options x criteria) values a strategy normalizes, by kind.
+VALUES: dict[str, Callable[[DecisionMatrix, float], np.ndarray]] = {
+    "risk_adjusted": risk_adjusted_values,
+    "regret": lambda matrix, risk_weight: regret_values(matrix),
+}
+# Strategy type -> (values kind, normalization direction override).
+# Strategies normalizing the same raw values share one column pass.
+KERNELS: dict[type, tuple[str, bool | None]] = {
+    ExpectedValueStrategy: ("risk_adjusted", None),
+    RiskAverseStrategy: ("risk_adjusted", None),
+    RegretMinimizationStrategy: ("regret", False),
+}
+
+
+class _Shared:
+    """Reductions computed at most once per fused pass"""
+
+    def __init__(self, matrix: DecisionMatrix, risk_weight: float):
+        self.matrix = matrix
+        self.risk_weight = risk_weight
+        self._values: dict[str, np.ndarray] = {}
+        self._scores: dict[tuple[str, bool | None], np.ndarray] = {}
+
+    def values(self, kind: str) -> np.ndarray:
+        if kind not in self._values:
+            self._values[kind] = VALUES[kind](self.matrix, self.risk_weight)
+        return self._values[kind]
+
+    def scores(self, kind: str, maximize: bool | None) -> np.ndarray:
+        key = (kind, maximize)
+        if key not in self._scores:
+            direction = self.matrix.maximize if maximize is None else maximize
+            normalized = normalize_columns(self.values(kind), direction)
+            self._scores[key] = weighted_sum(normalized, self.matrix.weights)
+        return self._scores[key]
+
+
+def compare_strategies(
+    options: List[OptionEvaluation] | DecisionMatrix,
+    criteria: List[Criterion] | None,
+    strategies: Sequence[str] = ("expected_value", "risk_averse", "regret_minimization"),
+    risk_weight: float = 0.5,
+) -> StrategyComparison:
+    """
+    Evaluate several StrategyFactory strategies in one fused pass.
+
+    Outcomes are extracted into a DecisionMatrix once; strategies built on the
+    same raw values (expected value and risk-averse both normalize risk-adjusted
+    values) share their normalization and weighted sum. Strategies without a
+    fused kernel fall back to their own evaluate_matrix on the shared matrix.
+    Scores equal each strategy's evaluate() exactly.
+    """
+    resolved: list[Strategy] = [StrategyFactory.get_strategy(name) for name in strategies]
+    matrix = as_decision_matrix(options, criteria)
+    if matrix is None:
+        validate_options(options, criteria)
+        with stage("fused.extract", n_options=len(options), n_criteria=len(criteria)):
+            matrix = DecisionMatrix.from_evaluations(options, criteria)
+
+    shared = _Shared(matrix, risk_weight)
+    rows = []
+    for name, strategy in zip(strategies, resolved):
+        with stage("fused.strategy", strategy=name, n_options=matrix.n_options, n_criteria=matrix.n_criteria):
+            kernel = KERNELS.get(type(strategy))
+            if kernel is None:
+                rows.append(strategy.evaluate_matrix(matrix, risk_weight))
+            else:
+                rows.append(shared.scores(*kernel))
+    scores = np.array(rows, dtype=float).reshape(len(rows), matrix.n_options)
+    return StrategyComparison(tuple(strategies), matrix.option_names, scores)
@@ -0,0 +1,162 @@
+from dataclasses import dataclass, field, replace
+from typing import Iterator, List, Dict
+
+import numpy as np
+
+from core.models import OptionEvaluation, Criterion
+from core.scoring import evaluate_with_risk
+from core.strategies import Strategy
+
+
+@dataclass(frozen=True)
+class CriteriaGroup:
+    """
+    Inner node of a criteria tree, e.g. financial -> {salary, bonus}.
+    children are CriteriaGroup or Criterion leaves; every weight is local,
+    i.e. relative to its siblings under the same parent.
+    """
+    name: str
+    weight: float = 1.0
+    children: tuple["CriteriaGroup | Criterion", ...] = field(default_factory=tuple)
+
+    def validate(self) -> None:
+        names = set()
+        for node in walk(self):
+            if node.name in names:
+                raise ValueError(f"Criteria tree has two nodes named '{node.name}'")
+            names.add(node.name)
+            if isinstance(node, Criterion):
+                node.validate()
+            elif not node.children:
+                raise ValueError(f"Criteria group '{node.name}' has no children")
+            elif not 0.0 <= node.weight <= 1.0:
+                raise ValueError("Criterion weight must be between 0 and 1")
+
+
+def walk(node: "CriteriaGroup | Criterion") -> Iterator["CriteriaGroup | Criterion"]:
+    """Every node of the tree, parents before their children"""
+    yield node
+    if isinstance(node, CriteriaGroup):
+        for child in node.children:
+            yield from walk(child)
+
+
+def flatten(root: CriteriaGroup) -> list[Criterion]:
+    """
+    The leaves as a flat Criterion list whose weights are the product of the
+    weights on the path below the root (whose own weight is ignored), ready
+    for the existing strategies.
+    """
+    criteria = []
+
+    def visit(node, weight):
+        if isinstance(node, Criterion):
+            criteria.append(replace(node, weight=weight * node.weight))
+        else:
+            for child in node.children:
+                visit(child, weight * node.weight)
+
+    for child in root.children:
+        visit(child, 1.0)
+    return criteria
+
+
+class HierarchicalScorer:
+    """
+    Scores over a criteria tree with every node's aggregate cached.
+
+    Leaves hold the strategy's normalized column for that criterion
+    (strategy.evaluate_detailed on the flattened tree, or
+    calculate_scores_with_risk by default); normalized values do not depend
+    on weights, so they are computed once. Each group holds the weighted sum
+    of its children in child order and the root's aggregate is the score.
+    set_weight only recomputes the groups on the path from the node to the root.
+    """
+
+    def __init__(
+        self,
+        root: CriteriaGroup,
+        options: List[OptionEvaluation],
+        strategy: Strategy | None = None,
+        risk_weight: float = 0.5,
+    ):
+        root.validate()
+        self.root = root
+        self._children: Dict[str, list[str]] = {}
+        self._parent: Dict[str, str] = {}
+        self._weights: Dict[str, float] = {}
+        for node in walk(root):
+            self._weights[node.name] = node.weight
+            if isinstance(node, CriteriaGroup):
+                self._children[node.name] = [child.name for child in node.children]
+                for child in node.children:
+                    self._parent[child.name] = node.name
+
+        criteria = flatten(root)
+        if strategy is None:
+            evaluation = evaluate_with_risk(options, criteria, risk_weight)
+        else:
+            evaluation = strategy.evaluate_detailed(options, criteria, risk_weight=risk_weight)
+        if evaluation.normalized is None:
+            raise ValueError(f"{type(strategy).__name__} does not expose normalized values")
+        self.option_names = evaluation.option_names
+        self._values: Dict[str, np.ndarray] = {
+            c.name: np.asarray(column, dtype=float) for c, column in zip(criteria, evaluation.normalized)
+        }
+        self._build(root.name)
+
+    def scores(self) -> Dict[str, float]:
+        """Option name -> score; the root aggregate"""
+        return self.node_scores(self.root.name)
+
+    def node_scores(self, name: str) -> Dict[str, float]:
+        """Option name -> aggregated normalized score at one node (before its own weight)"""
+        return dict(zip(self.option_names, self._values[name].tolist()))
+
+    def ranking(self) -> list[tuple[str, float]]:
+        return sorted(self.scores().items(), key=lambda x: x[1], reverse=True)
+
+    def weight(self, name: str) -> float:
+        return self._weights[name]
+
+    def set_weight(self, name: str, weight: float) -> None:
+        """Change one node's local weight and refresh the aggregates above it"""
+        if name not in self._weights:
+            raise KeyError(name)
+        if not 0.0 <= weight <= 1.0:
+            raise ValueError("Criterion weight must be between 0 and 1")
+        self._weights[name] = weight
+        while name in self._parent:
+            name = self._parent[name]
+            self._aggregate(name)
+
+    def tree(self) -> CriteriaGroup:
+        """The criteria tree with the current weights"""
+        def rebuild(node):
+            if isinstance(node, Criterion):
+                return replace(node, weight=self._weights[node.name])
+            return replace(
+                node, weight=self._weights[node.name], children=tuple(rebuild(c) for c in node.children)
+            )
+
+        return rebuild(self.root)
+
+    def criteria(self) -> list[Criterion]:
+        """flatten() of the current tree"""
+        return flatten(self.tree())
+
+    # -------------------------
+    # Internals
+    # -------------------------
+    def _build(self, name: str) -> None:
+        if name in self._children:
+            for child in self._children[name]:
+                self._build(child)
+            self._aggregate(name)
+
+    def _aggregate(self, name: str) -> None:
+        # accumulate in child order, as weighted_sum does over criteria
+        total = np.zeros(len(self.option_names))
+        for child in self._children[name]:
+            total += self._values[child] * self._weights[child]
+        self._values[name] = total
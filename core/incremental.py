@@ -0,0 +1,175 @@
+import heapq
+from typing import Iterable, List, Dict
+
+from core.models import OptionEvaluation, Criterion
+from core.uncertainty import risk_adjusted_score
+
+
+class _Extremes:
+    """
+    Min and max of a multiset of (value, name) entries with lazy deletion.
+    An entry is live while values[name] still holds that value.
+    """
+
+    def __init__(self):
+        self.low: list[tuple[float, str]] = []
+        self.high: list[tuple[float, str]] = []
+
+    def push(self, value: float, name: str) -> None:
+        heapq.heappush(self.low, (value, name))
+        heapq.heappush(self.high, (-value, name))
+
+    def anchors(self, live) -> tuple[float, float] | None:
+        """(min, max) of the live entries; live(name, value) tells if an entry is current"""
+        while self.low and not live(self.low[0][1], self.low[0][0]):
+            heapq.heappop(self.low)
+        while self.high and not live(self.high[0][1], -self.high[0][0]):
+            heapq.heappop(self.high)
+        if not self.low:
+            return None
+        return self.low[0][0], -self.high[0][0]
+
+    def compact(self, entries: Iterable[tuple[float, str]]) -> None:
+        self.low = list(entries)
+        self.high = [(-value, name) for value, name in self.low]
+        heapq.heapify(self.low)
+        heapq.heapify(self.high)
+
+
+class IncrementalScorer:
+    """
+    Stateful calculate_scores_with_risk for a changing option set.
+
+    Keeps the risk-adjusted value of every option per criterion, the min/max
+    anchors in lazily pruned heaps, and each option's weighted contributions.
+    Adding, updating or removing an option costs O(m log n) while no anchor
+    moves; when one does, only that criterion's column is rescaled and each
+    score is re-summed from its contributions, so long runs do not drift.
+    Scores agree with calculate_scores_with_risk under the default min-max
+    normalization.
+    """
+
+    def __init__(
+        self,
+        criteria: List[Criterion],
+        risk_weight: float = 0.5,
+        options: Iterable[OptionEvaluation] = (),
+    ):
+        self.criteria = list(criteria)
+        self.risk_weight = risk_weight
+        self._values: Dict[str, list[float]] = {}
+        self._contributions: Dict[str, list[float]] = {}
+        self._scores: Dict[str, float] = {}
+        self._extremes = [_Extremes() for _ in self.criteria]
+        self._anchors: list[tuple[float, float] | None] = [None] * len(self.criteria)
+        for opt in options:
+            self.add(opt)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._values
+
+    def add(self, opt: OptionEvaluation) -> None:
+        name = opt.option.name
+        if name in self._values:
+            raise ValueError(f"Option {name} is already scored")
+        self._set(name, self._adjusted(opt))
+
+    def update(self, opt: OptionEvaluation) -> None:
+        name = opt.option.name
+        if name not in self._values:
+            raise KeyError(name)
+        self._set(name, self._adjusted(opt))
+
+    def remove(self, name: str) -> None:
+        if name not in self._values:
+            raise KeyError(name)
+        del self._values[name]
+        del self._contributions[name]
+        del self._scores[name]
+        self._rescale(self._refresh_anchors(range(len(self.criteria))))
+
+    def scores(self) -> Dict[str, float]:
+        """Option name -> score, in insertion order"""
+        return dict(self._scores)
+
+    def score(self, name: str) -> float:
+        return self._scores[name]
+
+    def ranking(self) -> list[tuple[str, float]]:
+        return sorted(self._scores.items(), key=lambda x: x[1], reverse=True)
+
+    # -------------------------
+    # Internals
+    # -------------------------
+    def _adjusted(self, opt: OptionEvaluation) -> list[float]:
+        missing = {c.name for c in self.criteria} - set(opt.outcomes.keys())
+        if missing:
+            raise ValueError(f"Option {opt.option.name} is missing outcomes for: {missing}")
+        return [risk_adjusted_score(opt.outcomes[c.name], self.risk_weight) for c in self.criteria]
+
+    def _set(self, name: str, values: list[float]) -> None:
+        old = self._values.get(name)
+        self._values[name] = values
+        changed = []
+        for j, value in enumerate(values):
+            if old is None or old[j] != value:
+                self._extremes[j].push(value, name)
+                changed.append(j)
+        moved = self._refresh_anchors(changed)
+        self._contributions[name] = [self._contribution(j, v) for j, v in enumerate(values)]
+        self._scores[name] = self._total(self._contributions[name])
+        self._rescale(moved, skip=name)
+
+    def _refresh_anchors(self, criteria: Iterable[int]) -> list[int]:
+        """Recompute the anchors of the given criteria; returns those that moved"""
+        moved = []
+        for j in criteria:
+            extremes = self._extremes[j]
+            anchors = extremes.anchors(
+                lambda name, value: name in self._values and self._values[name][j] == value
+            )
+            if anchors != self._anchors[j]:
+                self._anchors[j] = anchors
+                moved.append(j)
+            # drop stale entries once they outnumber live ones
+            if len(extremes.low) > 2 * len(self._values) + 16:
+                extremes.compact((v[j], name) for name, v in self._values.items())
+        return moved if self._values else []
+
+    def _contribution(self, j: int, value: float) -> float:
+        min_val, max_val = self._anchors[j]
+        criterion = self.criteria[j]
+        if max_val == min_val:
+            normalized = 1.0
+        elif criterion.maximize:
+            normalized = (value - min_val) / (max_val - min_val)
+        else:
+            normalized = (max_val - value) / (max_val - min_val)
+        return normalized * criterion.weight
+
+    def _rescale(self, moved: list[int], skip: str | None = None) -> None:
+        """
+        Recompute the contributions on the moved criteria and re-add every score
+        from its contributions; applying deltas instead would let rounding drift
+        away from a fresh evaluation over many updates.
+        """
+        if not moved:
+            return
+        for name, contributions in self._contributions.items():
+            if name == skip:
+                continue
+            values = self._values[name]
+            for j in moved:
+                contributions[j] = self._contribution(j, values[j])
+            self._scores[name] = self._total(contributions)
+
+    @staticmethod
+    def _total(contributions: list[float]) -> float:
+        # accumulate in criterion order, as calculate_scores_with_risk does
+        total = 0.0
+        for value in contributions:
+            total += value
+        return total
@@ -0,0 +1,198 @@
+import csv
+import heapq
+import json
+from typing import Iterable, Iterator, List, Sequence
+
+import numpy as np
+
+from core.models import Criterion
+from core.matrix import DecisionMatrix, weighted_sum
+from core.fused import KERNELS, VALUES
+from core.normalization import RunningStats, get_normalizer
+from core.strategies import Strategy
+
+FORMATS = ("csv", "jsonl", "parquet")
+# Options per chunk; memory is bounded by chunk_size x criteria x 3 floats.
+CHUNK_SIZE = 65_536
+
+Record = tuple[str, str, float, float, float]
+
+
+def detect_format(path: str) -> str:
+    for suffix, name in ((".csv", "csv"), (".jsonl", "jsonl"), (".parquet", "parquet"), (".pq", "parquet")):
+        if path.endswith(suffix):
+            return name
+    raise ValueError(f"Cannot tell the format of '{path}'")
+
+
+def read_chunks(
+    path: str,
+    criteria: Sequence[Criterion],
+    chunk_size: int = CHUNK_SIZE,
+    fmt: str | None = None,
+) -> Iterator[DecisionMatrix]:
+    """
+    Read options in chunks of at most chunk_size, each as a DecisionMatrix.
+
+    csv / parquet hold long-format rows (option, criterion, best, expected,
+    worst; other columns are ignored), jsonl one option per line as
+    {"name", "outcomes": {criterion: {"best", "expected", "worst"}}}.
+    The rows of one option must be consecutive. Each chunk is checked like
+    validate_options: a missing criterion raises ValueError, extra ones are
+    ignored. No OptionEvaluation objects are created.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Format '{fmt}' not found.")
+    records = {"csv": _csv_records, "jsonl": _jsonl_records, "parquet": _parquet_records}[fmt](path)
+    buffer: list[Record] = []
+    options = 0
+    last = None
+    for record in records:
+        if record[0] != last:
+            if options == chunk_size:
+                yield DecisionMatrix.from_records(buffer, criteria)
+                buffer, options = [], 0
+            options += 1
+            last = record[0]
+        buffer.append(record)
+    if buffer:
+        yield DecisionMatrix.from_records(buffer, criteria)
+
+
+def _csv_records(path: str) -> Iterator[Record]:
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        o, c, b, e, w = (header.index(name) for name in ("option", "criterion", "best", "expected", "worst"))
+        for row in reader:
+            yield row[o], row[c], float(row[b]), float(row[e]), float(row[w])
+
+
+def _jsonl_records(path: str) -> Iterator[Record]:
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            option = json.loads(line)
+            for criterion, v in option["outcomes"].items():
+                yield option["name"], criterion, float(v["best"]), float(v["expected"]), float(v["worst"])
+
+
+def _parquet_records(path: str, batch_size: int = CHUNK_SIZE) -> Iterator[Record]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError("Parquet input needs pyarrow (pip install pyarrow)") from error
+    columns = ["option", "criterion", "best", "expected", "worst"]
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=columns):
+        data = batch.to_pydict()
+        yield from zip(*(data[name] for name in columns))
+
+
+# -------------------------
+# Two-pass chunked scoring
+# -------------------------
+def _kernel(strategy: Strategy) -> tuple[str, bool | None]:
+    kernel = KERNELS.get(type(strategy))
+    if kernel is None:
+        raise ValueError(f"{type(strategy).__name__} cannot be scored in chunks")
+    return kernel
+
+
+def chunk_stats(matrix: DecisionMatrix, strategy: Strategy, risk_weight: float = 0.5) -> list[RunningStats]:
+    """
+    Pass one for one chunk: per-criterion RunningStats of what strategy normalizes
+    (the worst values for regret, whose anchors derive from them).
+    """
+    kind, _ = _kernel(strategy)
+    values = matrix.worst if kind == "regret" else VALUES[kind](matrix, risk_weight)
+    return [RunningStats.of(values[:, j]) for j in range(matrix.n_criteria)]
+
+
+def merge_stats(parts: Iterable[List[RunningStats]]) -> list[RunningStats]:
+    """Reduce per-chunk (or per-shard) column stats to global ones"""
+    merged: list[RunningStats] | None = None
+    for stats in parts:
+        if merged is None:
+            merged = [RunningStats().merge(s) for s in stats]
+        else:
+            for total, s in zip(merged, stats):
+                total.merge(s)
+    if merged is None:
+        raise ValueError("No options to score")
+    return merged
+
+
+def score_chunk(
+    matrix: DecisionMatrix, strategy: Strategy, stats: List[RunningStats], risk_weight: float = 0.5
+) -> np.ndarray:
+    """
+    Pass two for one chunk: scores against global stats from merge_stats, with
+    the active (streaming) normalizer. With min-max they equal the strategy's
+    scores on the whole option set exactly.
+    """
+    normalizer = get_normalizer()
+    if not normalizer.streaming:
+        raise ValueError(f"{type(normalizer).__name__} needs every option at once and cannot score chunks")
+    kind, maximize = _kernel(strategy)
+    if kind == "regret":
+        best_worst = np.array([s.max for s in stats])
+        values = np.maximum(0.0, best_worst - matrix.worst)
+        # regret = best_worst - worst mirrors the worst column: same spread, and
+        # min' = max - max = 0, max' = max - min
+        stats = [RunningStats(s.count, s.max - s.mean, s.m2, 0.0, s.max - s.min) for s in stats]
+    else:
+        values = VALUES[kind](matrix, risk_weight)
+    normalized = normalizer.transform_columns(values, stats, matrix.maximize if maximize is None else maximize)
+    return weighted_sum(normalized, matrix.weights)
+
+
+def stream_scores(
+    path: str,
+    criteria: Sequence[Criterion],
+    strategy: Strategy,
+    risk_weight: float = 0.5,
+    chunk_size: int = CHUNK_SIZE,
+    fmt: str | None = None,
+) -> Iterator[tuple[tuple[str, ...], np.ndarray]]:
+    """
+    Score a file too large for memory: pass one merges the column stats of
+    every chunk, pass two re-reads the file and yields (option names, scores)
+    per chunk. Peak memory follows chunk_size, not the file size.
+    """
+    stats = merge_stats(
+        chunk_stats(chunk, strategy, risk_weight) for chunk in read_chunks(path, criteria, chunk_size, fmt)
+    )
+    for chunk in read_chunks(path, criteria, chunk_size, fmt):
+        yield chunk.option_names, score_chunk(chunk, strategy, stats, risk_weight)
+
+
+def stream_top_k(
+    path: str,
+    criteria: Sequence[Criterion],
+    strategy: Strategy,
+    k: int,
+    risk_weight: float = 0.5,
+    chunk_size: int = CHUNK_SIZE,
+    fmt: str | None = None,
+) -> list[tuple[str, float]]:
+    """The k best (option, score) pairs of stream_scores, ties in file order"""
+    return top_k_merge(stream_scores(path, criteria, strategy, risk_weight, chunk_size, fmt), k)
+
+
+def top_k_merge(chunks: Iterable[tuple[Sequence[str], np.ndarray]], k: int) -> list[tuple[str, float]]:
+    """
+    Global top k of (names, scores) chunks given in input order. Each chunk
+    only contributes its own top k, visited in input order so ties resolve
+    like a stable descending sort of everything.
+    """
+    def candidates():
+        for names, scores in chunks:
+            keep = np.sort(np.argsort(-scores, kind="stable")[:k])
+            for i, score in zip(keep.tolist(), scores[keep].tolist()):
+                yield names[i], score
+
+    return heapq.nlargest(k, candidates(), key=lambda item: item[1])
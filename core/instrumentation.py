@@ -0,0 +1,178 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+
+# Upper bounds (seconds) of the histogram buckets, from 1 µs to 10 s.
+BUCKETS = tuple(m * 10.0 ** e for e in range(-6, 1) for m in (1, 2.5, 5)) + (10.0,)
+
+# Tags that become labels; sizes are reported as power-of-ten classes so the number of
+# series stays bounded whatever problems come through.
+SIZE_TAGS = ("n_options", "n_criteria")
+LABEL_TAGS = SIZE_TAGS + ("strategy",)
+# Series kept per HistogramSink; later label combinations fold into one overflow series.
+MAX_SERIES = 1000
+OVERFLOW = (("overflow", "true"),)
+
+
+def size_class(n: int) -> str:
+    """Power-of-ten class of a size, e.g. 0 -> '0', 7 -> '1-9', 250 -> '100-999'"""
+    if n <= 0:
+        return "0"
+    low = 10 ** (len(str(int(n))) - 1)
+    return f"{low}-{low * 10 - 1}"
+
+
+class Sink(ABC):
+    """Receives one measurement per timed stage"""
+    enabled = True
+
+    @abstractmethod
+    def record(self, stage: str, seconds: float, tags: dict) -> None:
+        ...
+
+
+class NullSink(Sink):
+    """Default sink: instrumentation is off and stage() costs a single check"""
+    enabled = False
+
+    def record(self, stage: str, seconds: float, tags: dict) -> None:
+        pass
+
+
+@dataclass
+class Histogram:
+    count: int = 0
+    total: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(BUCKETS))
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        i = bisect_left(BUCKETS, seconds)
+        if i < len(BUCKETS):
+            self.buckets[i] += 1
+
+
+class HistogramSink(Sink):
+    """In-memory latency histograms keyed by stage name and tags"""
+
+    def __init__(self, max_series: int = MAX_SERIES):
+        self.histograms: dict[tuple[str, tuple], Histogram] = {}
+        self.max_series = max_series
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float, tags: dict) -> None:
+        key = (stage, tuple(sorted(tags.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                if len(self.histograms) >= self.max_series:
+                    key = (stage, OVERFLOW)
+                    histogram = self.histograms.get(key)
+                if histogram is None:
+                    histogram = self.histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def totals(self) -> dict[str, tuple[int, float]]:
+        """Stage name -> (count, total seconds), summed over tags"""
+        result: dict[str, tuple[int, float]] = {}
+        with self._lock:
+            for (stage, _), h in self.histograms.items():
+                count, total = result.get(stage, (0, 0.0))
+                result[stage] = (count + h.count, total + h.total)
+        return result
+
+
+class PrometheusSink(HistogramSink):
+    """HistogramSink that renders its contents in the Prometheus text format"""
+
+    def __init__(self, metric: str = "decision_stage_seconds"):
+        super().__init__()
+        self.metric = metric
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.metric} Time spent per decision pipeline stage.",
+            f"# TYPE {self.metric} histogram",
+        ]
+        with self._lock:
+            for (stage, tags), h in sorted(self.histograms.items()):
+                labels = [("stage", stage)] + list(tags)
+                cumulative = 0
+                for bound, n in zip(BUCKETS, h.buckets):
+                    cumulative += n
+                    lines.append(f"{self.metric}_bucket{_labels(labels + [('le', f'{bound:g}')])} {cumulative}")
+                lines.append(f"{self.metric}_bucket{_labels(labels + [('le', '+Inf')])} {h.count}")
+                lines.append(f"{self.metric}_sum{_labels(labels)} {h.total!r}")
+                lines.append(f"{self.metric}_count{_labels(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(pairs) -> str:
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# -------------------------
+# Global sink & timers
+# -------------------------
+_sink: Sink = NullSink()
+_NULL_STAGE = nullcontext()
+
+
+def set_sink(sink: Sink | None) -> Sink:
+    """Install sink (None restores the no-op default) and return the previous one"""
+    global _sink
+    previous, _sink = _sink, sink if sink is not None else NullSink()
+    return previous
+
+
+def get_sink() -> Sink:
+    return _sink
+
+
+@contextmanager
+def instrumented(sink: Sink):
+    """Use sink for the duration of a with block"""
+    previous = set_sink(sink)
+    try:
+        yield sink
+    finally:
+        set_sink(previous)
+
+
+class _Stage:
+    __slots__ = ("sink", "name", "tags", "start")
+
+    def __init__(self, sink: Sink, name: str, tags: dict):
+        self.sink, self.name, self.tags = sink, name, tags
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.sink.record(self.name, time.perf_counter() - self.start, self.tags)
+        return False
+
+
+def stage(name: str, **tags):
+    """
+    Context manager timing one pipeline stage into the current sink.
+    Only LABEL_TAGS become histogram labels, with sizes bucketed by size_class;
+    other tags are dropped.
+    """
+    sink = _sink
+    if not sink.enabled:
+        return _NULL_STAGE
+    labels = {}
+    for key in LABEL_TAGS:
+        if key in tags:
+            labels[key] = size_class(tags[key]) if key in SIZE_TAGS else tags[key]
+    return _Stage(sink, name, labels)
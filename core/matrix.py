@@ -0,0 +1,294 @@
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.normalization import get_normalizer
+
+
+@dataclass(frozen=True, eq=False)
+class DecisionMatrix:
+    """
+    Columnar, NumPy-backed representation of a decision problem.
+
+    best / expected / worst are float arrays of shape (options, criteria);
+    weights and maximize are per-criterion vectors.
+    Iterating a matrix yields OptionEvaluation objects, so it can be passed
+    to any Strategy; the built-in strategies detect it and use vectorized paths.
+    """
+    option_names: tuple[str, ...]
+    criterion_names: tuple[str, ...]
+    best: np.ndarray
+    expected: np.ndarray
+    worst: np.ndarray
+    weights: np.ndarray
+    maximize: np.ndarray
+
+    @classmethod
+    def from_evaluations(
+        cls, options: Sequence[OptionEvaluation], criteria: Sequence[Criterion], dtype=float
+    ) -> "DecisionMatrix":
+        """
+        Build a matrix from the existing OptionEvaluation / Criterion lists,
+        with best / expected / worst stored as dtype (np.float32 fills them
+        without a float64 intermediate). Outcomes carrying scenarios give a
+        core.scenarios.ScenarioMatrix, so the scenario vectors are never dropped.
+        """
+        names = [c.name for c in criteria]
+        rows = [[opt.outcomes[name] for name in names] for opt in options]
+        if cls is DecisionMatrix and any(o.scenarios is not None for row in rows for o in row):
+            from core.scenarios import ScenarioMatrix
+            return ScenarioMatrix.from_evaluations(options, criteria, dtype)
+        shape = (len(options), len(names))
+        return cls(
+            option_names=tuple(opt.option.name for opt in options),
+            criterion_names=tuple(names),
+            best=np.array([[o.best for o in row] for row in rows], dtype=dtype).reshape(shape),
+            expected=np.array([[o.expected for o in row] for row in rows], dtype=dtype).reshape(shape),
+            worst=np.array([[o.worst for o in row] for row in rows], dtype=dtype).reshape(shape),
+            weights=np.array([c.weight for c in criteria], dtype=float),
+            maximize=np.array([c.maximize for c in criteria], dtype=bool),
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        option_names: Sequence[str],
+        criteria: Sequence[Criterion],
+        best,
+        expected,
+        worst,
+    ) -> "DecisionMatrix":
+        """
+        Build a matrix straight from (options x criteria) array-likes,
+        without creating any OptionEvaluation objects.
+        """
+        shape = (len(option_names), len(criteria))
+        arrays = [np.asarray(a, dtype=float) for a in (best, expected, worst)]
+        if any(a.shape != shape for a in arrays):
+            raise ValueError(f"best / expected / worst must have shape {shape}")
+        return cls(
+            option_names=tuple(option_names),
+            criterion_names=tuple(c.name for c in criteria),
+            best=arrays[0],
+            expected=arrays[1],
+            worst=arrays[2],
+            weights=np.array([c.weight for c in criteria], dtype=float),
+            maximize=np.array([c.maximize for c in criteria], dtype=bool),
+        )
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[tuple[str, str, float, float, float]], criteria: Sequence[Criterion]
+    ) -> "DecisionMatrix":
+        """
+        Build a matrix from long-format (option, criterion, best, expected, worst) rows.
+        Options keep first-seen order; every option needs a row per criterion.
+        """
+        columns = {c.name: j for j, c in enumerate(criteria)}
+        rows: dict[str, int] = {}
+        option_idx, criterion_idx, values = [], [], []
+        for option, criterion, b, e, w in records:
+            if criterion not in columns:
+                continue
+            option_idx.append(rows.setdefault(option, len(rows)))
+            criterion_idx.append(columns[criterion])
+            values.append((b, e, w))
+        shape = (len(rows), len(columns))
+        filled = np.zeros(shape, dtype=bool)
+        filled[option_idx, criterion_idx] = True
+        if not filled.all():
+            i, j = np.argwhere(~filled)[0].tolist()
+            raise ValueError(f"Option {list(rows)[i]} is missing outcomes for: {{'{criteria[j].name}'}}")
+        data = np.zeros((3,) + shape)
+        data[:, option_idx, criterion_idx] = np.array(values, dtype=float).reshape(-1, 3).T
+        return cls.from_arrays(list(rows), criteria, data[0], data[1], data[2])
+
+    def validate(self) -> None:
+        """
+        Outcome.validate and Criterion.validate over the whole matrix in one pass.
+        Raises ValueError naming the first offender and the number of bad entries.
+        """
+        bad = ~((self.best >= self.expected) & (self.expected >= self.worst))
+        if bad.any():
+            i, j = np.argwhere(bad)[0].tolist()
+            raise ValueError(
+                "Outcome values must satisfy: best >= expected >= worst "
+                f"({int(bad.sum())} violations, first: option {self.option_names[i]}, "
+                f"criterion {self.criterion_names[j]})"
+            )
+        bad_weights = ~((self.weights >= 0.0) & (self.weights <= 1.0))
+        if bad_weights.any():
+            names = [self.criterion_names[j] for j in np.flatnonzero(bad_weights).tolist()]
+            raise ValueError(f"Criterion weight must be between 0 and 1: {names}")
+
+    @property
+    def n_options(self) -> int:
+        return len(self.option_names)
+
+    @property
+    def n_criteria(self) -> int:
+        return len(self.criterion_names)
+
+    @property
+    def criteria(self) -> list[Criterion]:
+        return [
+            Criterion(name, float(w), bool(m))
+            for name, w, m in zip(self.criterion_names, self.weights, self.maximize)
+        ]
+
+    def with_criteria(self, criteria: Sequence[Criterion]) -> "DecisionMatrix":
+        """
+        Return a matrix restricted to, and weighted by, the given criteria.
+        Returns self when the criteria already match.
+        """
+        names = tuple(c.name for c in criteria)
+        weights = np.array([c.weight for c in criteria], dtype=float)
+        maximize = np.array([c.maximize for c in criteria], dtype=bool)
+        if (
+            names == self.criterion_names
+            and np.array_equal(weights, self.weights)
+            and np.array_equal(maximize, self.maximize)
+        ):
+            return self
+        index = {name: j for j, name in enumerate(self.criterion_names)}
+        missing = [name for name in names if name not in index]
+        if missing:
+            raise ValueError(f"DecisionMatrix has no outcomes for: {set(missing)}")
+        cols = [index[name] for name in names]
+        return DecisionMatrix(
+            option_names=self.option_names,
+            criterion_names=names,
+            best=self.best[:, cols],
+            expected=self.expected[:, cols],
+            worst=self.worst[:, cols],
+            weights=weights,
+            maximize=maximize,
+        )
+
+    def rows(self, index: slice | np.ndarray) -> "DecisionMatrix":
+        """Matrix of the options selected by a slice or an index array"""
+        names = self.option_names[index] if isinstance(index, slice) else tuple(
+            self.option_names[i] for i in np.asarray(index).tolist()
+        )
+        return DecisionMatrix(
+            option_names=names,
+            criterion_names=self.criterion_names,
+            best=self.best[index],
+            expected=self.expected[index],
+            worst=self.worst[index],
+            weights=self.weights,
+            maximize=self.maximize,
+        )
+
+    def astype(self, dtype) -> "DecisionMatrix":
+        """
+        Matrix with best / expected / worst stored as dtype, e.g. np.float32
+        for half the memory; returns self when they already are.
+        """
+        if all(a.dtype == dtype for a in (self.best, self.expected, self.worst)):
+            return self
+        return DecisionMatrix(
+            option_names=self.option_names,
+            criterion_names=self.criterion_names,
+            best=self.best.astype(dtype),
+            expected=self.expected.astype(dtype),
+            worst=self.worst.astype(dtype),
+            weights=self.weights,
+            maximize=self.maximize,
+        )
+
+    def scores_dict(self, scores: np.ndarray) -> dict[str, float]:
+        """Map a per-option score array back to the Option name -> score shape"""
+        return dict(zip(self.option_names, scores.tolist()))
+
+    def __len__(self) -> int:
+        return self.n_options
+
+    def __getitem__(self, i: int) -> OptionEvaluation:
+        return OptionEvaluation(
+            option=Option(self.option_names[i]),
+            outcomes={
+                name: Outcome(float(b), float(e), float(w))
+                for name, b, e, w in zip(
+                    self.criterion_names, self.best[i], self.expected[i], self.worst[i]
+                )
+            },
+        )
+
+    def __iter__(self) -> Iterator[OptionEvaluation]:
+        return (self[i] for i in range(self.n_options))
+
+    def to_evaluations(self) -> list[OptionEvaluation]:
+        return list(self)
+
+
+# -------------------------
+# Vectorized kernels
+# -------------------------
+def normalize_columns(
+    values: np.ndarray, maximize: np.ndarray | bool = True, axis: int = 0
+) -> np.ndarray:
+    """
+    Normalize along axis (options run along axis 0 by default) with the
+    active normalizer; min-max to 0-1 matches core.normalization.normalize,
+    including 1.0 for constant slices.
+    """
+    return get_normalizer().columns(values, maximize, axis)
+
+
+def weighted_sum(normalized: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Accumulate weighted criterion columns in criterion order,
+    so results are bit-identical to the per-option Python loops.
+    Scores keep the dtype of normalized (float32 in reduced-precision mode).
+    """
+    scores = np.zeros(normalized.shape[:-1], dtype=normalized.dtype)
+    for j, weight in enumerate(weights.tolist()):
+        scores += normalized[..., j] * weight
+    return scores
+
+
+def matrix_evaluation(
+    matrix: DecisionMatrix, values: np.ndarray, maximize: np.ndarray | bool | None = None
+) -> "Evaluation":
+    """
+    Normalize and weight (options x criteria) raw values, keeping both as
+    criterion-major views for core.scoring.Evaluation.
+    """
+    from core.scoring import Evaluation
+    normalized = normalize_columns(values, matrix.maximize if maximize is None else maximize)
+    return Evaluation(
+        option_names=matrix.option_names,
+        criterion_names=matrix.criterion_names,
+        scores=matrix.scores_dict(weighted_sum(normalized, matrix.weights)),
+        raw=values.T,
+        normalized=normalized.T,
+    )
+
+
+def expected_scores(matrix: DecisionMatrix) -> np.ndarray:
+    """Vectorized core.scoring.calculate_scores"""
+    return weighted_sum(normalize_columns(matrix.expected, matrix.maximize), matrix.weights)
+
+
+def risk_adjusted_values(matrix: DecisionMatrix, risk_weight: float = 0.5) -> np.ndarray:
+    """Vectorized core.uncertainty.risk_adjusted_score over every outcome"""
+    return matrix.expected - risk_weight * (matrix.best - matrix.worst)
+
+
+def risk_adjusted_scores(matrix: DecisionMatrix, risk_weight: float = 0.5) -> np.ndarray:
+    """Vectorized core.scoring.calculate_scores_with_risk"""
+    values = risk_adjusted_values(matrix, risk_weight)
+    return weighted_sum(normalize_columns(values, matrix.maximize), matrix.weights)
+
+
+def regret_values(matrix: DecisionMatrix) -> np.ndarray:
+    """Per-criterion regret of each option's worst case against the best worst case"""
+    return np.maximum(0.0, matrix.worst.max(axis=0) - matrix.worst)
+
+
+def regret_scores(matrix: DecisionMatrix) -> np.ndarray:
+    """Vectorized RegretMinimizationStrategy"""
+    return weighted_sum(normalize_columns(regret_values(matrix), False), matrix.weights)
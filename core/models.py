@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Option:
     """
     Represents a decision option.
@@ -9,24 +9,50 @@ class Option:
     name: str
     description: str | None = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Outcome:
     """
     Represents uncertainty in outcomes.
     Values must be comparable across options.
+    scenarios optionally holds one value per forecast scenario (or quantile);
+    see core.scenarios.
     """
     best: float
     expected: float
     worst: float
+    scenarios: tuple[float, ...] | None = None
+
+    @classmethod
+    def from_scenarios(cls, values, probabilities=None) -> "Outcome":
+        """
+        Outcome spanning the given scenario values: best and worst are their
+        extremes, expected their mean (probability-weighted when given).
+        """
+        values = tuple(float(v) for v in values)
+        if not values:
+            raise ValueError("An outcome needs at least one scenario")
+        if probabilities is None:
+            expected = sum(values) / len(values)
+        else:
+            if len(probabilities) != len(values):
+                raise ValueError("probabilities must have one entry per scenario")
+            expected = sum(p * v for p, v in zip(probabilities, values))
+        # the mean can round just outside the extremes
+        expected = min(max(expected, min(values)), max(values))
+        return cls(max(values), expected, min(values), values)
 
     def validate(self) -> None:
         if not (self.best >= self.expected >= self.worst):
             raise ValueError(
                 "Outcome values must satisfy: best >= expected >= worst"
             )
+        if self.scenarios is not None and not (
+            self.scenarios and self.worst <= min(self.scenarios) and max(self.scenarios) <= self.best
+        ):
+            raise ValueError("Outcome scenarios must lie between worst and best")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Criterion:
     """
     Represents a decision criterion.
@@ -41,7 +67,7 @@ class Criterion:
             raise ValueError("Criterion weight must be between 0 and 1")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OptionEvaluation:
     """
     Binds an Option to its outcomes per criterion.
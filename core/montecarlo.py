@@ -0,0 +1,220 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+
+from core.models import OptionEvaluation, Criterion
+from core.matrix import DecisionMatrix, normalize_columns, weighted_sum
+from core.normalization import get_normalizer, using_normalizer
+from core.scoring import as_decision_matrix
+from core.strategies import Strategy
+
+DISTRIBUTIONS = ("triangular", "pert")
+
+# Scores are weighted sums of normalized values, so they lie within the
+# normalizer's bounds times sum(weights); a fixed-bin histogram over that
+# range gives mergeable, order-free quantiles.
+HISTOGRAM_BINS = 4096
+
+
+@dataclass(frozen=True, eq=False)
+class MonteCarloResult:
+    """
+    Rank statistics of a Monte Carlo run.
+    first / top_k hold per-option probabilities aligned with option_names;
+    counts is the (options x bins) score histogram over edges.
+    """
+    option_names: tuple[str, ...]
+    n_samples: int
+    k: int
+    first: np.ndarray
+    top_k: np.ndarray
+    mean: np.ndarray
+    edges: np.ndarray
+    counts: np.ndarray
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """
+        Score quantiles as a (len(qs) x options) array, interpolated linearly
+        inside histogram bins (resolution is one bin width).
+        """
+        cumulative = np.cumsum(self.counts, axis=1)
+        targets = np.asarray(qs, dtype=float) * self.n_samples
+        result = np.empty((len(targets), len(self.option_names)))
+        widths = np.diff(self.edges)
+        for i in range(len(self.option_names)):
+            row = cumulative[i]
+            bins = np.minimum(np.searchsorted(row, targets, side="left"), len(row) - 1)
+            below = np.where(bins > 0, row[bins - 1], 0)
+            inside = np.maximum(self.counts[i, bins], 1)
+            fraction = np.clip((targets - below) / inside, 0.0, 1.0)
+            result[:, i] = self.edges[bins] + fraction * widths[bins]
+        return result
+
+    def first_dict(self) -> dict[str, float]:
+        return dict(zip(self.option_names, self.first.tolist()))
+
+    def top_k_dict(self) -> dict[str, float]:
+        return dict(zip(self.option_names, self.top_k.tolist()))
+
+
+def monte_carlo(
+    options: List[OptionEvaluation],
+    criteria: List[Criterion],
+    strategy: Strategy,
+    n_samples: int = 10_000,
+    k: int = 3,
+    distribution: str = "triangular",
+    seed: int = 0,
+    chunk_size: int = 1_000,
+    workers: int | None = None,
+) -> MonteCarloResult:
+    """
+    Sample every Outcome as a distribution over [worst, best] with mode expected,
+    score each sample with strategy and aggregate rank probabilities.
+
+    Samples are drawn in chunks of chunk_size, each from its own child of
+    SeedSequence(seed), so the result is identical for any worker count.
+    A chunk returns its histogram as sparse (option, bin) counts, never more
+    entries than its own (chunk_size x options) scores, so each worker and each
+    buffered result stays within one chunk's memory; the merged dense
+    (options x bins) histogram is the only full-size array. The score histogram
+    spans the active normalizer's bounds(); normalizers without bounds are rejected.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Distribution '{distribution}' not found.")
+    if n_samples < 1 or chunk_size < 1:
+        raise ValueError("n_samples and chunk_size must be positive")
+    matrix = as_decision_matrix(options, criteria)
+    if matrix is None:
+        matrix = DecisionMatrix.from_evaluations(options, criteria)
+    k = min(k, matrix.n_options)
+
+    sizes = [chunk_size] * (n_samples // chunk_size)
+    if n_samples % chunk_size:
+        sizes.append(n_samples % chunk_size)
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    normalizer = get_normalizer()
+    edges = histogram_edges(normalizer, matrix.n_options, matrix.weights)
+    setup = (matrix, strategy, distribution, k, edges, normalizer)
+
+    if workers is None or workers <= 1:
+        _init_worker(*setup)
+        chunks = map(_run_chunk, streams, sizes)
+        return _merge(matrix, n_samples, k, edges, chunks)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=setup) as pool:
+        # map yields in submission order, keeping the float sums reproducible
+        return _merge(matrix, n_samples, k, edges, pool.map(_run_chunk, streams, sizes))
+
+
+def histogram_edges(normalizer, n_options: int, weights: np.ndarray) -> np.ndarray:
+    """Bin edges covering every score a weighted sum of normalizer's values can take"""
+    bounds = normalizer.bounds(n_options)
+    if bounds is None:
+        raise ValueError(f"{type(normalizer).__name__} has no bounds(); score quantiles need a bounded range")
+    total = float(np.abs(weights).sum())
+    low, high = bounds[0] * total, bounds[1] * total
+    return np.linspace(low, max(high, low + 1e-12), HISTOGRAM_BINS + 1)
+
+
+def _merge(matrix, n_samples, k, edges, chunks) -> MonteCarloResult:
+    n = matrix.n_options
+    first = np.zeros(n, dtype=np.int64)
+    top_k = np.zeros(n, dtype=np.int64)
+    total = np.zeros(n)
+    counts = np.zeros((n, len(edges) - 1), dtype=np.int64)
+    flat = counts.reshape(-1)
+    for chunk_first, chunk_top, chunk_total, (cells, cell_counts) in chunks:
+        first += chunk_first
+        top_k += chunk_top
+        total += chunk_total
+        flat[cells] += cell_counts
+    return MonteCarloResult(
+        option_names=matrix.option_names,
+        n_samples=n_samples,
+        k=k,
+        first=first / n_samples,
+        top_k=top_k / n_samples,
+        mean=total / n_samples,
+        edges=edges,
+        counts=counts,
+    )
+
+
+# -------------------------
+# Worker side
+# -------------------------
+_state: tuple = ()
+
+
+def _init_worker(matrix, strategy, distribution, k, edges, normalizer) -> None:
+    global _state
+    _state = (matrix, strategy, distribution, k, edges, normalizer)
+
+
+def _run_chunk(stream: np.random.SeedSequence, size: int):
+    matrix, strategy, distribution, k, edges, normalizer = _state
+    rng = np.random.default_rng(stream)
+    samples = sample_outcomes(matrix, size, rng, distribution)
+    with using_normalizer(normalizer):
+        scores = strategy.evaluate_samples(matrix, samples)
+    n = matrix.n_options
+
+    order = np.argsort(-scores, axis=1, kind="stable")
+    first = np.bincount(order[:, 0], minlength=n)
+    top_k = np.bincount(order[:, :k].ravel(), minlength=n)
+    # scores lie within the edges; the clip only keeps the top edge (and rounding) in the end bins
+    bins = np.clip(np.searchsorted(edges, scores, side="right") - 1, 0, len(edges) - 2)
+    # sparse histogram: flat option * n_bins + bin cells and how often each was hit
+    cells, cell_counts = np.unique(np.arange(n) * (len(edges) - 1) + bins, return_counts=True)
+    return first, top_k, scores.sum(axis=0), (cells, cell_counts)
+
+
+# -------------------------
+# Sampling & scoring kernels
+# -------------------------
+def sample_outcomes(
+    matrix: DecisionMatrix, size: int, rng: np.random.Generator, distribution: str = "triangular"
+) -> np.ndarray:
+    """
+    Draw (size x options x criteria) realized values. Each outcome spans
+    [min(best, worst), max(best, worst)] with its mode at expected, so
+    minimize criteria whose best is below worst are handled too.
+    """
+    low = np.minimum(matrix.best, matrix.worst)
+    high = np.maximum(matrix.best, matrix.worst)
+    mode = np.clip(matrix.expected, low, high)
+    span = high - low
+    degenerate = span == 0
+    span = np.where(degenerate, 1.0, span)
+    shape = (size,) + matrix.expected.shape
+
+    if distribution == "pert":
+        alpha = 1 + 4 * (mode - low) / span
+        beta = 1 + 4 * (high - mode) / span
+        unit = rng.beta(np.broadcast_to(alpha, shape), np.broadcast_to(beta, shape))
+    else:
+        # inverse CDF of the triangular distribution
+        u = rng.random(shape)
+        peak = (mode - low) / span
+        unit = np.where(
+            u < peak,
+            np.sqrt(u * peak),
+            1 - np.sqrt((1 - u) * (1 - peak)),
+        )
+    return np.where(degenerate, mode, low + unit * span)
+
+
+def sample_scores(matrix: DecisionMatrix, samples: np.ndarray) -> np.ndarray:
+    """
+    (samples x options) scores of calculate_scores_with_risk on realized values;
+    a realized outcome has no spread, so every risk weight gives the same score.
+    """
+    return weighted_sum(normalize_columns(samples, matrix.maximize, axis=1), matrix.weights)
+
+
+def sample_regret_scores(matrix: DecisionMatrix, samples: np.ndarray) -> np.ndarray:
+    """(samples x options) RegretMinimizationStrategy scores on realized values"""
+    regrets = np.maximum(0.0, samples.max(axis=1, keepdims=True) - samples)
+    return weighted_sum(normalize_columns(regrets, False, axis=1), matrix.weights)
@@ -1,4 +1,11 @@
-from typing import List
+import heapq
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterable, List
 
 def normalize(values: List[float], maximize: bool = True) -> List[float]:
     """Normalize a list of numbers to 0-1 scale"""
@@ -9,3 +16,351 @@ def normalize(values: List[float], maximize: bool = True) -> List[float]:
         return [(v - min_val) / (max_val - min_val) for v in values]
     else:
         return [(max_val - v) / (max_val - min_val) for v in values]
+
+
+# -------------------------
+# Running statistics
+# -------------------------
+@dataclass
+class RunningStats:
+    """
+    Count, mean, sum of squared deviations, min and max of a stream, in one pass.
+    Partial stats of separate chunks merge exactly (Chan et al.), so a column
+    can be summarized out of core, in any chunking, or in parallel.
+    """
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def update(self, values: Iterable[float]) -> "RunningStats":
+        for v in values:
+            self.count += 1
+            delta = v - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (v - self.mean)
+            if v < self.min:
+                self.min = v
+            if v > self.max:
+                self.max = v
+        return self
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.min, self.max = (
+                other.count, other.mean, other.m2, other.min, other.max
+            )
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @classmethod
+    def of(cls, values) -> "RunningStats":
+        """Stats of a NumPy array in one vectorized pass"""
+        if len(values) == 0:
+            return cls()
+        mean = float(values.mean())
+        return cls(
+            count=len(values),
+            mean=mean,
+            m2=float(((values - mean) ** 2).sum()),
+            min=float(values.min()),
+            max=float(values.max()),
+        )
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation"""
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+
+# -------------------------
+# Normalizers
+# -------------------------
+class Normalizer(ABC):
+    """
+    Maps one criterion column to comparable scores, higher is better.
+    __call__ handles a Python list, columns() NumPy arrays along an axis
+    with a per-slice maximize. Streaming normalizers also mix in
+    StreamingMixin, so columns larger than memory are summarized chunk by chunk.
+    """
+    streaming = False
+
+    @abstractmethod
+    def __call__(self, values: List[float], maximize: bool = True) -> List[float]:
+        pass
+
+    @abstractmethod
+    def columns(self, values, maximize=True, axis: int = 0):
+        pass
+
+    def bounds(self, n: int) -> tuple[float, float] | None:
+        """
+        Range every normalized value of an n-option column lies in, or None
+        when it is unknown. Scores are then bounded by the weights' sum times it.
+        """
+        return None
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{k}={v!r}" for k, v in vars(self).items())
+        return f"{type(self).__name__}({args})"
+
+    def key(self) -> str:
+        """Stable description of the configuration, for cache keys"""
+        return f"{type(self).__module__}.{type(self).__qualname__}{sorted(vars(self).items())}"
+
+
+class StreamingMixin(ABC):
+    """
+    fit() / transform() for a Normalizer whose result only depends on a
+    column's RunningStats: the stats of every chunk are merged first, then
+    each chunk is transformed against them.
+    """
+    streaming = True
+
+    def fit(self, chunks: Iterable[Iterable[float]]) -> RunningStats:
+        """Merge the running stats of every chunk of one column"""
+        stats = RunningStats()
+        for chunk in chunks:
+            stats.merge(RunningStats().update(chunk))
+        return stats
+
+    @abstractmethod
+    def transform(self, values: List[float], stats: RunningStats, maximize: bool = True) -> List[float]:
+        pass
+
+    @abstractmethod
+    def transform_columns(self, values, stats: List[RunningStats], maximize=True):
+        """transform() for an (options x criteria) array, one RunningStats per column"""
+        pass
+
+
+class MinMaxNormalizer(StreamingMixin, Normalizer):
+    """
+    Min-max to 0-1, as normalize(); a constant column scores constant for
+    every option (1.0 by default, as normalize() does; 0.0 or 0.5 keep a
+    criterion that does not discriminate from inflating scores).
+    """
+
+    def __init__(self, constant: float = 1.0):
+        self.constant = constant
+
+    def bounds(self, n: int) -> tuple[float, float]:
+        return min(0.0, self.constant), max(1.0, self.constant)
+
+    def __call__(self, values: List[float], maximize: bool = True) -> List[float]:
+        if self.constant == 1.0:
+            return normalize(values, maximize)
+        return self.transform(values, RunningStats(min=min(values), max=max(values)), maximize)
+
+    def transform(self, values: List[float], stats: RunningStats, maximize: bool = True) -> List[float]:
+        min_val, max_val = stats.min, stats.max
+        if max_val == min_val:
+            return [self.constant for _ in values]
+        if maximize:
+            return [(v - min_val) / (max_val - min_val) for v in values]
+        return [(max_val - v) / (max_val - min_val) for v in values]
+
+    def columns(self, values, maximize=True, axis: int = 0):
+        import numpy as np
+        min_val = values.min(axis=axis, keepdims=True)
+        max_val = values.max(axis=axis, keepdims=True)
+        span = max_val - min_val
+        degenerate = span == 0
+        span = np.where(degenerate, 1.0, span)
+        normalized = np.where(maximize, (values - min_val) / span, (max_val - values) / span)
+        return np.where(degenerate, self.constant, normalized)
+
+    def transform_columns(self, values, stats: List[RunningStats], maximize=True):
+        import numpy as np
+        min_val = np.array([s.min for s in stats], dtype=float)
+        max_val = np.array([s.max for s in stats], dtype=float)
+        span = max_val - min_val
+        degenerate = span == 0
+        span = np.where(degenerate, 1.0, span)
+        normalized = np.where(maximize, (values - min_val) / span, (max_val - values) / span)
+        return np.where(degenerate, self.constant, normalized)
+
+
+class ZScoreNormalizer(StreamingMixin, Normalizer):
+    """
+    Standard score (v - mean) / std, negated for minimize criteria.
+    Not confined to a fixed range, so outliers do not squash the rest of the
+    column; a constant column scores 0.0.
+    """
+
+    def bounds(self, n: int) -> tuple[float, float]:
+        # with the population std no value lies further than sqrt(n - 1) from the mean
+        limit = math.sqrt(n - 1) if n else 0.0
+        return -limit, limit
+
+    def __call__(self, values: List[float], maximize: bool = True) -> List[float]:
+        return self.transform(values, RunningStats().update(values), maximize)
+
+    def transform(self, values: List[float], stats: RunningStats, maximize: bool = True) -> List[float]:
+        std = stats.std
+        if std == 0:
+            return [0.0 for _ in values]
+        sign = 1.0 if maximize else -1.0
+        return [sign * (v - stats.mean) / std for v in values]
+
+    def columns(self, values, maximize=True, axis: int = 0):
+        import numpy as np
+        mean = values.mean(axis=axis, keepdims=True)
+        std = values.std(axis=axis, keepdims=True)
+        degenerate = std == 0
+        z = (values - mean) / np.where(degenerate, 1.0, std)
+        return np.where(degenerate, 0.0, np.where(maximize, z, -z))
+
+    def transform_columns(self, values, stats: List[RunningStats], maximize=True):
+        import numpy as np
+        mean = np.array([s.mean for s in stats], dtype=float)
+        std = np.array([s.std for s in stats], dtype=float)
+        degenerate = std == 0
+        z = (values - mean) / np.where(degenerate, 1.0, std)
+        return np.where(degenerate, 0.0, np.where(maximize, z, -z))
+
+
+class RankNormalizer(Normalizer):
+    """
+    Rank / (n - 1) in 0-1, ties sharing their average rank.
+    Insensitive to scale and outliers; a constant column scores 0.5
+    and a single option 1.0.
+    """
+
+    def bounds(self, n: int) -> tuple[float, float]:
+        return 0.0, 1.0
+
+    def __call__(self, values: List[float], maximize: bool = True) -> List[float]:
+        n = len(values)
+        if n == 1:
+            return [1.0]
+        ordered = sorted(values)
+        ranks = [(bisect_left(ordered, v) + bisect_right(ordered, v) - 1) / 2 / (n - 1) for v in values]
+        return ranks if maximize else [1.0 - r for r in ranks]
+
+    def columns(self, values, maximize=True, axis: int = 0):
+        import numpy as np
+        n = values.shape[axis]
+        if n == 1:
+            return np.ones_like(values, dtype=float)
+        moved = np.moveaxis(values, axis, -1)
+        order = np.argsort(moved, axis=-1, kind="stable")
+        ordered = np.take_along_axis(moved, order, axis=-1)
+        position = np.broadcast_to(np.arange(n), ordered.shape)
+        # first and last sorted position of every run of equal values
+        starts = np.ones(ordered.shape, dtype=bool)
+        starts[..., 1:] = ordered[..., 1:] != ordered[..., :-1]
+        ends = np.ones(ordered.shape, dtype=bool)
+        ends[..., :-1] = starts[..., 1:]
+        first = np.maximum.accumulate(np.where(starts, position, 0), axis=-1)
+        last = np.flip(np.minimum.accumulate(np.flip(np.where(ends, position, n), -1), axis=-1), -1)
+        ranks = np.empty(moved.shape)
+        np.put_along_axis(ranks, order, (first + last) / 2 / (n - 1), axis=-1)
+        ranks = np.moveaxis(ranks, -1, axis)
+        return np.where(maximize, ranks, 1.0 - ranks)
+
+
+class QuantileNormalizer(Normalizer):
+    """
+    Min-max between the lower and upper quantiles (nearest rank), values
+    outside clipped to 0 or 1, so a few extreme options cannot compress
+    everyone else. The two quantiles come from a partial sort.
+    """
+
+    def __init__(self, lower: float = 0.05, upper: float = 0.95, constant: float = 1.0):
+        if not 0.0 <= lower < upper <= 1.0:
+            raise ValueError("Quantiles must satisfy 0 <= lower < upper <= 1")
+        self.lower = lower
+        self.upper = upper
+        self.constant = constant
+
+    def bounds(self, n: int) -> tuple[float, float]:
+        return min(0.0, self.constant), max(1.0, self.constant)
+
+    def _ranks(self, n: int) -> tuple[int, int]:
+        return int(self.lower * (n - 1)), int(math.ceil(self.upper * (n - 1)))
+
+    def __call__(self, values: List[float], maximize: bool = True) -> List[float]:
+        lo, hi = self._ranks(len(values))
+        min_val = heapq.nsmallest(lo + 1, values)[-1]
+        max_val = heapq.nlargest(len(values) - hi, values)[-1]
+        if max_val == min_val:
+            return [self.constant for _ in values]
+        span = max_val - min_val
+        clipped = [min(max(v, min_val), max_val) for v in values]
+        if maximize:
+            return [(v - min_val) / span for v in clipped]
+        return [(max_val - v) / span for v in clipped]
+
+    def columns(self, values, maximize=True, axis: int = 0):
+        import numpy as np
+        lo, hi = self._ranks(values.shape[axis])
+        parted = np.partition(values, (lo, hi), axis=axis)
+        min_val = np.take(parted, [lo], axis=axis)
+        max_val = np.take(parted, [hi], axis=axis)
+        span = max_val - min_val
+        degenerate = span == 0
+        span = np.where(degenerate, 1.0, span)
+        clipped = np.clip(values, min_val, max_val)
+        normalized = np.where(maximize, (clipped - min_val) / span, (max_val - clipped) / span)
+        return np.where(degenerate, self.constant, normalized)
+
+
+NORMALIZERS = {
+    "min_max": MinMaxNormalizer,
+    "z_score": ZScoreNormalizer,
+    "rank": RankNormalizer,
+    "quantile": QuantileNormalizer,
+}
+
+
+def get_normalizer_class(name: str) -> type[Normalizer]:
+    if name not in NORMALIZERS:
+        raise ValueError(f"Normalizer '{name}' not found.")
+    return NORMALIZERS[name]
+
+
+# -------------------------
+# Active normalizer
+# -------------------------
+MIN_MAX = MinMaxNormalizer()
+_default: Normalizer = MIN_MAX
+_scoped: ContextVar[Normalizer | None] = ContextVar("normalizer", default=None)
+
+
+def set_normalizer(normalizer: Normalizer | None) -> Normalizer:
+    """
+    Install the process-wide normalizer used by scoring and every strategy
+    (None restores min-max) and return the previous one.
+    """
+    global _default
+    previous, _default = _default, normalizer if normalizer is not None else MIN_MAX
+    return previous
+
+
+def get_normalizer() -> Normalizer:
+    scoped = _scoped.get()
+    return _default if scoped is None else scoped
+
+
+@contextmanager
+def using_normalizer(normalizer: Normalizer | None):
+    """Use normalizer in the current thread / task for the duration of a with block"""
+    if normalizer is None:
+        yield get_normalizer()
+        return
+    token = _scoped.set(normalizer)
+    try:
+        yield normalizer
+    finally:
+        _scoped.reset(token)
@@ -0,0 +1,278 @@
+"""
+Reduced-precision (float32) scoring with a float64 ranking guarantee.
+
+The bulk evaluation runs on a float32 copy of the outcomes. A forward error
+bound on the float32 scores (from the outcome magnitudes and the exact
+float64 min-max anchors) marks every option whose order against a neighbour
+could differ from float64; only those are re-scored in float64 against the
+same anchors. Ranking by the returned scores therefore reproduces the
+double-precision ranking, ties included.
+"""
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, List, Dict
+
+import numpy as np
+
+from core.models import OptionEvaluation, Criterion
+from core.matrix import DecisionMatrix, normalize_columns, weighted_sum
+from core.fused import KERNELS, VALUES
+from core.ingest import score_chunk
+from core.normalization import MinMaxNormalizer, RunningStats, get_normalizer
+from core.scoring import as_decision_matrix
+from core.strategies import Strategy
+
+EPS32 = float(np.finfo(np.float32).eps)
+
+
+@dataclass(frozen=True)
+class PrecisionReport:
+    """
+    What one float32 evaluation cost. bytes_* are modeled from the array
+    shapes, not measured allocations: the arrays an evaluation works on
+    (outcomes, values, normalized values, scores) at 8 or 4 bytes per cell,
+    with bytes_float32 adding the float64 rows of the re-scored options.
+    seconds_* are measured; seconds_float64 is only set when a float64
+    evaluation was timed for comparison.
+    """
+    n_options: int
+    rescored: int
+    margin: float
+    bytes_float64: int
+    bytes_float32: int
+    seconds_float32: float
+    seconds_rescore: float
+    seconds_float64: float | None = None
+
+    @property
+    def modeled_saved_bytes(self) -> int:
+        """bytes_float64 - bytes_float32; a shape-based estimate, not a measurement"""
+        return self.bytes_float64 - self.bytes_float32
+
+    @property
+    def saved_seconds(self) -> float | None:
+        if self.seconds_float64 is None:
+            return None
+        return self.seconds_float64 - self.seconds_float32 - self.seconds_rescore
+
+
+def float32_scores(
+    matrix: DecisionMatrix,
+    strategy: Strategy,
+    risk_weight: float = 0.5,
+    k: int | None = None,
+    exact_rows: Callable[[np.ndarray], DecisionMatrix] | None = None,
+) -> tuple[np.ndarray, np.ndarray, PrecisionReport]:
+    """
+    Score matrix in float32, then re-score the near-ties in float64.
+
+    Returns the scores (float64 array; re-scored options hold their exact
+    float64 score, the rest their float32 one), the indices that were
+    re-scored and a PrecisionReport. A stable descending sort of the scores
+    gives the float64 ranking; with k only the top k are guaranteed, and only
+    near-ties reaching into it are re-scored. exact_rows maps row indices to
+    their float64 DecisionMatrix; by default the rows of matrix are upcast,
+    so pass it when matrix was built in float32 from more precise data.
+    Needs a strategy with a fused kernel (core.fused) and min-max normalization.
+    """
+    if not isinstance(get_normalizer(), MinMaxNormalizer):
+        raise ValueError("float32 scoring needs min-max normalization")
+    kind, maximize = _kernel(strategy)
+    n, m = matrix.n_options, matrix.n_criteria
+    if exact_rows is None:
+        exact_rows = lambda index: matrix.rows(index).astype(np.float64)
+
+    start = time.perf_counter()
+    low = matrix.astype(np.float32)
+    values = VALUES[kind](low, risk_weight)
+    scores = weighted_sum(
+        normalize_columns(values, low.maximize if maximize is None else maximize), low.weights
+    )
+    seconds_float32 = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scale = _magnitude(low, kind, risk_weight)
+    # regret is normalized on anchors derived from the worst column (see core.ingest.score_chunk)
+    anchored = low.worst if kind == "regret" else values
+    stats = exact_anchors(exact_rows, anchored, 8.0 * EPS32 * scale, kind, risk_weight)
+    margin = error_bound(low.weights, scale, np.array([s.max - s.min for s in stats]))
+    rescore = near_ties(scores, margin, k)
+    result = scores.astype(np.float64)
+    if rescore.size:
+        result[rescore] = score_chunk(exact_rows(rescore), strategy, stats, risk_weight)
+    seconds_rescore = time.perf_counter() - start
+
+    cells = 5 * n * m + n
+    report = PrecisionReport(
+        n_options=n,
+        rescored=int(rescore.size),
+        margin=margin,
+        bytes_float64=cells * 8,
+        bytes_float32=cells * 4 + int(rescore.size) * (5 * m + 1) * 8,
+        seconds_float32=seconds_float32,
+        seconds_rescore=seconds_rescore,
+    )
+    return result, rescore, report
+
+
+def _kernel(strategy: Strategy) -> tuple[str, bool | None]:
+    kernel = KERNELS.get(type(strategy))
+    if kernel is None:
+        raise ValueError(f"{type(strategy).__name__} has no float32 kernel")
+    return kernel
+
+
+def _magnitude(low: DecisionMatrix, kind: str, risk_weight: float) -> np.ndarray:
+    """
+    Per-criterion bound on the magnitude of what the strategy's values are
+    computed from; valid outcomes (best >= expected >= worst) lie in [min worst, max best].
+    """
+    top = np.maximum(np.abs(low.best.max(axis=0)), np.abs(low.worst.min(axis=0))).astype(np.float64)
+    if kind == "regret":
+        return 2.0 * top
+    return (1.0 + 2.0 * abs(risk_weight)) * top
+
+
+def exact_anchors(
+    exact_rows: Callable[[np.ndarray], DecisionMatrix],
+    anchored: np.ndarray,
+    tolerance: np.ndarray,
+    kind: str,
+    risk_weight: float,
+) -> list[RunningStats]:
+    """
+    Exact float64 min / max per column of what the strategy normalizes on.
+    A float32 column value is within tolerance of its float64 value, so only
+    rows within twice that of a float32 extreme can hold the float64 one;
+    just those rows are fetched through exact_rows and computed in float64.
+    """
+    # thresholds rounded outwards to float32, so the comparisons stay in float32
+    low = np.nextafter((anchored.min(axis=0) + 2.0 * tolerance).astype(anchored.dtype), np.inf)
+    high = np.nextafter((anchored.max(axis=0) - 2.0 * tolerance).astype(anchored.dtype), -np.inf)
+    near = (anchored <= low) | (anchored >= high)
+    exact = exact_rows(np.flatnonzero(near.any(axis=1)))
+    values = exact.worst if kind == "regret" else VALUES[kind](exact, risk_weight)
+    return [
+        RunningStats(count=len(anchored), min=float(column.min()), max=float(column.max()))
+        for column in values.T
+    ]
+
+
+def error_bound(weights: np.ndarray, scale: np.ndarray, span: np.ndarray) -> float:
+    """
+    Bound on |float32 score - float64 score| of any option. Per criterion the
+    normalized value is off by a few float32 ulps of the input magnitude
+    relative to the float64 span (capped at 1, the width of the 0-1 range);
+    the weighted sum adds one ulp per term.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        per_criterion = np.where(span > 0, 8.0 * EPS32 * (scale / span + 1.0), 1.0)
+    weights = np.abs(weights)
+    return float(weights @ np.minimum(per_criterion, 1.0) + (len(weights) + 1) * EPS32 * weights.sum())
+
+
+def near_ties(scores: np.ndarray, margin: float, k: int | None = None) -> np.ndarray:
+    """
+    Sorted indices of options whose score is within 2 * margin of a neighbour
+    in score order, so their float64 order may differ. With k, only clusters
+    of such options that reach into the top k; just the top of the scores is
+    sorted then, widened until the cluster through rank k ends.
+    """
+    n = len(scores)
+    scores = np.asarray(scores, dtype=np.float64)
+    limit = 2.0 * margin
+    if k is None or k >= n:
+        order = np.argsort(-scores, kind="stable")
+        close = scores[order[:-1]] - scores[order[1:]] <= limit
+        last = n
+    else:
+        k = max(k, 1)
+        threshold = float(np.partition(scores, n - k)[n - k]) - limit
+        while True:
+            candidates = np.flatnonzero(scores >= threshold)
+            order = candidates[np.argsort(-scores[candidates], kind="stable")]
+            ranked = scores[order]
+            close = ranked[:-1] - ranked[1:] <= limit
+            lower = ranked[-1] - limit
+            if not close[k - 1 :].all() or lower >= threshold:
+                break
+            threshold = lower
+        # positions in the same cluster share an id; keep clusters starting in the top k
+        cluster = np.concatenate([[0], np.cumsum(~close)])
+        last = int(np.searchsorted(cluster, cluster[k - 1], side="right"))
+    member = np.zeros(len(order), dtype=bool)
+    member[:-1] |= close
+    member[1:] |= close
+    return np.sort(order[:last][member[:last]])
+
+
+class Float32Strategy(Strategy):
+    """
+    Opt-in float32 evaluation of any strategy with a fused kernel (expected
+    value, risk averse, regret). Scores rank exactly like the wrapped
+    strategy's float64 scores (top k only, when k is given); last_report
+    holds the PrecisionReport of the latest call. measure_baseline also times
+    a float64 evaluation, to report the time saved.
+    """
+
+    def __init__(self, strategy: Strategy, k: int | None = None, measure_baseline: bool = False):
+        _kernel(strategy)
+        self.strategy = strategy
+        self.k = k
+        self.measure_baseline = measure_baseline
+        self.last_report: PrecisionReport | None = None
+
+    @property
+    def risk_adjusted(self) -> bool:
+        return self.strategy.risk_adjusted
+
+    def cache_key(self) -> tuple:
+        return super().cache_key() + (self.strategy.cache_key(), self.k)
+
+    def evaluate_padded(self, batch):
+        """
+        Every packed problem goes through evaluate_matrix, so batches keep the
+        float32 scoring and its near-tie re-scoring; last_report then covers
+        the last problem only.
+        """
+        return super().evaluate_padded(batch)
+
+    def prepare(
+        self, options: List[OptionEvaluation], criteria: List[Criterion]
+    ) -> tuple[DecisionMatrix, Callable[[np.ndarray], DecisionMatrix]]:
+        """
+        The float32 matrix of a problem and the source of its exact float64
+        rows, built once so they can be scored at several risk weights.
+        Evaluation lists go straight into float32 arrays; the re-scored rows
+        are rebuilt from the evaluations.
+        """
+        matrix = as_decision_matrix(options, criteria)
+        if matrix is not None:
+            return matrix.astype(np.float32), lambda index: matrix.rows(index).astype(np.float64)
+        from core.validation import validate_options
+        validate_options(options, criteria)
+        return (
+            DecisionMatrix.from_evaluations(options, criteria, dtype=np.float32),
+            lambda index: DecisionMatrix.from_evaluations([options[i] for i in index.tolist()], criteria),
+        )
+
+    def evaluate(
+        self, options: List[OptionEvaluation], criteria: List[Criterion], risk_weight: float = 0.5
+    ) -> Dict[str, float]:
+        matrix, exact_rows = self.prepare(options, criteria)
+        return matrix.scores_dict(self.evaluate_matrix(matrix, risk_weight, exact_rows))
+
+    def evaluate_matrix(
+        self,
+        matrix,
+        risk_weight: float = 0.5,
+        exact_rows: Callable[[np.ndarray], DecisionMatrix] | None = None,
+    ):
+        scores, _, report = float32_scores(matrix, self.strategy, risk_weight, self.k, exact_rows)
+        if self.measure_baseline:
+            baseline = matrix.astype(np.float64) if exact_rows is None else exact_rows(np.arange(matrix.n_options))
+            start = time.perf_counter()
+            self.strategy.evaluate_matrix(baseline, risk_weight)
+            report = replace(report, seconds_float64=time.perf_counter() - start)
+        self.last_report = report
+        return scores
@@ -0,0 +1,116 @@
+from typing import Iterable, Iterator
+
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+
+
+def criteria_from_dicts(items: Iterable[dict]) -> list[Criterion]:
+    """[{"name", "weight", "maximize"}] -> Criterion list; maximize defaults to True"""
+    return [
+        Criterion(name=c["name"], weight=float(c["weight"]), maximize=bool(c.get("maximize", True)))
+        for c in items
+    ]
+
+
+def parse_criteria(spec: str) -> list[Criterion]:
+    """
+    Read a compact criteria list such as "salary:0.6:max,risk:0.4:min";
+    the direction is optional and defaults to max.
+    """
+    criteria = []
+    for item in spec.split(","):
+        name, weight, *direction = item.strip().split(":")
+        if direction and direction[0] not in ("max", "min"):
+            raise ValueError(f"Criterion '{name}' direction must be max or min")
+        criteria.append(Criterion(name, float(weight), not direction or direction[0] == "max"))
+    return criteria
+
+
+def problem_from_dict(payload: dict) -> tuple[list[OptionEvaluation], list[Criterion]]:
+    """
+    Read one problem:
+    {"criteria": [{"name", "weight", "maximize"}],
+     "options": [{"name", "outcomes": {criterion: {"best", "expected", "worst", "scenarios"?}}}]}
+    An outcome given by "scenarios" alone takes best / expected / worst from them.
+    """
+    options = [
+        OptionEvaluation(
+            option=Option(name=o["name"], description=o.get("description")),
+            outcomes={name: outcome_from_dict(v) for name, v in o["outcomes"].items()},
+        )
+        for o in payload["options"]
+    ]
+    return options, criteria_from_dicts(payload["criteria"])
+
+
+def outcome_from_dict(v: dict) -> Outcome:
+    scenarios = v.get("scenarios")
+    if scenarios is not None and "best" not in v:
+        return Outcome.from_scenarios(scenarios)
+    return Outcome(
+        best=float(v["best"]),
+        expected=float(v["expected"]),
+        worst=float(v["worst"]),
+        scenarios=None if scenarios is None else tuple(float(x) for x in scenarios),
+    )
+
+
+def problem_to_dict(options: Iterable[OptionEvaluation], criteria: Iterable[Criterion]) -> dict:
+    return {
+        "criteria": [{"name": c.name, "weight": c.weight, "maximize": c.maximize} for c in criteria],
+        "options": [
+            {
+                "name": opt.option.name,
+                **({"description": opt.option.description} if opt.option.description is not None else {}),
+                "outcomes": {
+                    name: {
+                        "best": o.best,
+                        "expected": o.expected,
+                        "worst": o.worst,
+                        **({"scenarios": list(o.scenarios)} if o.scenarios is not None else {}),
+                    }
+                    for name, o in opt.outcomes.items()
+                },
+            }
+            for opt in options
+        ],
+    }
+
+
+def result_to_dict(result: dict) -> dict:
+    """JSON-ready copy of a risk_aware_agent result (ranking pairs become lists)"""
+    payload = {
+        "scores": result["scores"],
+        "ranking": [[name, score] for name, score in result["ranking"]],
+        "breakdown": {name: dict(row) for name, row in result["breakdown"].items()},
+    }
+    if "pruned" in result:
+        payload["pruned"] = result["pruned"]
+    return payload
+
+
+def problems_from_rows(rows: Iterable[dict]) -> Iterator[tuple[str, list[OptionEvaluation]]]:
+    """
+    Group long-format rows {problem?, option, criterion, best, expected, worst}
+    into (problem id, options) pairs. Rows of one problem must be consecutive;
+    without a problem column the whole input is one problem.
+    """
+    current, outcomes, order = None, {}, []
+    for row in rows:
+        problem = row.get("problem", "")
+        if problem != current and order:
+            yield current, _options(order, outcomes)
+            outcomes, order = {}, []
+        current = problem
+        name = row["option"]
+        if name not in outcomes:
+            outcomes[name] = {}
+            order.append(name)
+        outcomes[name][row["criterion"]] = Outcome(
+            best=float(row["best"]), expected=float(row["expected"]), worst=float(row["worst"])
+        )
+    if order:
+        yield current, _options(order, outcomes)
+
+
+def _options(order: list[str], outcomes: dict) -> list[OptionEvaluation]:
+    return [OptionEvaluation(Option(name), outcomes[name]) for name in order]
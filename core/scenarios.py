@@ -0,0 +1,169 @@
+"""
+Multi-scenario outcomes and vectorized minimax regret.
+
+An Outcome may carry a scenarios vector (forecast draws or quantiles) next to
+best / expected / worst. ScenarioMatrix packs those vectors criterion by
+criterion into contiguous (options x scenarios) arrays, so the regret of every
+option in every scenario is one broadcast per criterion. Criteria given by
+best / expected / worst only keep the three-point regret of
+RegretMinimizationStrategy.
+"""
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.matrix import DecisionMatrix, regret_values
+
+AGGREGATIONS = ("max", "expected")
+
+
+@dataclass(frozen=True, eq=False)
+class ScenarioMatrix(DecisionMatrix):
+    """
+    DecisionMatrix plus, per criterion, a C-contiguous (options x scenarios)
+    float array, or None where that criterion only has best / expected / worst.
+    best / expected / worst of a scenario criterion span its scenarios.
+    """
+    scenarios: tuple[np.ndarray | None, ...] = ()
+
+    @classmethod
+    def from_evaluations(
+        cls, options: Sequence[OptionEvaluation], criteria: Sequence[Criterion], dtype=float
+    ) -> "ScenarioMatrix":
+        """
+        Build from OptionEvaluation lists. Per criterion, either every option or
+        none has scenarios, and all vectors have the same length.
+        """
+        matrix = super().from_evaluations(options, criteria, dtype)
+        columns = []
+        for c in criteria:
+            vectors = [opt.outcomes[c.name].scenarios for opt in options]
+            if all(v is None for v in vectors):
+                columns.append(None)
+                continue
+            if any(v is None for v in vectors):
+                raise ValueError(f"Criterion '{c.name}' has scenarios for some options only")
+            if len({len(v) for v in vectors}) != 1:
+                raise ValueError(f"Criterion '{c.name}' needs the same number of scenarios for every option")
+            columns.append(np.array(vectors, dtype=dtype))
+        return cls(**_fields(matrix), scenarios=tuple(columns))
+
+    @classmethod
+    def from_scenario_arrays(
+        cls,
+        option_names: Sequence[str],
+        criteria: Sequence[Criterion],
+        scenarios,
+        probabilities=None,
+    ) -> "ScenarioMatrix":
+        """
+        Build straight from an (options x criteria x scenarios) array-like,
+        without creating any Outcome objects. expected is the scenario mean,
+        probability-weighted when probabilities are given.
+        """
+        tensor = np.asarray(scenarios, dtype=float)
+        if tensor.ndim != 3 or tensor.shape[:2] != (len(option_names), len(criteria)) or not tensor.shape[2]:
+            raise ValueError(f"scenarios must have shape ({len(option_names)}, {len(criteria)}, scenarios)")
+        weights = _probabilities(probabilities, tensor.shape[2])
+        best, worst = tensor.max(axis=2), tensor.min(axis=2)
+        expected = np.clip(tensor.mean(axis=2) if weights is None else tensor @ weights, worst, best)
+        # criterion-major copy: each criterion's slab is one contiguous block
+        slabs = np.ascontiguousarray(tensor.transpose(1, 0, 2))
+        matrix = DecisionMatrix.from_arrays(option_names, criteria, best, expected, worst)
+        return cls(**_fields(matrix), scenarios=tuple(slabs))
+
+    def with_criteria(self, criteria: Sequence[Criterion]) -> "ScenarioMatrix":
+        matrix = super().with_criteria(criteria)
+        if matrix is self:
+            return self
+        index = {name: j for j, name in enumerate(self.criterion_names)}
+        scenarios = tuple(self.scenarios[index[name]] for name in matrix.criterion_names)
+        return ScenarioMatrix(**_fields(matrix), scenarios=scenarios)
+
+    def rows(self, index: slice | np.ndarray) -> "ScenarioMatrix":
+        matrix = super().rows(index)
+        scenarios = tuple(None if s is None else s[index] for s in self.scenarios)
+        return ScenarioMatrix(**_fields(matrix), scenarios=scenarios)
+
+    def astype(self, dtype) -> "ScenarioMatrix":
+        matrix = super().astype(dtype)
+        if matrix is self:
+            return self
+        scenarios = tuple(None if s is None else s.astype(dtype) for s in self.scenarios)
+        return ScenarioMatrix(**_fields(matrix), scenarios=scenarios)
+
+    def __getitem__(self, i: int) -> OptionEvaluation:
+        return OptionEvaluation(
+            option=Option(self.option_names[i]),
+            outcomes={
+                name: Outcome(float(b), float(e), float(w), None if s is None else tuple(s[i].tolist()))
+                for name, b, e, w, s in zip(
+                    self.criterion_names, self.best[i], self.expected[i], self.worst[i], self.scenarios
+                )
+            },
+        )
+
+
+def _fields(matrix: DecisionMatrix) -> dict:
+    return dict(
+        option_names=matrix.option_names,
+        criterion_names=matrix.criterion_names,
+        best=matrix.best,
+        expected=matrix.expected,
+        worst=matrix.worst,
+        weights=matrix.weights,
+        maximize=matrix.maximize,
+    )
+
+
+def _probabilities(probabilities, n_scenarios: int) -> np.ndarray | None:
+    if probabilities is None:
+        return None
+    weights = np.asarray(probabilities, dtype=float)
+    if weights.shape != (n_scenarios,):
+        raise ValueError(f"probabilities must have one entry per scenario ({n_scenarios})")
+    if (weights < 0).any() or not np.isclose(weights.sum(), 1.0):
+        raise ValueError("probabilities must be non-negative and sum to 1")
+    return weights
+
+
+def regret_matrix(values: np.ndarray, maximize: bool = True) -> np.ndarray:
+    """
+    Regret of every option in every scenario for one criterion: the distance
+    from the best value any option reaches in that scenario. values and the
+    result are (options x scenarios).
+    """
+    if maximize:
+        return values.max(axis=0) - values
+    return values - values.min(axis=0)
+
+
+def aggregate_regret(regret: np.ndarray, aggregation: str = "max", probabilities=None) -> np.ndarray:
+    """
+    Reduce an (options x scenarios) regret matrix to one regret per option:
+    "max" is the minimax regret, "expected" the probability-weighted mean
+    (uniform unless probabilities are given).
+    """
+    if aggregation == "max":
+        return regret.max(axis=1)
+    if aggregation == "expected":
+        weights = _probabilities(probabilities, regret.shape[1])
+        return regret.mean(axis=1) if weights is None else regret @ weights
+    raise ValueError(f"Aggregation '{aggregation}' not found.")
+
+
+def scenario_regret_values(
+    matrix: DecisionMatrix, aggregation: str = "max", probabilities=None
+) -> np.ndarray:
+    """
+    (options x criteria) regrets: aggregated scenario regret where a criterion
+    has scenarios, regret_values (worst case only) elsewhere.
+    """
+    values = regret_values(matrix)
+    for j, scenarios in enumerate(getattr(matrix, "scenarios", ())):
+        if scenarios is not None:
+            regret = regret_matrix(scenarios, bool(matrix.maximize[j]))
+            values[:, j] = aggregate_regret(regret, aggregation, probabilities)
+    return values
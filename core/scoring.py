@@ -1,39 +1,140 @@
-from core.models import OptionEvaluation, Criterion
-from core.normalization import normalize
-from typing import List, Dict
+import sys
+from dataclasses import dataclass, replace
+from functools import cached_property
+from core.models import OptionEvaluation, Criterion, Outcome
+from core.normalization import Normalizer, get_normalizer, using_normalizer
+from typing import Callable, List, Dict, Sequence
 from core.uncertainty import risk_adjusted_score
+from core.instrumentation import stage
 
-def calculate_scores(
-    options: List[OptionEvaluation], criteria: List[Criterion]
-) -> Dict[str, float]:
+def as_decision_matrix(options, criteria):
     """
-    Calculate weighted scores for each option
+    Return the DecisionMatrix when one was passed as options, otherwise None.
+    core.matrix is only consulted if it has been imported, so the pure-Python
+    path never pulls in NumPy.
+    """
+    matrix_module = sys.modules.get("core.matrix")
+    if matrix_module is None or not isinstance(options, matrix_module.DecisionMatrix):
+        return None
+    return options if criteria is None else options.with_criteria(criteria)
+
+
+@dataclass(frozen=True)
+class Evaluation:
     """
+    Scores plus the per-criterion intermediates that produced them.
+    raw[j][i] is the value option i was normalized on for criterion j,
+    normalized[j][i] its 0-1 result; both are None when a strategy has none.
+    risk_adjusted marks raw as expected - risk_weight * spread on every
+    criterion, which the agent explains by criterion direction instead.
+    """
+    option_names: tuple[str, ...]
+    criterion_names: tuple[str, ...]
+    scores: Dict[str, float]
+    raw: Sequence | None = None
+    normalized: Sequence | None = None
+    risk_adjusted: bool = False
+
+    @cached_property
+    def _index(self) -> Dict[str, int]:
+        return {name: i for i, name in enumerate(self.option_names)}
+
+    def row(self, name: str) -> Dict[str, float]:
+        """Raw per-criterion values of one option"""
+        i = self._index[name]
+        return {c: float(column[i]) for c, column in zip(self.criterion_names, self.raw)}
+
+
+def weighted_columns(
+    options: List[OptionEvaluation],
+    criteria: List[Criterion],
+    raw_column: Callable[[List[Outcome]], List[float]],
+    maximize: bool | None = None
+) -> Evaluation:
+    """
+    Shared scoring loop: per criterion, turn the outcome column into raw values,
+    normalize them with the active normalizer (by criterion.maximize unless
+    maximize is given) and add the weighted result to every option's score.
+    Keeps the columns it computed.
+    """
+    normalize = get_normalizer()
     scores = {opt.option.name: 0.0 for opt in options}
+    raw, normalized = [], []
 
     for criterion in criteria:
-        values = [opt.outcomes[criterion.name].expected for opt in options]
-        normalized_values = normalize(values, maximize=criterion.maximize)
+        with stage("strategy.criterion", n_options=len(options)):
+            values = raw_column([opt.outcomes[criterion.name] for opt in options])
+            normalized_values = normalize(
+                values, maximize=criterion.maximize if maximize is None else maximize
+            )
 
-        for opt, norm_val in zip(options, normalized_values):
-            scores[opt.option.name] += norm_val * criterion.weight
+            for opt, norm_val in zip(options, normalized_values):
+                scores[opt.option.name] += norm_val * criterion.weight
+        raw.append(values)
+        normalized.append(normalized_values)
 
-    return scores
+    return Evaluation(
+        option_names=tuple(opt.option.name for opt in options),
+        criterion_names=tuple(c.name for c in criteria),
+        scores=scores,
+        raw=raw,
+        normalized=normalized,
+    )
 
 
-def calculate_scores_with_risk(
+def calculate_scores(
+    options: List[OptionEvaluation], criteria: List[Criterion], normalizer: Normalizer | None = None
+) -> Dict[str, float]:
+    """
+    Calculate weighted scores for each option
+    normalizer: overrides the active normalizer (min-max by default) for this call
+    """
+    if normalizer is not None:
+        with using_normalizer(normalizer):
+            return calculate_scores(options, criteria)
+    matrix = as_decision_matrix(options, criteria)
+    if matrix is not None:
+        from core.matrix import expected_scores
+        return matrix.scores_dict(expected_scores(matrix))
+
+    return weighted_columns(
+        options, criteria, lambda outcomes: [out.expected for out in outcomes]
+    ).scores
+
+
+def evaluate_with_risk(
     options: list[OptionEvaluation],
     criteria: list[Criterion],
-    risk_weight: float = 0.5
-) -> dict[str, float]:
-    scores = {opt.option.name: 0.0 for opt in options}
+    risk_weight: float = 0.5,
+    normalizer: Normalizer | None = None
+) -> Evaluation:
+    """calculate_scores_with_risk, keeping the risk-adjusted and normalized columns"""
+    if normalizer is not None:
+        with using_normalizer(normalizer):
+            return evaluate_with_risk(options, criteria, risk_weight)
+    matrix = as_decision_matrix(options, criteria)
+    if matrix is not None:
+        from core.matrix import matrix_evaluation, risk_adjusted_values
+        return replace(matrix_evaluation(matrix, risk_adjusted_values(matrix, risk_weight)), risk_adjusted=True)
 
+    evaluation = weighted_columns(
+        options, criteria, lambda outcomes: [risk_adjusted_score(out, risk_weight) for out in outcomes]
+    )
+    return replace(evaluation, risk_adjusted=True)
 
-    for criterion in criteria:
-        values = [risk_adjusted_score(opt.outcomes[criterion.name], risk_weight) for opt in options]
-        normalized_values = normalize(values, maximize=criterion.maximize)
 
-        for opt, norm_val in zip(options, normalized_values):
-            scores[opt.option.name] += norm_val * criterion.weight
+def calculate_scores_with_risk(
+    options: list[OptionEvaluation],
+    criteria: list[Criterion],
+    risk_weight: float = 0.5,
+    normalizer: Normalizer | None = None
+) -> dict[str, float]:
+    if normalizer is not None:
+        with using_normalizer(normalizer):
+            return calculate_scores_with_risk(options, criteria, risk_weight)
+    matrix = as_decision_matrix(options, criteria)
+    if matrix is not None:
+        from core.matrix import risk_adjusted_scores
+        return matrix.scores_dict(risk_adjusted_scores(matrix, risk_weight))
 
-    return scores
\ No newline at end of file
+    return evaluate_with_risk(options, criteria, risk_weight).scores
@@ -1,19 +1,63 @@
 from typing import List, Dict
 from core.models import OptionEvaluation, Criterion
 from core.strategies import Strategy
+from core.scoring import as_decision_matrix
+from core.instrumentation import stage
 
 def sensitivity_analysis(
     options: List[OptionEvaluation],
     criteria: List[Criterion],
     strategy: Strategy,
-    risk_weights: List[float] = [0.0, 0.25, 0.5, 0.75, 1.0]
+    risk_weights: List[float] = [0.0, 0.25, 0.5, 0.75, 1.0],
+    precision: str = "float64"
 ) -> Dict[float, Dict[str, float]]:
     """
     Perform sensitivity analysis over different risk weights.
-    Returns a dict mapping risk_weight -> option scores
+    Returns a dict mapping risk_weight -> option scores.
+    precision="float32" scores through core.precision.Float32Strategy: same
+    rankings as float64, with only near-tied options scored in full precision.
     """
+    if precision == "float32":
+        from core.precision import Float32Strategy
+        reduced = Float32Strategy(strategy)
+        # the float32 matrix is built once and rescored at every risk weight
+        matrix, exact_rows = reduced.prepare(options, criteria)
+        evaluate = lambda rw: matrix.scores_dict(reduced.evaluate_matrix(matrix, rw, exact_rows))
+    elif precision == "float64":
+        evaluate = lambda rw: strategy.evaluate(options, criteria, risk_weight=rw)
+    else:
+        raise ValueError(f"Precision '{precision}' not found.")
     results = {}
+    size = {"n_options": len(options), "n_criteria": len(criteria)}
     for rw in risk_weights:
-        scores = strategy.evaluate(options, criteria, risk_weight=rw)
+        with stage("sensitivity.risk_weight", **size):
+            scores = evaluate(rw)
         results[rw] = scores
-    return results
\ No newline at end of file
+    return results
+
+
+def sensitivity_sweep(
+    options: List[OptionEvaluation],
+    criteria: List[Criterion],
+    strategy: Strategy,
+    risk_weights: List[float] = [0.0, 0.25, 0.5, 0.75, 1.0]
+):
+    """
+    Vectorized sensitivity analysis: scores for all risk weights in one pass.
+    Returns a SensitivitySweep with a (risk weights x options) score array;
+    sweep.as_dict() gives the same shape as sensitivity_analysis.
+    """
+    from core.matrix import DecisionMatrix
+    from core.sweep import SensitivitySweep
+    import numpy as np
+
+    matrix = as_decision_matrix(options, criteria)
+    if matrix is None:
+        from core.validation import validate_options
+        validate_options(options, criteria)
+        matrix = DecisionMatrix.from_evaluations(options, criteria)
+    return SensitivitySweep(
+        risk_weights=np.asarray(risk_weights, dtype=float),
+        option_names=matrix.option_names,
+        scores=strategy.evaluate_sweep(matrix, risk_weights),
+    )
@@ -0,0 +1,166 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Sequence
+
+from core.models import OptionEvaluation, Criterion
+from core.matrix import DecisionMatrix
+from core.ingest import CHUNK_SIZE, chunk_stats, merge_stats, read_chunks, score_chunk, top_k_merge
+from core.normalization import Normalizer, RunningStats, get_normalizer, using_normalizer
+from core.scoring import as_decision_matrix
+from core.strategies import Strategy
+
+# A shard is a file (csv / jsonl / parquet for core.ingest, .dmx for core.storage),
+# a DecisionMatrix or a list of OptionEvaluation objects.
+Shard = str | DecisionMatrix | Sequence[OptionEvaluation]
+
+
+class LocalBackend:
+    """Runs every shard task in this process"""
+
+    def map(self, fn: Callable, *iterables) -> list:
+        return list(map(fn, *iterables))
+
+
+class ProcessBackend:
+    """
+    Reference transport: shard tasks run in a local process pool, kept
+    across both phases. Any object with the same map() can stand in for
+    it, e.g. one that ships the tasks to other machines.
+    """
+
+    def __init__(self, workers: int | None = None):
+        self.workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+
+    def map(self, fn: Callable, *iterables) -> list:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers)
+        return list(self._pool.map(fn, *iterables))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "ProcessBackend":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+@dataclass(frozen=True)
+class ShardedResult:
+    """
+    ranking: the global top k (option, score) pairs, best first.
+    scores: every option's score when requested, else None.
+    stats: the reduced per-criterion stats phase two scored against.
+    """
+    ranking: list[tuple[str, float]]
+    scores: dict[str, float] | None
+    stats: list[RunningStats]
+
+
+def sharded_evaluate(
+    shards: Sequence[Shard],
+    criteria: List[Criterion],
+    strategy: Strategy,
+    risk_weight: float = 0.5,
+    k: int = 10,
+    backend=None,
+    chunk_size: int = CHUNK_SIZE,
+    return_scores: bool = False,
+) -> ShardedResult:
+    """
+    Two-phase evaluation of one option set split into shards.
+
+    Phase one computes mergeable per-criterion RunningStats on every shard;
+    they are reduced here. Phase two scores each shard against the global
+    anchors and returns its own top k, which are merged into the global
+    ranking. Scores equal the strategy on the concatenated option set exactly
+    (min-max; z-score up to rounding). Ties rank in shard order, then option order.
+    """
+    backend = backend or LocalBackend()
+    count = len(shards)
+    normalizers = [get_normalizer()] * count
+    parts = backend.map(
+        shard_stats, shards, [criteria] * count, [strategy] * count,
+        [risk_weight] * count, [chunk_size] * count, normalizers,
+    )
+    stats = merge_stats(parts)
+    results = backend.map(
+        shard_scores, shards, [criteria] * count, [strategy] * count, [stats] * count,
+        [risk_weight] * count, [k] * count, [chunk_size] * count, [return_scores] * count, normalizers,
+    )
+    # shard lists are already best first, so concatenating them in shard order keeps ties stable
+    ranking = heapq.nlargest(k, chain.from_iterable(top for top, _ in results), key=lambda item: item[1])
+    scores = None
+    if return_scores:
+        scores = {}
+        for _, part in results:
+            scores.update(part)
+    return ShardedResult(ranking=ranking, scores=scores, stats=stats)
+
+
+# -------------------------
+# Shard tasks (module level so they pickle)
+# -------------------------
+def shard_chunks(shard: Shard, criteria: List[Criterion], chunk_size: int = CHUNK_SIZE) -> Iterator[DecisionMatrix]:
+    if isinstance(shard, str):
+        if shard.endswith(".dmx"):
+            from core.storage import open_problem
+            matrix = open_problem(shard).with_criteria(criteria)
+        else:
+            yield from read_chunks(shard, criteria, chunk_size)
+            return
+    else:
+        matrix = as_decision_matrix(shard, criteria)
+        if matrix is None:
+            from core.validation import validate_options
+            validate_options(shard, criteria)
+            matrix = DecisionMatrix.from_evaluations(shard, criteria)
+    for start in range(0, matrix.n_options, chunk_size):
+        yield matrix.rows(slice(start, start + chunk_size))
+
+
+def shard_stats(
+    shard: Shard,
+    criteria: List[Criterion],
+    strategy: Strategy,
+    risk_weight: float,
+    chunk_size: int,
+    normalizer: Normalizer,
+) -> list[RunningStats]:
+    """Phase one: the shard's per-criterion stats"""
+    with using_normalizer(normalizer):
+        return merge_stats(
+            chunk_stats(chunk, strategy, risk_weight) for chunk in shard_chunks(shard, criteria, chunk_size)
+        )
+
+
+def shard_scores(
+    shard: Shard,
+    criteria: List[Criterion],
+    strategy: Strategy,
+    stats: List[RunningStats],
+    risk_weight: float,
+    k: int,
+    chunk_size: int,
+    return_scores: bool,
+    normalizer: Normalizer,
+) -> tuple[list[tuple[str, float]], dict[str, float] | None]:
+    """Phase two: the shard's top k against the global stats, and all its scores if asked"""
+    scores = {} if return_scores else None
+
+    def scored():
+        for chunk in shard_chunks(shard, criteria, chunk_size):
+            values = score_chunk(chunk, strategy, stats, risk_weight)
+            if scores is not None:
+                scores.update(zip(chunk.option_names, values.tolist()))
+            yield chunk.option_names, values
+
+    with using_normalizer(normalizer):
+        top = top_k_merge(scored(), k)
+    return top, scores
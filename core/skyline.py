@@ -0,0 +1,172 @@
+from bisect import bisect_left
+from typing import List
+
+import numpy as np
+
+from core.models import OptionEvaluation, Criterion
+from core.matrix import DecisionMatrix, risk_adjusted_values
+from core.scoring import as_decision_matrix
+
+# Upper bound on the temporary comparison arrays of the block-nested-loop pass.
+MAX_BYTES = 64 * 2**20
+
+
+def pareto_front(
+    options: List[OptionEvaluation],
+    criteria: List[Criterion],
+    risk_weight: float | None = None,
+    max_bytes: int = MAX_BYTES,
+) -> list[str]:
+    """
+    Names of the non-dominated options, in input order.
+    Compares expected values, or risk-adjusted ones when risk_weight is given,
+    and honors Criterion.maximize. Equal options do not dominate each other.
+    """
+    matrix, points = _points(options, criteria, risk_weight)
+    return [matrix.option_names[i] for i in front_indices(points, max_bytes).tolist()]
+
+
+def pareto_layers(
+    options: List[OptionEvaluation],
+    criteria: List[Criterion],
+    risk_weight: float | None = None,
+    max_layers: int | None = None,
+    max_bytes: int = MAX_BYTES,
+) -> list[list[str]]:
+    """
+    Peel Pareto fronts repeatedly: layer 0 is the front, layer 1 the front of
+    what remains, and so on (up to max_layers).
+    """
+    matrix, points = _points(options, criteria, risk_weight)
+    return [
+        [matrix.option_names[i] for i in layer.tolist()]
+        for layer in layer_indices(points, max_layers, max_bytes)
+    ]
+
+
+def _points(options, criteria, risk_weight) -> tuple[DecisionMatrix, np.ndarray]:
+    matrix = as_decision_matrix(options, criteria)
+    if matrix is None:
+        matrix = DecisionMatrix.from_evaluations(options, criteria)
+    values = matrix.expected if risk_weight is None else risk_adjusted_values(matrix, risk_weight)
+    # orient every column so that larger is better
+    return matrix, np.where(matrix.maximize, values, -values)
+
+
+# -------------------------
+# Index-level kernels
+# -------------------------
+def front_indices(points: np.ndarray, max_bytes: int = MAX_BYTES) -> np.ndarray:
+    """
+    Sorted indices of the rows of points (larger is better in every column)
+    that no other row dominates.
+    """
+    n, m = points.shape
+    if n == 0:
+        return np.arange(0)
+    if m <= 2:
+        return _front_2d(points if m == 2 else np.column_stack([points[:, 0], np.zeros(n)]))
+    if m == 3:
+        return _front_3d(points)
+    return _front_bnl(points, max_bytes)
+
+
+def layer_indices(
+    points: np.ndarray, max_layers: int | None = None, max_bytes: int = MAX_BYTES
+) -> list[np.ndarray]:
+    remaining = np.arange(len(points))
+    layers = []
+    while remaining.size and (max_layers is None or len(layers) < max_layers):
+        front = remaining[front_indices(points[remaining], max_bytes)]
+        layers.append(front)
+        remaining = np.setdiff1d(remaining, front, assume_unique=True)
+    return layers
+
+
+def _front_2d(points: np.ndarray) -> np.ndarray:
+    """O(n log n): sort by x then y descending and compare y with the running maximum"""
+    x, y = points[:, 0], points[:, 1]
+    order = np.lexsort((-y, -x))
+    xs, ys = x[order], y[order]
+    starts = np.flatnonzero(np.r_[True, xs[1:] != xs[:-1]])
+    group = np.cumsum(np.r_[True, xs[1:] != xs[:-1]]) - 1
+    running = np.maximum.accumulate(ys)
+    # best y among strictly larger x, and best y within the same x
+    previous = np.where(starts > 0, running[np.maximum(starts - 1, 0)], -np.inf)
+    dominated = (previous[group] >= ys) | (ys < ys[starts][group])
+    return np.sort(order[~dominated])
+
+
+def _front_3d(points: np.ndarray) -> np.ndarray:
+    """
+    O(n log n) sweep: visit x in descending groups and keep the 2D (y, z) front
+    of everything with a larger x as a staircase (y ascending, z descending).
+    """
+    order = np.lexsort((-points[:, 2], -points[:, 1], -points[:, 0]))
+    xs = points[order, 0]
+    bounds = np.flatnonzero(np.r_[True, xs[1:] != xs[:-1], True])
+    ys: list[float] = []
+    negzs: list[float] = []
+    keep = []
+    yz = points[:, 1:].tolist()
+    for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        group = order[start:end]
+        inner = group if end - start == 1 else group[_front_2d(points[group, 1:])]
+        survivors = []
+        for i in inner.tolist():
+            y, z = yz[i]
+            pos = bisect_left(ys, y)
+            if pos < len(ys) and -negzs[pos] >= z:
+                continue
+            survivors.append((i, y, z))
+        for i, y, z in survivors:
+            keep.append(i)
+            pos = bisect_left(ys, y)
+            if pos < len(ys) and -negzs[pos] >= z:
+                continue  # equal-x sibling already covers it in the staircase
+            hi = pos + 1 if pos < len(ys) and ys[pos] == y else pos
+            lo = bisect_left(negzs, -z, 0, pos)
+            ys[lo:hi] = [y]
+            negzs[lo:hi] = [-z]
+    return np.sort(np.array(keep, dtype=int))
+
+
+def _front_bnl(points: np.ndarray, max_bytes: int) -> np.ndarray:
+    """
+    Sort-filter block-nested-loop: presort by descending sum (ties broken
+    lexicographically) so dominators come first, then test blocks of candidates
+    against the front found so far. Comparison arrays stay under max_bytes.
+    """
+    n, m = points.shape
+    keys = [-points[:, j] for j in reversed(range(m))] + [-points.sum(axis=1)]
+    order = np.lexsort(keys)
+    block = max(1, int((max_bytes / 3) ** 0.5))
+    front: list[np.ndarray] = []
+    front_points = np.empty((0, m))
+    for start in range(0, n, block):
+        ids = order[start : start + block]
+        candidates = points[ids]
+        # the earliest front points have the largest sums and cull the most,
+        # so test against a small head first and shrink the block as we go
+        f = 0
+        while f < len(front_points) and len(ids):
+            step = 64 if f == 0 else block
+            alive = ~_dominated_by(candidates, front_points[f : f + step])
+            ids, candidates = ids[alive], candidates[alive]
+            f += step
+        # a dominated candidate's dominator is also a candidate, so survivors suffice
+        alive = ~_dominated_by(candidates, candidates)
+        front.append(ids[alive])
+        front_points = np.concatenate([front_points, candidates[alive]])
+    return np.sort(np.concatenate(front))
+
+
+def _dominated_by(candidates: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """For each candidate, whether some row of others dominates it"""
+    ge = np.ones((len(candidates), len(others)), dtype=bool)
+    gt = np.zeros_like(ge)
+    for j in range(candidates.shape[1]):
+        mine, theirs = candidates[:, j, None], others[None, :, j]
+        ge &= theirs >= mine
+        gt |= theirs > mine
+    return (ge & gt).any(axis=1)
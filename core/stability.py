@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+
+from core.models import OptionEvaluation, Criterion
+from core.scoring import evaluate_with_risk
+from core.strategies import Strategy
+
+MODES = ("proportional", "independent")
+
+
+@dataclass(frozen=True)
+class WeightInterval:
+    """
+    Range [lower, upper] over which one criterion's weight can move while
+    winner stays ranked first. lower_rival / upper_rival take over past
+    each bound, or are None when the bound is the edge of the weight range.
+    """
+    criterion: str
+    weight: float
+    lower: float
+    upper: float
+    winner: str
+    lower_rival: str | None
+    upper_rival: str | None
+
+
+class WeightStability:
+    """
+    Criterion-weight sensitivity on a fixed normalized (options x criteria) matrix.
+
+    Normalized values do not depend on the weights, so they are computed once
+    (by strategy.evaluate_detailed, or calculate_scores_with_risk by default)
+    and every weight vector is then a single matrix product away from scores.
+    """
+
+    def __init__(
+        self,
+        options: List[OptionEvaluation],
+        criteria: List[Criterion],
+        strategy: Strategy | None = None,
+        risk_weight: float = 0.5,
+    ):
+        if strategy is None:
+            evaluation = evaluate_with_risk(options, criteria, risk_weight)
+        else:
+            evaluation = strategy.evaluate_detailed(options, criteria, risk_weight=risk_weight)
+        if evaluation.normalized is None:
+            raise ValueError(f"{type(strategy).__name__} does not expose normalized values")
+        self.option_names = evaluation.option_names
+        self.criteria = list(criteria)
+        self.normalized = np.array(evaluation.normalized, dtype=float).T.reshape(
+            len(self.option_names), len(self.criteria)
+        )
+        self.weights = np.array([c.weight for c in self.criteria], dtype=float)
+
+    def scores(self, weights: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Scores for one (criteria,) weight vector or a (batch x criteria) array"""
+        return np.asarray(weights, dtype=float) @ self.normalized.T
+
+    def winners(self, weights: np.ndarray) -> np.ndarray:
+        """Index of the top option for every row of a (batch x criteria) weight array"""
+        return self.scores(np.atleast_2d(weights)).argmax(axis=1)
+
+    def sample(self, n_samples: int = 10_000, seed: int = 0, chunk_size: int = 10_000) -> dict[str, float]:
+        """
+        Probability of ranking first when the weights are drawn uniformly from the
+        simplex scaled to the current total weight, in chunks of chunk_size.
+        """
+        rng = np.random.default_rng(seed)
+        total = self.weights.sum()
+        wins = np.zeros(len(self.option_names), dtype=np.int64)
+        for start in range(0, n_samples, chunk_size):
+            size = min(chunk_size, n_samples - start)
+            batch = rng.dirichlet(np.ones(len(self.criteria)), size) * total
+            wins += np.bincount(self.winners(batch), minlength=len(self.option_names))
+        return dict(zip(self.option_names, (wins / n_samples).tolist()))
+
+    def intervals(self, mode: str = "proportional") -> list[WeightInterval]:
+        """
+        Exact stability interval of every criterion weight.
+        proportional: the other weights are rescaled to keep the total fixed;
+        independent: the other weights stay where they are.
+        Weights are bounded to [0, 1] as Criterion.validate requires. In
+        proportional mode that holds for the rescaled weights too: an interval
+        stops where the largest other weight would pass 1 (lowering the weight
+        scales the others up), and current weights outside [0, 1] are rejected.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Mode '{mode}' not found.")
+        bad = (self.weights < 0.0) | (self.weights > 1.0)
+        if mode == "proportional" and bad.any():
+            names = [self.criteria[j].name for j in np.flatnonzero(bad).tolist()]
+            raise ValueError(f"Criterion weight must be between 0 and 1: {names}")
+        return [self._interval(j, mode) for j in range(len(self.criteria))]
+
+    def _interval(self, j: int, mode: str) -> WeightInterval:
+        w = self.weights
+        column = self.normalized[:, j]
+        rest = self.normalized @ w - w[j] * column  # score without criterion j
+        total = w.sum()
+        if mode == "proportional" and total - w[j] > 0:
+            # others scale by (total - t) / (total - w_j), keeping the sum at total
+            scale = total - w[j]
+            intercept, slope = total * rest / scale, column - rest / scale
+            # t <= total keeps the others >= 0; the largest other reaches 1 at t = lo
+            others = np.delete(w, j)
+            lo = max(0.0, total - scale / others.max())
+            hi = min(1.0, total)
+        else:
+            intercept, slope = rest, column
+            lo, hi = 0.0, 1.0
+
+        # every score is the line intercept + slope * t; the winner at t = w_j
+        # stays first while none of the other lines crosses above it
+        winner = int(np.argmax(intercept + slope * w[j]))
+        gap = intercept[winner] - intercept
+        rate = slope[winner] - slope
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing = -gap / rate
+        # where the winner gains on k as t grows, k leads below the crossing
+        below = np.where(rate > 0, crossing, -np.inf)
+        above = np.where(rate < 0, crossing, np.inf)
+        k_low, k_high = int(np.argmax(below)), int(np.argmin(above))
+        lower, lower_rival = (below[k_low], k_low) if below[k_low] > lo else (lo, None)
+        upper, upper_rival = (above[k_high], k_high) if above[k_high] < hi else (hi, None)
+        names = self.option_names
+        return WeightInterval(
+            criterion=self.criteria[j].name,
+            weight=float(w[j]),
+            lower=float(min(lower, w[j])),
+            upper=float(max(upper, w[j])),
+            winner=names[winner],
+            lower_rival=None if lower_rival is None else names[lower_rival],
+            upper_rival=None if upper_rival is None else names[upper_rival],
+        )
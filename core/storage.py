@@ -0,0 +1,146 @@
+"""
+Versioned binary file for one decision problem, loaded by memory mapping.
+
+Layout (little-endian):
+    header   magic, version, flags, n_options, n_criteria and the
+             (offset, length) of the three sections below
+    metadata UTF-8 JSON: criteria (name, weight, maximize) and option
+             descriptions (null when no option has one)
+    names    UTF-8 option names joined by NUL
+    data     float64 array of shape (3, options, criteria) holding best,
+             expected and worst, aligned to 64 bytes
+
+open_problem maps the file read-only and views the data section in place,
+so loading costs the metadata and names only, and every process opening the
+same file shares its pages through the OS page cache.
+"""
+import json
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from core.models import Option, OptionEvaluation, Criterion
+from core.matrix import DecisionMatrix
+from core.scoring import as_decision_matrix
+
+MAGIC = b"DUUPROB\x00"
+VERSION = 1
+ALIGNMENT = 64
+_HEADER = struct.Struct("<8sIIQQ6Q")
+
+
+@dataclass(frozen=True, eq=False)
+class MappedMatrix(DecisionMatrix):
+    """
+    DecisionMatrix whose arrays are read-only views of a memory-mapped file.
+    Pickles as its path, so worker processes map the file instead of copying it.
+    """
+    path: str = ""
+    descriptions: tuple[str | None, ...] | None = None
+
+    def __reduce__(self):
+        return open_problem, (self.path,)
+
+    def to_evaluations(self) -> list[OptionEvaluation]:
+        """OptionEvaluation list including the stored option descriptions"""
+        options = list(self)
+        if self.descriptions is None:
+            return options
+        return [
+            OptionEvaluation(Option(opt.option.name, description), opt.outcomes)
+            for opt, description in zip(options, self.descriptions)
+        ]
+
+
+def save_problem(
+    path: str,
+    options: Sequence[OptionEvaluation] | DecisionMatrix,
+    criteria: Sequence[Criterion] | None = None,
+) -> None:
+    """
+    Write options (OptionEvaluation list or DecisionMatrix) and criteria to path.
+    The file is written next to path and renamed into place.
+    """
+    descriptions = None
+    matrix = as_decision_matrix(options, criteria)
+    if matrix is None:
+        descriptions = [opt.option.description for opt in options]
+        if all(d is None for d in descriptions):
+            descriptions = None
+        matrix = DecisionMatrix.from_evaluations(options, criteria)
+    elif isinstance(matrix, MappedMatrix) and matrix.descriptions is not None:
+        descriptions = list(matrix.descriptions)
+    if any(s is not None for s in getattr(matrix, "scenarios", ())):
+        raise ValueError("Binary problem files cannot store scenario outcomes")
+    if any("\x00" in name for name in matrix.option_names):
+        raise ValueError("Option names must not contain NUL characters")
+
+    metadata = json.dumps({
+        "criteria": [{"name": c.name, "weight": c.weight, "maximize": c.maximize} for c in matrix.criteria],
+        "descriptions": descriptions,
+    }).encode()
+    names = "\x00".join(matrix.option_names).encode()
+    meta_offset = _HEADER.size
+    names_offset = meta_offset + len(metadata)
+    data_offset = -(-(names_offset + len(names)) // ALIGNMENT) * ALIGNMENT
+    data_length = 3 * matrix.n_options * matrix.n_criteria * 8
+    header = _HEADER.pack(
+        MAGIC, VERSION, 0, matrix.n_options, matrix.n_criteria,
+        meta_offset, len(metadata), names_offset, len(names), data_offset, data_length,
+    )
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(metadata)
+        f.write(names)
+        f.write(b"\x00" * (data_offset - names_offset - len(names)))
+        for plane in (matrix.best, matrix.expected, matrix.worst):
+            f.write(np.ascontiguousarray(plane, dtype="<f8").tobytes())
+    os.replace(tmp, path)
+
+
+def open_problem(path: str) -> MappedMatrix:
+    """Map a file written by save_problem; best / expected / worst are zero-copy views"""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _HEADER.size:
+            raise ValueError(f"{path} is not a decision problem file")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    (
+        magic, version, _, n, m, meta_offset, meta_length, names_offset, names_length, data_offset, data_length
+    ) = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a decision problem file")
+    if version > VERSION:
+        raise ValueError(f"{path} has format version {version}; this reader supports up to {VERSION}")
+    if data_length != 3 * n * m * 8 or data_offset + data_length > size:
+        raise ValueError(f"{path} is truncated or corrupt")
+
+    metadata = json.loads(buffer[meta_offset : meta_offset + meta_length])
+    names = buffer[names_offset : names_offset + names_length].decode()
+    option_names = tuple(names.split("\x00")) if n else ()
+    criteria = metadata["criteria"]
+    data = np.frombuffer(buffer, dtype="<f8", count=3 * n * m, offset=data_offset).reshape(3, n, m)
+    descriptions = metadata["descriptions"]
+    return MappedMatrix(
+        option_names=option_names,
+        criterion_names=tuple(c["name"] for c in criteria),
+        best=data[0],
+        expected=data[1],
+        worst=data[2],
+        weights=np.array([c["weight"] for c in criteria], dtype=float),
+        maximize=np.array([c["maximize"] for c in criteria], dtype=bool),
+        path=os.path.abspath(path),
+        descriptions=None if descriptions is None else tuple(descriptions),
+    )
+
+
+def load_problem(path: str) -> tuple[list[OptionEvaluation], list[Criterion]]:
+    """The stored problem as core.models objects"""
+    matrix = open_problem(path)
+    return matrix.to_evaluations(), matrix.criteria
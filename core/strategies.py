@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict
 from core.models import OptionEvaluation, Criterion
-from core.scoring import calculate_scores_with_risk
-from core.normalization import normalize
+from core.scoring import (
+    calculate_scores_with_risk, evaluate_with_risk, as_decision_matrix, weighted_columns, Evaluation
+)
 
 # -------------------------
 # Base Strategy (Abstract)
 # -------------------------
 class Strategy(ABC):
+    # True when scores normalize expected - risk_weight * spread of every criterion in
+    # its direction, the values risk_aware_agent(prune_dominated=True) prunes on
+    risk_adjusted = False
+
     @abstractmethod
     def evaluate(
         self,
@@ -20,32 +25,158 @@ class Strategy(ABC):
         """
         pass
 
+    def cache_key(self) -> tuple:
+        """
+        Hashable identity of this strategy's scoring: its type plus any
+        configuration that changes scores. Problems are only batched, and
+        results only shared, between strategies with equal keys.
+        """
+        return (type(self).__module__, type(self).__qualname__)
+
+    def evaluate_detailed(
+        self,
+        options: List[OptionEvaluation],
+        criteria: List[Criterion],
+        risk_weight: float = 0.5
+    ) -> Evaluation:
+        """
+        Evaluate options in one pass and keep the per-criterion raw and
+        normalized values behind the scores. The default only has the scores.
+        """
+        return Evaluation(
+            option_names=tuple(opt.option.name for opt in options),
+            criterion_names=tuple(c.name for c in criteria),
+            scores=self.evaluate(options, criteria, risk_weight=risk_weight),
+        )
+
+    def evaluate_matrix(self, matrix, risk_weight: float = 0.5):
+        """
+        Evaluate a DecisionMatrix and return a score array aligned with
+        matrix.option_names. Subclasses override this with vectorized code;
+        the default runs evaluate() on the matrix rows.
+        """
+        import numpy as np
+        scores = self.evaluate(matrix.to_evaluations(), matrix.criteria, risk_weight=risk_weight)
+        return np.array([scores[name] for name in matrix.option_names], dtype=float)
+
+    def evaluate_sweep(self, matrix, risk_weights: List[float]):
+        """
+        Evaluate a DecisionMatrix for many risk weights and return a
+        (risk weights x options) score array. The default stacks evaluate_matrix.
+        """
+        import numpy as np
+        rows = [self.evaluate_matrix(matrix, risk_weight=rw) for rw in risk_weights]
+        return np.array(rows, dtype=float).reshape(len(rows), matrix.n_options)
+
+    def evaluate_samples(self, matrix, samples):
+        """
+        Score realized outcomes: samples is a (samples x options x criteria)
+        array, each slice read as a matrix with best == expected == worst.
+        Returns a (samples x options) score array. The default loops over slices.
+        """
+        import numpy as np
+        from core.matrix import DecisionMatrix
+        # realized slices are plain three-point matrices: any scenarios were sampled from
+        criteria = matrix.criteria
+        rows = [
+            self.evaluate_matrix(DecisionMatrix.from_arrays(matrix.option_names, criteria, values, values, values))
+            for values in samples
+        ]
+        return np.array(rows, dtype=float).reshape(len(samples), matrix.n_options)
+
+    def evaluate_padded(self, batch):
+        """
+        Evaluate a core.batch.PaddedBatch. Returns a (problems x max options)
+        score array and the (problems x max options x criteria) raw values
+        behind it; padded slots are ignored. The default evaluates each
+        problem's matrix in turn and reports the agent's direction-aware
+        risk-adjusted values (core.batch.explained_padded_values) as raw.
+        """
+        import numpy as np
+        from core.batch import explained_padded_values
+        scores = np.zeros(batch.mask.shape)
+        for p in range(len(batch)):
+            matrix = batch.matrix(p)
+            scores[p, : matrix.n_options] = self.evaluate_matrix(matrix, float(batch.risk_weights[p]))
+        return scores, explained_padded_values(batch)
+
 # -------------------------
 # Expected Value Strategy
 # -------------------------
 class ExpectedValueStrategy(Strategy):
+    risk_adjusted = True
+
     def evaluate(
         self, options: List[OptionEvaluation], criteria: List[Criterion], risk_weight: float = 0.5
     ) -> Dict[str, float]:
         return calculate_scores_with_risk(options, criteria, risk_weight)
 
+    def evaluate_detailed(
+        self, options: List[OptionEvaluation], criteria: List[Criterion], risk_weight: float = 0.5
+    ) -> Evaluation:
+        return evaluate_with_risk(options, criteria, risk_weight)
+
+    def evaluate_matrix(self, matrix, risk_weight: float = 0.5):
+        from core.matrix import risk_adjusted_scores
+        return risk_adjusted_scores(matrix, risk_weight)
+
+    def evaluate_sweep(self, matrix, risk_weights: List[float]):
+        from core.sweep import risk_adjusted_sweep
+        return risk_adjusted_sweep(matrix, risk_weights)
+
+    def evaluate_samples(self, matrix, samples):
+        from core.montecarlo import sample_scores
+        return sample_scores(matrix, samples)
+
+    def evaluate_padded(self, batch):
+        from core.batch import risk_adjusted_padded
+        return risk_adjusted_padded(batch)
+
 # -------------------------
 # Risk-Averse Strategy
 # -------------------------
 class RiskAverseStrategy(Strategy):
+    risk_adjusted = True
+
     def evaluate(
         self, options: List[OptionEvaluation], criteria: List[Criterion], risk_weight: float = 0.5
     ) -> Dict[str, float]:
-        scores = {opt.option.name: 0.0 for opt in options}
-        for criterion in criteria:
-            adjusted_values = [
-                opt.outcomes[criterion.name].expected - risk_weight * (opt.outcomes[criterion.name].best - opt.outcomes[criterion.name].worst)
-                for opt in options
-            ]
-            normalized_values = normalize(adjusted_values, maximize=criterion.maximize)
-            for opt, norm_val in zip(options, normalized_values):
-                scores[opt.option.name] += norm_val * criterion.weight
-        return scores
+        matrix = as_decision_matrix(options, criteria)
+        if matrix is not None:
+            return matrix.scores_dict(self.evaluate_matrix(matrix, risk_weight))
+        return self.evaluate_detailed(options, criteria, risk_weight).scores
+
+    def evaluate_detailed(
+        self, options: List[OptionEvaluation], criteria: List[Criterion], risk_weight: float = 0.5
+    ) -> Evaluation:
+        from dataclasses import replace
+        matrix = as_decision_matrix(options, criteria)
+        if matrix is not None:
+            from core.matrix import matrix_evaluation, risk_adjusted_values
+            evaluation = matrix_evaluation(matrix, risk_adjusted_values(matrix, risk_weight))
+        else:
+            evaluation = weighted_columns(
+                options,
+                criteria,
+                lambda outcomes: [out.expected - risk_weight * (out.best - out.worst) for out in outcomes],
+            )
+        return replace(evaluation, risk_adjusted=True)
+
+    def evaluate_matrix(self, matrix, risk_weight: float = 0.5):
+        from core.matrix import risk_adjusted_scores
+        return risk_adjusted_scores(matrix, risk_weight)
+
+    def evaluate_sweep(self, matrix, risk_weights: List[float]):
+        from core.sweep import risk_adjusted_sweep
+        return risk_adjusted_sweep(matrix, risk_weights)
+
+    def evaluate_samples(self, matrix, samples):
+        from core.montecarlo import sample_scores
+        return sample_scores(matrix, samples)
+
+    def evaluate_padded(self, batch):
+        from core.batch import risk_adjusted_padded
+        return risk_adjusted_padded(batch)
 
 # -------------------------
 # Regret Minimization Strategy
@@ -54,14 +185,107 @@ class RegretMinimizationStrategy(Strategy):
     def evaluate(
         self, options: List[OptionEvaluation], criteria: List[Criterion], risk_weight: float = 0.5
     ) -> Dict[str, float]:
-        scores = {opt.option.name: 0.0 for opt in options}
-        for criterion in criteria:
-            best_worst = max([opt.outcomes[criterion.name].worst for opt in options])
-            regrets = [max(0.0, best_worst - opt.outcomes[criterion.name].worst) for opt in options]
-            normalized = normalize(regrets, maximize=False)
-            for opt, norm_val in zip(options, normalized):
-                scores[opt.option.name] += norm_val * criterion.weight
-        return scores
+        matrix = as_decision_matrix(options, criteria)
+        if matrix is not None:
+            return matrix.scores_dict(self.evaluate_matrix(matrix, risk_weight))
+        return self.evaluate_detailed(options, criteria, risk_weight).scores
+
+    def evaluate_detailed(
+        self, options: List[OptionEvaluation], criteria: List[Criterion], risk_weight: float = 0.5
+    ) -> Evaluation:
+        matrix = as_decision_matrix(options, criteria)
+        if matrix is not None:
+            from core.matrix import matrix_evaluation, regret_values
+            return matrix_evaluation(matrix, regret_values(matrix), False)
+
+        def regrets(outcomes):
+            best_worst = max([out.worst for out in outcomes])
+            return [max(0.0, best_worst - out.worst) for out in outcomes]
+
+        # lower regret is better whatever the criterion's direction
+        return weighted_columns(options, criteria, regrets, maximize=False)
+
+    def evaluate_matrix(self, matrix, risk_weight: float = 0.5):
+        from core.matrix import regret_scores
+        return regret_scores(matrix)
+
+    def evaluate_sweep(self, matrix, risk_weights: List[float]):
+        # regret ignores risk_weight, so one evaluation serves every row
+        import numpy as np
+        return np.tile(self.evaluate_matrix(matrix), (len(risk_weights), 1))
+
+    def evaluate_samples(self, matrix, samples):
+        from core.montecarlo import sample_regret_scores
+        return sample_regret_scores(matrix, samples)
+
+    def evaluate_padded(self, batch):
+        from core.batch import regret_padded
+        return regret_padded(batch)
+
+# -------------------------
+# Scenario Regret Strategy
+# -------------------------
+class ScenarioRegretStrategy(Strategy):
+    """
+    Regret over the scenario vectors of core.scenarios: per criterion, every
+    option's regret in every scenario, aggregated by "max" (minimax regret) or
+    "expected" (probability-weighted, uniform by default). Criteria without
+    scenarios score like RegretMinimizationStrategy; options with scenarios
+    always reach the vectorized paths as a ScenarioMatrix.
+    """
+
+    def __init__(self, aggregation: str = "max", probabilities: List[float] | None = None):
+        if aggregation not in ("max", "expected"):
+            raise ValueError(f"Aggregation '{aggregation}' not found.")
+        self.aggregation = aggregation
+        self.probabilities = probabilities
+
+    def cache_key(self) -> tuple:
+        probabilities = None if self.probabilities is None else tuple(float(p) for p in self.probabilities)
+        return super().cache_key() + (self.aggregation, probabilities)
+
+    def evaluate(
+        self, options: List[OptionEvaluation], criteria: List[Criterion], risk_weight: float = 0.5
+    ) -> Dict[str, float]:
+        return self.evaluate_detailed(options, criteria, risk_weight).scores
+
+    def evaluate_detailed(
+        self, options: List[OptionEvaluation], criteria: List[Criterion], risk_weight: float = 0.5
+    ) -> Evaluation:
+        from core.matrix import matrix_evaluation
+        from core.scenarios import ScenarioMatrix, scenario_regret_values
+        matrix = as_decision_matrix(options, criteria)
+        if matrix is None:
+            from core.validation import validate_options
+            validate_options(options, criteria)
+            matrix = ScenarioMatrix.from_evaluations(options, criteria)
+        values = scenario_regret_values(matrix, self.aggregation, self.probabilities)
+        # lower regret is better whatever the criterion's direction
+        return matrix_evaluation(matrix, values, False)
+
+    def evaluate_matrix(self, matrix, risk_weight: float = 0.5):
+        from core.matrix import normalize_columns, weighted_sum
+        from core.scenarios import scenario_regret_values
+        values = scenario_regret_values(matrix, self.aggregation, self.probabilities)
+        return weighted_sum(normalize_columns(values, False), matrix.weights)
+
+    def evaluate_sweep(self, matrix, risk_weights: List[float]):
+        # scenario regret ignores risk_weight, so one evaluation serves every row
+        import numpy as np
+        return np.tile(self.evaluate_matrix(matrix), (len(risk_weights), 1))
+
+    def evaluate_padded(self, batch):
+        # regret anchors are per problem and per scenario, so each problem is scored on its own matrix
+        import numpy as np
+        from core.matrix import normalize_columns, weighted_sum
+        from core.scenarios import scenario_regret_values
+        scores, raw = np.zeros(batch.mask.shape), np.zeros(batch.best.shape)
+        for p in range(len(batch)):
+            matrix = batch.matrix(p)
+            values = scenario_regret_values(matrix, self.aggregation, self.probabilities)
+            scores[p, : matrix.n_options] = weighted_sum(normalize_columns(values, False), matrix.weights)
+            raw[p, : matrix.n_options] = values
+        return scores, raw
 
 # -------------------------
 # Strategy Factory (Modular & Dynamic)
@@ -73,9 +297,15 @@ class StrategyFactory:
     _mapping = {
         "expected_value": ExpectedValueStrategy,
         "risk_averse": RiskAverseStrategy,
-        "regret_minimization": RegretMinimizationStrategy
+        "regret_minimization": RegretMinimizationStrategy,
+        "scenario_regret": ScenarioRegretStrategy,
     }
 
+    @staticmethod
+    def names() -> list[str]:
+        """Registered strategy names, in registration order"""
+        return list(StrategyFactory._mapping)
+
     @staticmethod
     def get_strategy(name: str) -> Strategy:
         if name not in StrategyFactory._mapping:
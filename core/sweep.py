@@ -0,0 +1,65 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Iterator, Sequence
+
+import numpy as np
+
+from core.matrix import DecisionMatrix, normalize_columns
+
+
+@dataclass(frozen=True, eq=False)
+class SensitivitySweep:
+    """
+    Dense result of a risk-weight sweep.
+    scores has shape (risk weights, options), rows aligned with risk_weights.
+    """
+    risk_weights: np.ndarray
+    option_names: tuple[str, ...]
+    scores: np.ndarray
+
+    def as_dict(self) -> "SweepView":
+        """Lazy dict[float, dict[str, float]] view, same shape as sensitivity_analysis"""
+        return SweepView(self)
+
+    def winners(self) -> list[str]:
+        """Top-ranked option name for every risk weight"""
+        return [self.option_names[i] for i in self.scores.argmax(axis=1).tolist()]
+
+
+class SweepView(Mapping):
+    """
+    Read-only mapping risk_weight -> {option name: score}.
+    Rows are converted to dicts only when accessed.
+    """
+
+    def __init__(self, sweep: SensitivitySweep):
+        self._sweep = sweep
+        # later duplicates win, like repeated assignment in sensitivity_analysis
+        self._index = {rw: i for i, rw in enumerate(sweep.risk_weights.tolist())}
+
+    def __getitem__(self, risk_weight: float) -> dict[str, float]:
+        row = self._sweep.scores[self._index[risk_weight]]
+        return dict(zip(self._sweep.option_names, row.tolist()))
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+# -------------------------
+# Broadcast kernels
+# -------------------------
+def risk_adjusted_sweep(matrix: DecisionMatrix, risk_weights: Sequence[float]) -> np.ndarray:
+    """
+    Scores of calculate_scores_with_risk for every risk weight at once.
+    Loops over criteria only; each step works on a (weights x options) slab.
+    """
+    rw = np.asarray(risk_weights, dtype=float)[:, None]
+    spread = matrix.best - matrix.worst
+    scores = np.zeros((rw.shape[0], matrix.n_options))
+    for j, weight in enumerate(matrix.weights.tolist()):
+        values = matrix.expected[:, j] - rw * spread[:, j]
+        scores += normalize_columns(values, bool(matrix.maximize[j]), axis=1) * weight
+    return scores
@@ -1,8 +1,231 @@
-from core.agent import risk_aware_agent
-from core.strategies import RiskAverseStrategy
-from core.models import Option, OptionEvaluation, Outcome, Criterion
+"""
+Command-line entry point.
+
+    python main.py evaluate problems.jsonl --strategy risk_averse --top-k 3
+    python main.py evaluate outcomes.csv --criteria "salary:0.6:max,risk:0.4:min"
+    python main.py sweep problem.dmx --risk-weights 0,0.25,0.5,0.75,1 --plot sweep.png
+    python main.py demo
+
+Inputs: JSONL (one core.problems problem per line, "-" for stdin), CSV in long
+format (problem?, option, criterion, best, expected, worst; criteria given by
+--criteria), memory-mapped .dmx problem files (core.storage) or .npz arrays
+(option_names, criterion_names, weights, maximize, best, expected, worst). Results are written as JSON lines, one per problem, as
+soon as each is ready. Only the modules a command needs are imported, so NumPy
+and matplotlib stay unloaded unless --batch, sweep, binary input or --plot ask for them.
+"""
+import argparse
+import json
+import sys
+import time
+
+
+class Timings:
+    """Wall time per phase, reported on stderr with --timings"""
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+        self.problems = 0
+        self._start = time.perf_counter()
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def timed(self, phase: str, iterator):
+        """Charge the time spent producing each item of iterator to phase"""
+        iterator = iter(iterator)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(phase, time.perf_counter() - start)
+                return
+            self.add(phase, time.perf_counter() - start)
+            yield item
+
+    def report(self, stream) -> None:
+        total = time.perf_counter() - self._start
+        parts = "  ".join(f"{phase} {seconds * 1e3:.1f} ms" for phase, seconds in self.phases.items())
+        print(f"{self.problems} problem(s)  {parts}  total {total * 1e3:.1f} ms", file=stream)
+
+
+# -------------------------
+# Readers
+# -------------------------
+def detect_format(path: str, fmt: str | None) -> str:
+    if fmt is not None:
+        return fmt
+    for suffix, name in ((".jsonl", "jsonl"), (".json", "jsonl"), (".csv", "csv"), (".dmx", "dmx"), (".npz", "npz")):
+        if path.endswith(suffix):
+            return name
+    if path == "-":
+        return "jsonl"
+    raise ValueError(f"Cannot tell the format of '{path}', pass --format")
+
+
+def read_problems(path: str, fmt: str, criteria_spec: str | None):
+    """Yield (problem id, options, criteria, problem dict) one problem at a time"""
+    from core.problems import parse_criteria, problem_from_dict, problems_from_rows
+
+    criteria = parse_criteria(criteria_spec) if criteria_spec else None
+    if fmt == "jsonl":
+        stream = sys.stdin if path == "-" else open(path)
+        try:
+            for number, line in enumerate(stream, 1):
+                if not line.strip():
+                    continue
+                payload = json.loads(line)
+                options, parsed = problem_from_dict({"criteria": [], **payload})
+                yield payload.get("id", number), options, criteria or parsed, payload
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+    elif fmt == "csv":
+        import csv
+        if criteria is None:
+            raise ValueError("CSV input needs --criteria")
+        with open(path, newline="") as f:
+            for problem, options in problems_from_rows(csv.DictReader(f)):
+                yield problem, options, criteria, {}
+    elif fmt == "dmx":
+        from core.storage import open_problem
+        matrix = open_problem(path)
+        if criteria is not None:
+            matrix = matrix.with_criteria(criteria)
+        yield path, matrix, matrix.criteria, {}
+    elif fmt == "npz":
+        import numpy as np
+        from core.matrix import DecisionMatrix
+        with np.load(path) as data:
+            matrix = DecisionMatrix(
+                option_names=tuple(data["option_names"].tolist()),
+                criterion_names=tuple(data["criterion_names"].tolist()),
+                best=data["best"],
+                expected=data["expected"],
+                worst=data["worst"],
+                weights=data["weights"].astype(float),
+                maximize=data["maximize"].astype(bool),
+            )
+        if criteria is not None:
+            matrix = matrix.with_criteria(criteria)
+        yield path, matrix, matrix.criteria, {}
+    else:
+        raise ValueError(f"Format '{fmt}' not found.")
+
+
+# -------------------------
+# Commands
+# -------------------------
+def evaluate(args, timings: Timings, out) -> int:
+    start = time.perf_counter()
+    from core.strategies import StrategyFactory
+    from core.problems import result_to_dict
+    from core.agent import risk_aware_agent
+    timings.add("import", time.perf_counter() - start)
+
+    problems = read_problems(args.input, detect_format(args.input, args.format), args.criteria)
+    if not args.batch:
+        problems = timings.timed("read", problems)
+
+    def strategy_of(payload):
+        return StrategyFactory.get_strategy(args.strategy or payload.get("strategy", "expected_value"))
+
+    def risk_weight_of(payload):
+        return args.risk_weight if args.risk_weight is not None else float(payload.get("risk_weight", 0.5))
+
+    if args.batch:
+        start = time.perf_counter()
+        from core.batch import evaluate_batch
+        timings.add("import", time.perf_counter() - start)
+        ids = []
+
+        def batch_problems():
+            for problem_id, options, criteria, payload in problems:
+                ids.append(problem_id)
+                yield options, criteria, strategy_of(payload), risk_weight_of(payload)
+
+        # windows are read as they are evaluated, so the two phases are timed together
+        results = _with_ids(ids, timings.timed("read+evaluate", evaluate_batch(batch_problems(), window=args.window)))
+    else:
+        def agent_results():
+            for problem_id, options, criteria, payload in problems:
+                start = time.perf_counter()
+                result = risk_aware_agent(
+                    options, criteria, strategy_of(payload), risk_weight_of(payload), top_k=args.top_k
+                )
+                timings.add("evaluate", time.perf_counter() - start)
+                yield problem_id, result
+
+        results = agent_results()
+
+    for problem_id, result in results:
+        start = time.perf_counter()
+        payload = result_to_dict(result)
+        if args.top_k is not None:
+            payload["ranking"] = payload["ranking"][: args.top_k]
+        out.write(json.dumps({"id": problem_id, **payload}) + "\n")
+        timings.add("write", time.perf_counter() - start)
+        timings.problems += 1
+    return 0
+
+
+def _with_ids(ids: list, results):
+    """Pair streamed batch results with the ids recorded while their problems were read"""
+    for i, result in enumerate(results):
+        yield ids[i], result
+
+
+def sweep(args, timings: Timings, out) -> int:
+    start = time.perf_counter()
+    from core.strategies import StrategyFactory
+    from core.sensitivity import sensitivity_sweep
+    timings.add("import", time.perf_counter() - start)
+
+    risk_weights = [float(rw) for rw in args.risk_weights.split(",")]
+    problems = timings.timed("read", read_problems(args.input, detect_format(args.input, args.format), args.criteria))
+    for problem_id, options, criteria, payload in problems:
+        strategy = StrategyFactory.get_strategy(args.strategy or payload.get("strategy", "expected_value"))
+        start = time.perf_counter()
+        # all risk weights in one vectorized pass (Strategy.evaluate_sweep)
+        results = sensitivity_sweep(options, criteria, strategy, risk_weights).as_dict()
+        timings.add("evaluate", time.perf_counter() - start)
+        start = time.perf_counter()
+        rows = [{"risk_weight": rw, "scores": scores} for rw, scores in results.items()]
+        out.write(json.dumps({"id": problem_id, "sweep": rows}) + "\n")
+        timings.add("write", time.perf_counter() - start)
+        timings.problems += 1
+        if args.plot:
+            start = time.perf_counter()
+            plot_sweep(results, f"{problem_id}", args.plot.format(id=problem_id))
+            timings.add("plot", time.perf_counter() - start)
+    return 0
+
+
+def plot_sweep(results: dict, title: str, path: str) -> None:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    risk_weights = sorted(results)
+    figure = plt.figure()
+    for name in results[risk_weights[0]]:
+        plt.plot(risk_weights, [results[rw][name] for rw in risk_weights], marker="o", label=name)
+    plt.xlabel("Risk Weight")
+    plt.ylabel("Score")
+    plt.title(f"Sensitivity Analysis of {title}")
+    plt.legend()
+    plt.grid(True)
+    figure.savefig(path)
+    plt.close(figure)
+
+
+def demo(args, timings: Timings, out) -> int:
+    start = time.perf_counter()
+    from core.agent import risk_aware_agent
+    from core.strategies import RiskAverseStrategy
+    from core.models import Option, OptionEvaluation, Outcome, Criterion
+    timings.add("import", time.perf_counter() - start)
 
-if __name__ == "__main__":
     # define criteria
     criteria = [
         Criterion(name="salary", weight=0.6, maximize=True),
@@ -27,17 +250,67 @@ if __name__ == "__main__":
         ),
     ]
 
+    start = time.perf_counter()
     result = risk_aware_agent(
         options,
         criteria,
         strategy=RiskAverseStrategy(),
         risk_weight=0.5,
     )
+    timings.add("evaluate", time.perf_counter() - start)
 
+    start = time.perf_counter()
     for opt, bd in result["breakdown"].items():
-        print(f"Option: {opt}")
+        print(f"Option: {opt}", file=out)
         for crit, score in bd.items():
-            print(f"  {crit}: {score:.2f}")
-        print(f"  Total Score: {result['scores'][opt]:.3f}")
+            print(f"  {crit}: {score:.2f}", file=out)
+        print(f"  Total Score: {result['scores'][opt]:.3f}", file=out)
+
+    print("Ranking:", [r[0] for r in result["ranking"]], file=out)
+    timings.add("write", time.perf_counter() - start)
+    timings.problems += 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    timings = Timings()
+    parser = argparse.ArgumentParser(prog="python main.py")
+    commands = parser.add_subparsers(dest="command", required=True)
 
-    print("Ranking:", [r[0] for r in result["ranking"]])
\ No newline at end of file
+    def add_input(command):
+        command.add_argument("input", help="JSONL, CSV, .dmx or .npz file ('-' reads JSONL from stdin)")
+        command.add_argument("--format", choices=["jsonl", "csv", "dmx", "npz"])
+        command.add_argument("--criteria", help='override or supply criteria, e.g. "salary:0.6:max,risk:0.4:min"')
+        command.add_argument("--strategy", help="StrategyFactory name (default: per problem, else expected_value)")
+        command.add_argument("--output", default="-")
+        command.add_argument("--timings", action="store_true", help="report phase timings on stderr")
+
+    evaluate_parser = commands.add_parser("evaluate", help="rank every problem with risk_aware_agent")
+    add_input(evaluate_parser)
+    evaluate_parser.add_argument("--risk-weight", type=float)
+    evaluate_parser.add_argument("--top-k", type=int)
+    evaluate_parser.add_argument("--batch", action="store_true", help="pack problems into vectorized batches (NumPy)")
+    evaluate_parser.add_argument("--window", type=int, default=1_024, help="problems per batch window")
+    sweep_parser = commands.add_parser("sweep", help="scores over several risk weights")
+    add_input(sweep_parser)
+    sweep_parser.add_argument("--risk-weights", default="0,0.25,0.5,0.75,1")
+    sweep_parser.add_argument("--plot", help="save a chart of each sweep to this path; {id} is replaced by the problem id (matplotlib)")
+    demo_parser = commands.add_parser("demo", help="run the two-job example")
+    demo_parser.add_argument("--output", default="-")
+    demo_parser.add_argument("--timings", action="store_true", help="report phase timings on stderr")
+    args = parser.parse_args(argv)
+
+    command = {"evaluate": evaluate, "sweep": sweep, "demo": demo}[args.command]
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        status = command(args, timings, out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if args.timings:
+        timings.report(sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,406 @@
+"""
+Asyncio decision service with request micro-batching.
+
+    python -m service.server --port 8080
+    python -m service.server --unix /tmp/decisions.sock
+
+POST /decide takes one JSON problem and answers with the risk_aware_agent result;
+GET /stats reports the service counters. Concurrent requests are gathered into
+windows of at most max_batch requests or max_delay seconds, and every window is
+evaluated as one evaluate_batch call in an executor, off the event loop.
+"""
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from core.batch import Problem, evaluate_batch
+from core.instrumentation import Histogram
+from core.models import OptionEvaluation, Criterion
+from core.problems import problem_from_dict, result_to_dict
+from core.strategies import StrategyFactory
+
+
+class ServiceOverloaded(RuntimeError):
+    """Raised by DecisionService.submit when max_pending requests are already waiting"""
+
+
+@dataclass
+class ServiceStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    expired: int = 0
+    batches: int = 0
+    batched: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+    started_at: float = field(default_factory=time.monotonic)
+
+    def as_dict(self) -> dict:
+        uptime = time.monotonic() - self.started_at
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "expired": self.expired,
+            "batches": self.batches,
+            "mean_batch_size": self.batched / self.batches if self.batches else 0.0,
+            "mean_latency_seconds": self.latency.total / self.latency.count if self.latency.count else 0.0,
+            "throughput_per_second": self.completed / uptime if uptime > 0 else 0.0,
+        }
+
+
+@dataclass(eq=False)
+class _Pending:
+    problem: Problem
+    future: asyncio.Future
+    submitted_at: float
+    expires_at: float | None
+
+
+class DecisionService:
+    """
+    Gathers concurrent decision requests into micro-batches.
+
+    max_batch / max_delay bound a window by size and by the time its first
+    request waits; max_pending is the backpressure limit beyond which submit()
+    raises ServiceOverloaded; concurrency is the number of windows evaluated
+    at once in executor (a thread pool of that size by default).
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 256,
+        max_delay: float = 0.002,
+        max_pending: int = 10_000,
+        concurrency: int = 2,
+        default_deadline: float | None = None,
+        executor: Executor | None = None,
+    ):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.default_deadline = default_deadline
+        self.stats = ServiceStats()
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._concurrency = concurrency
+        self._queue: asyncio.Queue[_Pending] | None = None
+        self._pending = 0
+        self._slots: asyncio.Semaphore | None = None
+        self._batcher: asyncio.Task | None = None
+        self._windows: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        if self._batcher is not None:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self._concurrency)
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self._concurrency)
+        self._batcher = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop batching, let running windows finish and fail whatever is still queued"""
+        if self._batcher is None:
+            return
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        self._batcher = None
+        if self._windows:
+            await asyncio.gather(*self._windows, return_exceptions=True)
+        queued = []
+        while not self._queue.empty():
+            queued.append(self._queue.get_nowait())
+        self._fail(queued)
+        if self._owns_executor:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def __aenter__(self) -> "DecisionService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def submit(
+        self,
+        options: list[OptionEvaluation],
+        criteria: list[Criterion],
+        strategy,
+        risk_weight: float = 0.5,
+        deadline: float | None = None,
+    ) -> dict:
+        """
+        Queue one problem and wait for its risk_aware_agent-shaped result.
+        deadline (seconds, default default_deadline) raises TimeoutError when
+        exceeded; a request that expires before its window runs is not evaluated.
+        """
+        if self._batcher is None:
+            raise RuntimeError("DecisionService is not started")
+        if self._pending >= self.max_pending:
+            self.stats.rejected += 1
+            raise ServiceOverloaded(f"{self._pending} requests pending")
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        deadline = self.default_deadline if deadline is None else deadline
+        item = _Pending(
+            problem=(options, criteria, strategy, risk_weight),
+            future=loop.create_future(),
+            submitted_at=now,
+            expires_at=None if deadline is None else now + deadline,
+        )
+        self.stats.submitted += 1
+        self._pending += 1
+        self._queue.put_nowait(item)
+        if deadline is None:
+            return await item.future
+        try:
+            # shield: a timeout must not cancel the future the window resolves
+            return await asyncio.wait_for(asyncio.shield(item.future), deadline)
+        except TimeoutError:
+            self.stats.expired += 1
+            raise
+
+    # -------------------------
+    # Batching
+    # -------------------------
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        window: list[_Pending] = []
+        try:
+            while True:
+                window = [await self._queue.get()]
+                closes_at = loop.time() + self.max_delay
+                while len(window) < self.max_batch:
+                    if not self._queue.empty():
+                        window.append(self._queue.get_nowait())
+                        continue
+                    remaining = closes_at - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        window.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except TimeoutError:
+                        break
+                await self._slots.acquire()
+                task = asyncio.create_task(self._evaluate(window))
+                self._windows.add(task)
+                task.add_done_callback(self._windows.discard)
+                window = []
+        except asyncio.CancelledError:
+            self._fail(window)
+            raise
+
+    def _fail(self, items: list[_Pending]) -> None:
+        self._pending -= len(items)
+        for item in items:
+            if not item.future.done():
+                item.future.set_exception(RuntimeError("DecisionService stopped"))
+
+    async def _evaluate(self, window: list[_Pending]) -> None:
+        loop = asyncio.get_running_loop()
+        live: list[_Pending] = []
+        try:
+            now = loop.time()
+            live = [
+                item for item in window
+                if not item.future.done() and (item.expires_at is None or item.expires_at > now)
+            ]
+            if not live:
+                return
+            self.stats.batches += 1
+            self.stats.batched += len(live)
+            outcomes = await loop.run_in_executor(self._executor, _evaluate_window, [i.problem for i in live])
+            now = loop.time()
+            for item, (result, error) in zip(live, outcomes):
+                if item.future.done():
+                    continue
+                if error is not None:
+                    self.stats.failed += 1
+                    item.future.set_exception(error)
+                else:
+                    self.stats.completed += 1
+                    self.stats.latency.observe(now - item.submitted_at)
+                    item.future.set_result(result)
+        except Exception as error:
+            # never leave a request waiting on a window that failed as a whole
+            for item in live:
+                if not item.future.done():
+                    self.stats.failed += 1
+                    item.future.set_exception(error)
+        finally:
+            # pending counts requests until their window is done, so backpressure
+            # also covers work already handed to the executor
+            self._pending -= len(window)
+            self._slots.release()
+
+
+def _evaluate_window(problems: list[Problem]) -> list[tuple[dict | None, Exception | None]]:
+    """
+    Evaluate one window as a single batch. When a problem is invalid the
+    window is retried one problem at a time so the error stays with its request.
+    """
+    try:
+        return [(result, None) for result in evaluate_batch(problems, window=len(problems))]
+    except Exception:
+        pass
+    outcomes = []
+    for problem in problems:
+        try:
+            outcomes.append((next(evaluate_batch([problem])), None))
+        except Exception as error:
+            outcomes.append((None, error))
+    return outcomes
+
+
+# -------------------------
+# JSON payloads
+# -------------------------
+def parse_problem(payload: dict) -> tuple[Problem, float | None]:
+    """
+    Read one request body: a core.problems.problem_from_dict problem plus
+    optional "strategy" (default expected_value), "risk_weight" and "deadline" (seconds)
+    """
+    options, criteria = problem_from_dict(payload)
+    strategy = StrategyFactory.get_strategy(payload.get("strategy", "expected_value"))
+    deadline = payload.get("deadline")
+    problem = (options, criteria, strategy, float(payload.get("risk_weight", 0.5)))
+    return problem, None if deadline is None else float(deadline)
+
+
+# -------------------------
+# HTTP
+# -------------------------
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 429: "Too Many Requests", 503: "Service Unavailable", 504: "Gateway Timeout",
+}
+MAX_BODY = 16 * 2**20
+
+
+async def serve(
+    service: DecisionService,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    path: str | None = None,
+) -> asyncio.AbstractServer:
+    """Start a minimal HTTP/1.1 server for service on host:port, or on the Unix socket path"""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, body = request
+                status, payload = await _dispatch(service, method, target, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                _write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    if path is not None:
+        return await asyncio.start_unix_server(handle, path=path)
+    return await asyncio.start_server(handle, host=host, port=port)
+
+
+async def _read_request(reader: asyncio.StreamReader):
+    line = await reader.readline()
+    if not line:
+        return None
+    method, target, _ = line.decode("latin-1").split(" ", 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if length > MAX_BODY:
+        raise ValueError("request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method, target, headers, body
+
+
+async def _dispatch(service: DecisionService, method: str, target: str, body: bytes) -> tuple[int, dict]:
+    if target == "/stats":
+        if method != "GET":
+            return 405, {"error": "use GET"}
+        return 200, service.stats.as_dict()
+    if target != "/decide":
+        return 404, {"error": f"no route {target}"}
+    if method != "POST":
+        return 405, {"error": "use POST"}
+    try:
+        problem, deadline = parse_problem(json.loads(body))
+        result = await service.submit(*problem, deadline=deadline)
+    except ServiceOverloaded as error:
+        return 429, {"error": str(error)}
+    except TimeoutError:
+        return 504, {"error": "deadline exceeded"}
+    except (ValueError, KeyError, TypeError) as error:
+        return 400, {"error": f"{type(error).__name__}: {error}"}
+    except RuntimeError as error:
+        return 503, {"error": str(error)}
+    return 200, result_to_dict(result)
+
+
+def _write_response(writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool) -> None:
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m service.server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--max-delay", type=float, default=0.002, help="seconds a window stays open")
+    parser.add_argument("--max-pending", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=2)
+    parser.add_argument("--deadline", type=float, help="default per-request deadline in seconds")
+    args = parser.parse_args(argv)
+
+    async def run() -> None:
+        async with DecisionService(
+            max_batch=args.max_batch,
+            max_delay=args.max_delay,
+            max_pending=args.max_pending,
+            concurrency=args.concurrency,
+            default_deadline=args.deadline,
+        ) as service:
+            server = await serve(service, args.host, args.port, args.unix)
+            async with server:
+                await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
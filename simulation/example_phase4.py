@@ -1,5 +1,5 @@
 from core.models import Option, Outcome, OptionEvaluation, Criterion
-from core.strategies import ExpectedValueStrategy, RiskAverseStrategy, RegretMinimizationStrategy
+from core.fused import compare_strategies
 
 options = [
     OptionEvaluation(
@@ -18,11 +18,12 @@ criteria = [
     Criterion("risk", 0.2, False)
 ]
 
-strategies = [ExpectedValueStrategy(), RiskAverseStrategy(), RegretMinimizationStrategy()]
+# one fused pass instead of one evaluate() per strategy
+comparison = compare_strategies(
+    options, criteria, ["expected_value", "risk_averse", "regret_minimization"], risk_weight=0.5
+)
 
-for strat in strategies:
-    print(f"--- {strat.__class__.__name__} ---")
-    scores = strat.evaluate(options, criteria, risk_weight=0.5)
-    ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-    for name, score in ranked:
-        print(f"{name}: {score:.3f}")
+for name, ranked in comparison.rankings().items():
+    print(f"--- {name} ---")
+    for option, score in ranked:
+        print(f"{option}: {score:.3f}")
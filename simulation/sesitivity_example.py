@@ -1,7 +1,6 @@
-from core.agent import risk_aware_agent
+from core.sensitivity import sensitivity_sweep
 from core.models import Option, OptionEvaluation, Outcome, Criterion
 from core.strategies import RiskAverseStrategy
-import matplotlib.pyplot as plt
 
 # --- Options & Criteria ---
 options = [
@@ -22,13 +21,13 @@ criteria = [
 ]
 
 # --- Sensitivity Analysis ---
-results = {}
-for rw in [i/10 for i in range(0,11)]:
-    res = risk_aware_agent(options, criteria, strategy=RiskAverseStrategy(), risk_weight=rw)
-    results[rw] = res["scores"]
+sweep = sensitivity_sweep(options, criteria, RiskAverseStrategy(), risk_weights=[i/10 for i in range(0,11)])
+results = sweep.as_dict()
 
 # --- Visualization ---
 def plot_sensitivity(results, options):
+    import matplotlib.pyplot as plt  # only needed for the chart
+
     risk_weights = sorted(results.keys())
     for opt in options:
         scores = [results[rw][opt] for rw in risk_weights]
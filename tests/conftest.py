@@ -0,0 +1,37 @@
+import random
+
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+
+
+def random_options(
+    rng, n_options, criteria, low=-50.0, high=50.0, spread=20.0, step=None, option=lambda i: Option(f"opt{i}")
+):
+    """
+    n_options evaluations over criteria: worst in [low, high], expected and best
+    each up to spread above the previous value. With step, values lie on a grid
+    of that spacing, so ties and constant columns are common.
+    """
+    def draw(a, b):
+        if step is None:
+            return rng.uniform(a, b)
+        return rng.randint(round(a / step), round(b / step)) * step
+
+    options = []
+    for i in range(n_options):
+        outcomes = {}
+        for c in criteria:
+            worst = draw(low, high)
+            expected = worst + draw(0, spread)
+            outcomes[c.name] = Outcome(expected + draw(0, spread), expected, worst)
+        options.append(OptionEvaluation(option(i), outcomes))
+    return options
+
+
+def random_problem(n_options=8, n_criteria=4, seed=0, weights=(0.05, 0.5), **kwargs):
+    """
+    Seeded (options, criteria) with criteria c0, c1, ... of random direction and
+    a weight drawn from weights; kwargs go to random_options.
+    """
+    rng = random.Random(seed)
+    criteria = [Criterion(f"c{j}", rng.uniform(*weights), rng.random() < 0.5) for j in range(n_criteria)]
+    return random_options(rng, n_options, criteria, **kwargs), criteria
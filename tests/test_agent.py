@@ -36,3 +36,99 @@ def test_risk_aware_agent():
     assert "A" in result["scores"]
     assert "B" in result["scores"]
     assert len(result["ranking"]) == 2
+
+
+def test_risk_aware_agent_top_k():
+    options = [
+        OptionEvaluation(
+            option=Option(name=f"O{i}"),
+            outcomes={
+                "salary": Outcome(best=10 + i, expected=8 + (i * 7) % 5, worst=5),
+                "growth": Outcome(best=6, expected=5 - (i % 3), worst=4),
+            },
+        )
+        for i in range(12)
+    ]
+    criteria = [
+        Criterion(name="salary", weight=0.6, maximize=True),
+        Criterion(name="growth", weight=0.4, maximize=True),
+    ]
+
+    full = risk_aware_agent(options, criteria, strategy=RiskAverseStrategy(), risk_weight=0.5)
+    top = risk_aware_agent(options, criteria, strategy=RiskAverseStrategy(), risk_weight=0.5, top_k=3)
+
+    assert top["ranking"] == full["ranking"][:3]
+    assert set(top["breakdown"]) == {name for name, _ in top["ranking"]}
+    assert top["scores"] == full["scores"]
+    assert "pruned" not in top
+
+
+def test_risk_aware_agent_prunes_dominated():
+    options = [
+        OptionEvaluation(option=Option("A"), outcomes={"salary": Outcome(10, 8, 6), "cost": Outcome(3, 2, 1)}),
+        OptionEvaluation(option=Option("B"), outcomes={"salary": Outcome(9, 7, 5), "cost": Outcome(4, 3, 2)}),
+        OptionEvaluation(option=Option("C"), outcomes={"salary": Outcome(14, 11, 8), "cost": Outcome(6, 5, 4)}),
+        OptionEvaluation(option=Option("D"), outcomes={"salary": Outcome(10, 8, 6), "cost": Outcome(3, 2, 1)}),
+    ]
+    criteria = [
+        Criterion(name="salary", weight=0.5, maximize=True),
+        Criterion(name="cost", weight=0.5, maximize=False),
+    ]
+
+    result = risk_aware_agent(
+        options, criteria, strategy=RiskAverseStrategy(), risk_weight=0.5, prune_dominated=True
+    )
+
+    # B is worse than A on both criteria; A and D tie, so neither dominates
+    assert result["pruned"] == 1
+    assert list(result["scores"]) == ["A", "C", "D"]
+
+
+def test_pruning_leaves_other_strategies_alone():
+    from core.strategies import StrategyFactory
+
+    options = [
+        OptionEvaluation(option=Option("A"), outcomes={"salary": Outcome(30, 20, 5)}),
+        OptionEvaluation(option=Option("R"), outcomes={"salary": Outcome(7, 6, 6)}),
+        OptionEvaluation(option=Option("B"), outcomes={"salary": Outcome(12, 9, 4)}),
+    ]
+    criteria = [Criterion(name="salary", weight=1.0)]
+    regret = StrategyFactory.get_strategy("regret_minimization")
+
+    # R is dominated on risk-adjusted values (5.5 < 7.5) but has the smallest regret
+    assert risk_aware_agent(options, criteria, RiskAverseStrategy(), prune_dominated=True)["pruned"] == 2
+    pruned = risk_aware_agent(options, criteria, regret, prune_dominated=True)
+    assert pruned["pruned"] == 0
+    assert pruned["ranking"][0][0] == "R"
+    assert pruned["scores"] == risk_aware_agent(options, criteria, regret)["scores"]
+
+
+def test_breakdown_follows_strategy():
+    import pickle
+    from core.strategies import StrategyFactory, Strategy
+
+    options = [
+        OptionEvaluation(option=Option("A"), outcomes={"salary": Outcome(10, 8, 6), "cost": Outcome(3, 2, 1)}),
+        OptionEvaluation(option=Option("B"), outcomes={"salary": Outcome(9, 7, 2), "cost": Outcome(4, 3, 2)}),
+    ]
+    criteria = [
+        Criterion(name="salary", weight=0.5, maximize=True),
+        Criterion(name="cost", weight=0.5, maximize=False),
+    ]
+
+    risk = risk_aware_agent(options, criteria, strategy=RiskAverseStrategy(), risk_weight=0.5)
+    assert risk["breakdown"]["B"] == {"salary": 7 - 0.5 * 7, "cost": 3 + 0.5 * 2}
+
+    regret = risk_aware_agent(
+        options, criteria, strategy=StrategyFactory.get_strategy("regret_minimization"), risk_weight=0.5
+    )
+    assert regret["breakdown"] == {"A": {"salary": 0.0, "cost": 1.0}, "B": {"salary": 4.0, "cost": 0.0}}
+
+    class Plain(Strategy):
+        def evaluate(self, options, criteria, risk_weight=0.5):
+            return {opt.option.name: 0.0 for opt in options}
+
+    plain = risk_aware_agent(options, criteria, strategy=Plain(), risk_weight=0.5)
+    assert plain["breakdown"]["A"] == {"salary": 8 - 0.5 * 4, "cost": 2 + 0.5 * 2}
+    assert plain["breakdown"]["A"] == risk["breakdown"]["A"]
+    assert pickle.loads(pickle.dumps(plain["breakdown"])) == plain["breakdown"]
@@ -0,0 +1,87 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.agent import risk_aware_agent
+from core.batch import evaluate_batch
+from core.strategies import Strategy, StrategyFactory
+from conftest import random_options
+
+
+def random_problems(n_problems=60, seed=0):
+    rng = random.Random(seed)
+    shared = [Criterion("salary", 0.6, True), Criterion("risk", 0.4, False)]
+    problems = []
+    for p in range(n_problems):
+        if p % 7 == 0:
+            criteria = [Criterion(f"c{p}", 1.0, rng.random() < 0.5)]
+        else:
+            criteria = shared
+        strategy = StrategyFactory.get_strategy(
+            rng.choice(["expected_value", "risk_averse", "regret_minimization"])
+        )
+        options = random_options(rng, rng.randint(1, 8), criteria)
+        problems.append((options, criteria, strategy, rng.choice([0.0, 0.25, 0.5, 1.0])))
+    return problems
+
+
+def test_batch_matches_agent_in_order():
+    problems = random_problems()
+    results = list(evaluate_batch(problems, window=16))
+    assert len(results) == len(problems)
+    for problem, result in zip(problems, results):
+        assert result == risk_aware_agent(*problem)
+
+
+def test_batch_ties_keep_input_order():
+    criteria = [Criterion("c", 1.0)]
+    same = {"c": Outcome(3, 2, 1)}
+    options = [OptionEvaluation(Option(name), same) for name in "ABC"]
+    problems = [(options, criteria, StrategyFactory.get_strategy("risk_averse"), 0.5)] * 2
+    for result in evaluate_batch(problems):
+        assert [name for name, _ in result["ranking"]] == ["A", "B", "C"]
+
+
+def test_batch_custom_strategy_uses_default_padded_path():
+    class ReversedExpected(Strategy):
+        def evaluate(self, options, criteria, risk_weight=0.5):
+            return {opt.option.name: -sum(opt.outcomes[c.name].expected for c in criteria) for opt in options}
+
+    rng = random.Random(3)
+    criteria = [Criterion("c", 1.0)]
+    problems = [(random_options(rng, 4, criteria), criteria, ReversedExpected(), 0.5) for _ in range(3)]
+    for problem, result in zip(problems, evaluate_batch(problems)):
+        assert result == risk_aware_agent(*problem)
+
+
+def test_batch_worker_pool():
+    problems = random_problems(n_problems=20, seed=1)
+    assert list(evaluate_batch(problems, workers=2)) == [risk_aware_agent(*p) for p in problems]
+
+
+def test_batch_validates_problems():
+    criteria = [Criterion("c", 1.0), Criterion("d", 1.0)]
+    options = [OptionEvaluation(Option("A"), {"c": Outcome(3, 2, 1)})]
+    with pytest.raises(ValueError):
+        list(evaluate_batch([(options, criteria, StrategyFactory.get_strategy("risk_averse"), 0.5)]))
+
+
+def test_batch_keeps_differently_wrapped_strategies_apart():
+    from core.cache import CachedStrategy
+
+    rng = random.Random(4)
+    criteria = [Criterion("salary", 0.6, True), Criterion("risk", 0.4, False)]
+    wrapped = [
+        CachedStrategy(StrategyFactory.get_strategy("risk_averse")),
+        CachedStrategy(StrategyFactory.get_strategy("regret_minimization")),
+        CachedStrategy(CachedStrategy(StrategyFactory.get_strategy("regret_minimization"))),
+        CachedStrategy(StrategyFactory.get_strategy("regret_minimization"), namespace="v2"),
+    ]
+    assert len({s.cache_key() for s in wrapped}) == len(wrapped)
+    problems = [(random_options(rng, 5, criteria), criteria, wrapped[i % 4], 0.5) for i in range(12)]
+    for problem, result in zip(problems, evaluate_batch(problems)):
+        expected = risk_aware_agent(*problem)
+        assert result["ranking"] == expected["ranking"]
+        assert result["scores"] == pytest.approx(expected["scores"])
@@ -0,0 +1,35 @@
+import json
+import pytest
+
+pytest.importorskip("numpy")
+
+from benchmarks import suite
+
+
+def test_run_and_compare(monkeypatch, tmp_path, capsys):
+    monkeypatch.setitem(suite.PROFILES, "tiny", {"options": [5], "criteria": [2], "repeats": 1})
+    result = suite.run("tiny")
+    cases = result["results"]
+    assert "risk_aware_agent/objects/n=5/m=2" in cases
+    assert "risk_aware_agent/matrix/n=5/m=2" not in cases
+    assert {f"strategy:{name}/matrix/n=5/m=2" for name in suite.StrategyFactory.names()} <= set(cases)
+    assert all(r["seconds"] >= 0 and r["peak_bytes"] >= 0 for r in cases.values())
+
+    slower = json.loads(json.dumps(result))
+    case = "calculate_scores/objects/n=5/m=2"
+    slower["results"][case]["seconds"] = cases[case]["seconds"] * 2 + 1e-6
+    assert [r["case"] for r in suite.compare(result, slower, threshold=0.5)] == [case]
+    assert suite.compare(result, result) == []
+
+    base, current = tmp_path / "base.json", tmp_path / "current.json"
+    base.write_text(json.dumps(result))
+    current.write_text(json.dumps(slower))
+    assert suite.main(["compare", str(base), str(current), "--threshold", "0.5"]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_workloads_are_seeded():
+    a, b = suite.make_matrix(20, 3, seed=1), suite.make_matrix(20, 3, seed=1)
+    assert (a.best == b.best).all() and a.criteria == b.criteria
+    assert sum(c.weight for c in a.criteria) == pytest.approx(1.0)
+    a.validate()
@@ -0,0 +1,78 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.breakpoints import rank_breakpoints
+from core.scoring import calculate_scores_with_risk
+from conftest import random_problem
+
+
+def test_single_reversal_is_exact():
+    options = [
+        OptionEvaluation(option=Option("A"), outcomes={"c": Outcome(10, 8, 5)}),
+        OptionEvaluation(option=Option("B"), outcomes={"c": Outcome(8, 7, 6)})
+    ]
+    profile = rank_breakpoints(options, [Criterion("c", 1.0)])
+    # 8 - 5r = 7 - 2r at r = 1/3, where both anchors switch option as well
+    assert len(profile.breakpoints) == 1
+    bp = profile.breakpoints[0]
+    assert bp.risk_weight == pytest.approx(1 / 3)
+    assert bp.anchors == ("c",)
+    assert bp.swaps == (("B", "A"),)
+    assert profile.ranking_at(0.0) == ("A", "B")
+    assert profile.ranking_at(1.0) == ("B", "A")
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_intervals_match_sampled_rankings(seed):
+    options, criteria = random_problem(8, 3, seed=seed, weights=(0, 1))
+    profile = rank_breakpoints(options, criteria)
+    assert profile.intervals[0].start == 0.0 and profile.intervals[-1].end == 1.0
+    for interval in profile.intervals:
+        mid = (interval.start + interval.end) / 2
+        scores = calculate_scores_with_risk(options, criteria, mid)
+        assert interval.ranking == tuple(sorted(scores, key=scores.get, reverse=True))
+
+
+def test_reversals_change_ranking():
+    options, criteria = random_problem(12, 3, seed=42, weights=(0, 1))
+    profile = rank_breakpoints(options, criteria)
+    for bp in profile.reversals:
+        assert profile.ranking_at(bp.risk_weight - 1e-9) != profile.ranking_at(bp.risk_weight)
+
+
+def test_invalid_range():
+    options, criteria = random_problem(2, 3, weights=(0, 1))
+    with pytest.raises(ValueError):
+        rank_breakpoints(options, criteria, lo=1.0, hi=0.0)
+
+
+def tied_problem(seed, n_options=7):
+    """Integer outcomes; some criteria have all values tied at r = 0, 0.5 or 1"""
+    rng = random.Random(seed)
+    criteria = [Criterion(f"c{j}", rng.randint(1, 4) / 4, rng.random() < 0.5) for j in range(3)]
+    ties = [rng.choice([None, 0.0, 0.5, 1.0]) for _ in criteria]
+    options = []
+    for i in range(n_options):
+        outcomes = {}
+        for c, tie in zip(criteria, ties):
+            spread = 2 * rng.randint(0, 5)
+            expected = rng.randint(-5, 5) if tie is None else 3 + tie * spread
+            worst = expected - rng.randint(0, spread)
+            outcomes[c.name] = Outcome(worst + spread, expected, worst)
+        options.append(OptionEvaluation(Option(f"opt{i}"), outcomes))
+    return options, criteria
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_rankings_at_tied_points_match_brute_force(seed):
+    options, criteria = tied_problem(seed)
+    profile = rank_breakpoints(options, criteria)
+    # a grid holding the tie points 0, 0.5 and 1 exactly
+    for r in [i / 40 for i in range(41)]:
+        scores = calculate_scores_with_risk(options, criteria, r)
+        ranked = [scores[name] for name in profile.ranking_at(r)]
+        # ties may come in either order; anything else must be descending
+        assert all(a >= b - 1e-9 for a, b in zip(ranked, ranked[1:])), r
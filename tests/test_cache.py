@@ -0,0 +1,135 @@
+import pytest
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.cache import CachedStrategy, fingerprint
+from core.strategies import Strategy, StrategyFactory, RiskAverseStrategy
+
+options = [
+    OptionEvaluation(
+        option=Option("A"),
+        outcomes={"salary": Outcome(120, 100, 80), "growth": Outcome(10, 7, 5), "risk": Outcome(5, 7, 10)}
+    ),
+    OptionEvaluation(
+        option=Option("B"),
+        outcomes={"salary": Outcome(110, 95, 80), "growth": Outcome(12, 8, 4), "risk": Outcome(3, 5, 8)}
+    ),
+]
+
+criteria = [
+    Criterion("salary", 0.5, True),
+    Criterion("growth", 0.3, True),
+    Criterion("risk", 0.2, False)
+]
+
+
+class CountingStrategy(Strategy):
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, options, criteria, risk_weight=0.5):
+        self.calls += 1
+        return RiskAverseStrategy().evaluate(options, criteria, risk_weight)
+
+
+def test_fingerprint_is_content_based():
+    strat = RiskAverseStrategy()
+    copy = [OptionEvaluation(Option(o.option.name), dict(o.outcomes)) for o in options]
+    assert fingerprint(options, criteria, strat, 0.5) == fingerprint(copy, criteria, strat, 0.5)
+    assert fingerprint(options, criteria, strat, 0.5) != fingerprint(options, criteria, strat, 0.6)
+    assert fingerprint(options, criteria, strat, 0.5) != fingerprint(options, criteria[:2], strat, 0.5)
+    assert fingerprint(options, criteria, strat, 0.5) != fingerprint(
+        options, criteria, StrategyFactory.get_strategy("expected_value"), 0.5
+    )
+    assert fingerprint(options, criteria, strat, 0.5) != fingerprint(options, criteria, strat, 0.5, "v2")
+
+
+def test_hits_and_misses():
+    inner = CountingStrategy()
+    cached = CachedStrategy(inner)
+    first = cached.evaluate(options, criteria, risk_weight=0.5)
+    second = cached.evaluate(options, criteria, risk_weight=0.5)
+    assert first == second == RiskAverseStrategy().evaluate(options, criteria, 0.5)
+    assert inner.calls == 1
+    assert (cached.stats.hits, cached.stats.misses) == (1, 1)
+    # returned dicts are copies
+    first["A"] = -1.0
+    assert cached.evaluate(options, criteria, risk_weight=0.5)["A"] != -1.0
+
+
+def test_lru_and_ttl_eviction():
+    now = [0.0]
+    inner = CountingStrategy()
+    cached = CachedStrategy(inner, max_entries=2, ttl=10, clock=lambda: now[0])
+    for rw in (0.1, 0.2, 0.3):
+        cached.evaluate(options, criteria, risk_weight=rw)
+    assert len(cached) == 2 and cached.stats.evictions == 1
+    cached.evaluate(options, criteria, risk_weight=0.1)
+    assert inner.calls == 4
+
+    now[0] = 11.0
+    cached.evaluate(options, criteria, risk_weight=0.3)
+    assert inner.calls == 5 and cached.stats.expirations == 1
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    inner = CountingStrategy()
+    CachedStrategy(inner, directory=str(tmp_path)).evaluate(options, criteria, 0.5)
+    restarted = CachedStrategy(inner, directory=str(tmp_path))
+    scores = restarted.evaluate(options, criteria, 0.5)
+    assert inner.calls == 1
+    assert restarted.stats.disk_hits == 1
+    assert scores == RiskAverseStrategy().evaluate(options, criteria, 0.5)
+
+
+def test_matrix_fingerprint_matches_content():
+    np = pytest.importorskip("numpy")
+    from core.matrix import DecisionMatrix
+    strat = RiskAverseStrategy()
+    matrix = DecisionMatrix.from_evaluations(options, criteria)
+    assert fingerprint(matrix, criteria, strat) == fingerprint(
+        DecisionMatrix.from_evaluations(options, criteria), None, strat
+    )
+    cached = CachedStrategy(strat)
+    assert cached.evaluate(matrix, criteria) == strat.evaluate(options, criteria)
+
+
+def test_hit_keeps_intermediates(tmp_path):
+    strat = StrategyFactory.get_strategy("regret_minimization")
+    reference = strat.evaluate_detailed(options, criteria, 0.5)
+    cached = CachedStrategy(strat, directory=str(tmp_path))
+    cached.evaluate_detailed(options, criteria, 0.5)
+    for source in (cached, CachedStrategy(strat, directory=str(tmp_path))):
+        hit = source.evaluate_detailed(options, criteria, 0.5)
+        assert [list(column) for column in hit.raw] == reference.raw
+        assert hit.row("A") == reference.row("A")
+        # shared columns are immutable
+        assert isinstance(hit.raw, tuple) and isinstance(hit.normalized[0], tuple)
+
+
+def test_fingerprint_covers_strategy_configuration():
+    from core.strategies import ScenarioRegretStrategy
+    expected = ScenarioRegretStrategy(aggregation="expected")
+    assert fingerprint(options, criteria, ScenarioRegretStrategy()) != fingerprint(options, criteria, expected)
+    assert fingerprint(options, criteria, expected) == fingerprint(
+        options, criteria, ScenarioRegretStrategy(aggregation="expected")
+    )
+    regret = StrategyFactory.get_strategy("regret_minimization")
+    assert fingerprint(options, criteria, CachedStrategy(RiskAverseStrategy())) != fingerprint(
+        options, criteria, CachedStrategy(regret)
+    )
+
+
+def test_disk_tier_is_bounded(tmp_path):
+    import os
+    inner = CountingStrategy()
+    CachedStrategy(inner, directory=str(tmp_path)).evaluate(options, criteria, 0.0)
+    size = os.path.getsize(next(tmp_path.iterdir()))
+    cached = CachedStrategy(inner, directory=str(tmp_path), max_disk_bytes=3 * size)
+    for i in range(1, 10):
+        cached.evaluate(options, criteria, i / 10)
+    files = list(tmp_path.iterdir())
+    assert len(files) <= 3 and sum(os.path.getsize(f) for f in files) <= 3 * size
+    assert cached.stats.disk_evictions == 10 - len(files)
+    # the newest entry is still on disk
+    cached.clear()
+    cached.evaluate(options, criteria, 0.9)
+    assert cached.stats.disk_hits == 1
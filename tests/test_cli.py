@@ -0,0 +1,118 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import main
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.agent import risk_aware_agent
+from core.problems import problem_to_dict
+from core.sensitivity import sensitivity_analysis
+from core.strategies import StrategyFactory
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CRITERIA = [Criterion("salary", 0.6, True), Criterion("risk", 0.4, False)]
+OPTIONS = [
+    OptionEvaluation(Option("A"), {"salary": Outcome(10, 8, 5), "risk": Outcome(1, 2, 4)}),
+    OptionEvaluation(Option("B"), {"salary": Outcome(9, 7, 6), "risk": Outcome(2, 2, 3)}),
+    OptionEvaluation(Option("C"), {"salary": Outcome(12, 6, 1), "risk": Outcome(1, 1, 1)}),
+]
+
+
+def run(argv) -> list[dict]:
+    out = io.StringIO()
+    sys.stdout, saved = out, sys.stdout
+    try:
+        assert main.main(argv) == 0
+    finally:
+        sys.stdout = saved
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+@pytest.fixture
+def jsonl(tmp_path):
+    path = tmp_path / "problems.jsonl"
+    lines = [
+        {"id": "first", "strategy": "risk_averse", **problem_to_dict(OPTIONS, CRITERIA)},
+        {"id": "second", "strategy": "regret_minimization", "risk_weight": 0.2, **problem_to_dict(OPTIONS[:2], CRITERIA)},
+    ]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("batch", [[], ["--batch"]])
+def test_evaluate_jsonl(jsonl, batch):
+    first, second = run(["evaluate", jsonl, *batch])
+    expected = risk_aware_agent(OPTIONS, CRITERIA, StrategyFactory.get_strategy("risk_averse"), 0.5)
+    assert first["id"] == "first"
+    assert first["scores"] == pytest.approx(expected["scores"])
+    assert [name for name, _ in first["ranking"]] == [name for name, _ in expected["ranking"]]
+    expected = risk_aware_agent(OPTIONS[:2], CRITERIA, StrategyFactory.get_strategy("regret_minimization"), 0.2)
+    assert second["scores"] == pytest.approx(expected["scores"])
+
+
+def test_evaluate_csv_and_npz(tmp_path):
+    csv_path = tmp_path / "outcomes.csv"
+    rows = ["problem,option,criterion,best,expected,worst"]
+    for problem in ("p1", "p2"):
+        for opt in OPTIONS:
+            for name, o in opt.outcomes.items():
+                rows.append(f"{problem},{opt.option.name},{name},{o.best},{o.expected},{o.worst}")
+    csv_path.write_text("\n".join(rows) + "\n")
+    results = run(["evaluate", str(csv_path), "--criteria", "salary:0.6:max,risk:0.4:min", "--top-k", "2"])
+    expected = risk_aware_agent(OPTIONS, CRITERIA, StrategyFactory.get_strategy("expected_value"), 0.5)
+    assert [r["id"] for r in results] == ["p1", "p2"]
+    assert results[0]["scores"] == pytest.approx(expected["scores"])
+    assert len(results[0]["ranking"]) == 2
+
+    from core.matrix import DecisionMatrix
+    matrix = DecisionMatrix.from_evaluations(OPTIONS, CRITERIA)
+    npz_path = tmp_path / "problem.npz"
+    np.savez(
+        npz_path, option_names=np.array(matrix.option_names), criterion_names=np.array(matrix.criterion_names),
+        weights=matrix.weights, maximize=matrix.maximize, best=matrix.best, expected=matrix.expected, worst=matrix.worst,
+    )
+    (result,) = run(["evaluate", str(npz_path), "--strategy", "expected_value"])
+    assert result["scores"] == pytest.approx(expected["scores"])
+
+    from core.storage import save_problem
+    dmx_path = tmp_path / "problem.dmx"
+    save_problem(str(dmx_path), OPTIONS, CRITERIA)
+    (result,) = run(["evaluate", str(dmx_path)])
+    assert result["scores"] == pytest.approx(expected["scores"])
+
+
+def test_sweep(jsonl, monkeypatch):
+    expected = [
+        sensitivity_analysis(OPTIONS, CRITERIA, StrategyFactory.get_strategy("risk_averse"), [0.0, 0.5, 1.0]),
+        sensitivity_analysis(OPTIONS[:2], CRITERIA, StrategyFactory.get_strategy("regret_minimization"), [0.0, 0.5, 1.0]),
+    ]
+    # the CLI goes through the vectorized sweep, not the per-weight loop
+    monkeypatch.setattr("core.sensitivity.sensitivity_analysis", lambda *a, **k: pytest.fail("per-weight loop"))
+    results = run(["sweep", jsonl, "--risk-weights", "0,0.5,1"])
+    for result, reference in zip(results, expected):
+        assert [row["risk_weight"] for row in result["sweep"]] == [0.0, 0.5, 1.0]
+        for row in result["sweep"]:
+            assert row["scores"] == pytest.approx(reference[row["risk_weight"]])
+
+
+def test_demo_timings(capsys):
+    assert main.main(["demo", "--timings"]) == 0
+    err = capsys.readouterr().err
+    assert "1 problem(s)" in err and "evaluate" in err and "write" in err
+
+
+def test_cold_start_skips_numpy(jsonl):
+    code = (
+        "import sys, main; main.main(['evaluate', sys.argv[1], '--output', sys.argv[2], '--timings']);"
+        "print(sorted(m for m in ('numpy', 'matplotlib', 'asyncio') if m in sys.modules))"
+    )
+    done = subprocess.run(
+        [sys.executable, "-c", code, jsonl, os.devnull], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert done.stdout.strip() == "[]"
+    assert "problem(s)" in done.stderr and "evaluate" in done.stderr
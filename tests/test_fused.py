@@ -0,0 +1,42 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.models import Criterion
+from core.fused import compare_strategies
+from core.matrix import DecisionMatrix
+from core.strategies import StrategyFactory
+from conftest import random_problem
+
+NAMES = ["expected_value", "risk_averse", "regret_minimization"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("risk_weight", [0.0, 0.5, 1.0])
+def test_matches_each_strategy_exactly(seed, risk_weight):
+    options, criteria = random_problem(12, 5, seed=seed, low=-5, high=5, spread=3, step=1.0)
+    comparison = compare_strategies(options, criteria, NAMES, risk_weight)
+    table = comparison.table()
+    for name in NAMES:
+        expected = StrategyFactory.get_strategy(name).evaluate(options, criteria, risk_weight=risk_weight)
+        assert table[name] == expected
+        assert [o for o, _ in comparison.ranking(name)] == [
+            o for o, _ in sorted(expected.items(), key=lambda x: x[1], reverse=True)
+        ]
+
+
+def test_matrix_input_and_shape():
+    options, criteria = random_problem(12, 5, seed=7, low=-5, high=5, spread=3, step=1.0)
+    matrix = DecisionMatrix.from_evaluations(options, criteria)
+    comparison = compare_strategies(matrix, None, ["regret_minimization", "risk_averse"])
+    assert comparison.scores.shape == (2, len(options))
+    assert comparison.table() == compare_strategies(options, criteria, ["regret_minimization", "risk_averse"]).table()
+    assert set(comparison.rankings()) == {"regret_minimization", "risk_averse"}
+
+
+def test_unknown_strategy_and_missing_outcomes():
+    options, criteria = random_problem(12, 5, low=-5, high=5, spread=3, step=1.0)
+    with pytest.raises(ValueError):
+        compare_strategies(options, criteria, ["nope"])
+    with pytest.raises(ValueError):
+        compare_strategies(options, criteria + [Criterion("extra", 0.1)], NAMES)
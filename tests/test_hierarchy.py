@@ -0,0 +1,75 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.hierarchy import CriteriaGroup, HierarchicalScorer, flatten
+from core.models import Criterion
+from core.scoring import calculate_scores_with_risk
+from core.strategies import StrategyFactory
+from conftest import random_options
+
+TREE = CriteriaGroup("goal", children=(
+    CriteriaGroup("financial", 0.6, (Criterion("salary", 0.7), Criterion("bonus", 0.3))),
+    CriteriaGroup("career", 0.4, (Criterion("growth", 0.5), Criterion("risk", 0.5, maximize=False))),
+))
+
+
+def sample_options(n, seed=0):
+    return random_options(random.Random(seed), n, flatten(TREE), low=0.0)
+
+
+def test_flatten_multiplies_path_weights():
+    assert flatten(TREE) == [
+        Criterion("salary", 0.6 * 0.7), Criterion("bonus", 0.6 * 0.3),
+        Criterion("growth", 0.4 * 0.5), Criterion("risk", 0.4 * 0.5, False),
+    ]
+
+
+@pytest.mark.parametrize("name", ["expected_value", "risk_averse", "regret_minimization"])
+def test_scores_match_flat_strategies(name):
+    options = sample_options(50)
+    strategy = StrategyFactory.get_strategy(name)
+    scorer = HierarchicalScorer(TREE, options, strategy, risk_weight=0.3)
+    flat = strategy.evaluate_detailed(options, flatten(TREE), risk_weight=0.3)
+    assert scorer.scores() == pytest.approx(flat.scores, abs=1e-12)
+    for j, leaf in enumerate(flat.criterion_names):
+        assert list(scorer.node_scores(leaf).values()) == list(flat.normalized[j])
+
+
+def test_one_level_tree_is_exact():
+    options = sample_options(40, seed=1)
+    criteria = [Criterion("salary", 0.5), Criterion("growth", 0.3), Criterion("risk", 0.2, False)]
+    scorer = HierarchicalScorer(CriteriaGroup("goal", children=tuple(criteria)), options)
+    assert scorer.scores() == calculate_scores_with_risk(options, criteria)
+
+
+def test_set_weight_recomputes_path_only(monkeypatch):
+    options = sample_options(30, seed=2)
+    scorer = HierarchicalScorer(TREE, options)
+    recomputed = []
+    original = scorer._aggregate
+    monkeypatch.setattr(scorer, "_aggregate", lambda name: (recomputed.append(name), original(name)))
+
+    scorer.set_weight("bonus", 0.5)
+    assert recomputed == ["financial", "goal"]
+    recomputed.clear()
+    scorer.set_weight("career", 0.1)
+    assert recomputed == ["goal"]
+
+    assert scorer.weight("bonus") == 0.5
+    fresh = HierarchicalScorer(scorer.tree(), options)
+    assert scorer.scores() == fresh.scores()
+    assert scorer.scores() == pytest.approx(calculate_scores_with_risk(options, scorer.criteria()), abs=1e-12)
+
+
+def test_invalid_trees():
+    with pytest.raises(ValueError, match="two nodes"):
+        HierarchicalScorer(CriteriaGroup("goal", children=(Criterion("goal", 1.0),)), sample_options(3))
+    with pytest.raises(ValueError, match="no children"):
+        CriteriaGroup("goal", children=(CriteriaGroup("empty", 0.5),)).validate()
+    scorer = HierarchicalScorer(TREE, sample_options(3))
+    with pytest.raises(KeyError):
+        scorer.set_weight("missing", 0.5)
+    with pytest.raises(ValueError):
+        scorer.set_weight("salary", 1.5)
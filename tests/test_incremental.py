@@ -0,0 +1,97 @@
+import random
+import pytest
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.incremental import IncrementalScorer
+from core.scoring import calculate_scores_with_risk
+
+criteria = [
+    Criterion("salary", 0.5, True),
+    Criterion("growth", 0.3, True),
+    Criterion("risk", 0.2, False)
+]
+
+
+def random_option(rng, name):
+    outcomes = {}
+    for c in criteria:
+        worst = rng.uniform(-50, 50)
+        expected = worst + rng.uniform(0, 20)
+        outcomes[c.name] = Outcome(expected + rng.uniform(0, 20), expected, worst)
+    return OptionEvaluation(Option(name), outcomes)
+
+
+def assert_matches(scorer, options):
+    expected = calculate_scores_with_risk(list(options.values()), criteria, 0.3)
+    actual = scorer.scores()
+    assert actual.keys() == expected.keys()
+    for name, score in expected.items():
+        assert actual[name] == pytest.approx(score, abs=1e-12)
+
+
+def test_random_edits_match_full_rescore():
+    rng = random.Random(0)
+    options = {f"o{i}": random_option(rng, f"o{i}") for i in range(20)}
+    scorer = IncrementalScorer(criteria, risk_weight=0.3, options=options.values())
+    assert_matches(scorer, options)
+    counter = 20
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.3 or len(options) < 3:
+            name = f"o{counter}"
+            counter += 1
+            options[name] = random_option(rng, name)
+            scorer.add(options[name])
+        elif action < 0.7:
+            name = rng.choice(list(options))
+            options[name] = random_option(rng, name)
+            scorer.update(options[name])
+        else:
+            name = rng.choice(list(options))
+            del options[name]
+            scorer.remove(name)
+        assert_matches(scorer, options)
+
+
+def test_update_without_anchor_move_touches_one_score():
+    a = OptionEvaluation(Option("A"), {c.name: Outcome(10, 10, 10) for c in criteria})
+    b = OptionEvaluation(Option("B"), {c.name: Outcome(0, 0, 0) for c in criteria})
+    c = OptionEvaluation(Option("C"), {cr.name: Outcome(5, 5, 5) for cr in criteria})
+    scorer = IncrementalScorer(criteria, risk_weight=0.3, options=[a, b, c])
+    before = scorer.scores()
+    scorer.update(OptionEvaluation(Option("C"), {cr.name: Outcome(6, 6, 6) for cr in criteria}))
+    after = scorer.scores()
+    assert after["A"] == before["A"] and after["B"] == before["B"]
+    assert after["C"] != before["C"]
+
+
+def test_constant_criterion_and_errors():
+    opt = OptionEvaluation(Option("A"), {c.name: Outcome(1, 1, 1) for c in criteria})
+    scorer = IncrementalScorer(criteria, options=[opt])
+    assert scorer.score("A") == calculate_scores_with_risk([opt], criteria)["A"]
+    with pytest.raises(ValueError):
+        scorer.add(opt)
+    with pytest.raises(KeyError):
+        scorer.remove("missing")
+    with pytest.raises(ValueError):
+        scorer.add(OptionEvaluation(Option("B"), {"salary": Outcome(1, 1, 1)}))
+    scorer.remove("A")
+    assert len(scorer) == 0 and scorer.scores() == {}
+
+
+def test_long_running_updates_do_not_drift():
+    rng = random.Random(7)
+    options = {f"o{i}": random_option(rng, f"o{i}") for i in range(30)}
+    scorer = IncrementalScorer(criteria, risk_weight=0.3, options=options.values())
+    for step in range(3000):
+        # alternately push an option past the anchors and pull it back in
+        name = rng.choice(list(options))
+        options[name] = random_option(rng, name)
+        if step % 2:
+            outcomes = options[name].outcomes
+            options[name] = OptionEvaluation(Option(name), {
+                key: Outcome(o.best * 3, o.expected * 3, o.worst * 3) for key, o in outcomes.items()
+            })
+        scorer.update(options[name])
+    fresh = calculate_scores_with_risk(list(options.values()), criteria, 0.3)
+    assert scorer.scores() == fresh
+    assert [n for n, _ in scorer.ranking()] == sorted(fresh, key=fresh.get, reverse=True)
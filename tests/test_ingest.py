@@ -0,0 +1,116 @@
+import json
+import random
+import tracemalloc
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.models import Criterion
+from core.ingest import read_chunks, stream_scores, stream_top_k
+from core.normalization import ZScoreNormalizer, RankNormalizer, using_normalizer
+from core.strategies import StrategyFactory
+from conftest import random_options
+
+CRITERIA = [Criterion("salary", 0.5, True), Criterion("growth", 0.3, True), Criterion("risk", 0.2, False)]
+
+
+def sample_options(n, seed=0):
+    # quarter steps repeat values, making ties
+    return random_options(random.Random(seed), n, CRITERIA, -12.5, 12.5, 5.0, step=0.25)
+
+
+def write_csv(path, options):
+    with open(path, "w") as f:
+        f.write("option,criterion,best,expected,worst,note\n")
+        for opt in options:
+            for name, o in opt.outcomes.items():
+                f.write(f"{opt.option.name},{name},{o.best!r},{o.expected!r},{o.worst!r},x\n")
+
+
+def write_jsonl(path, options):
+    with open(path, "w") as f:
+        for opt in options:
+            outcomes = {n: {"best": o.best, "expected": o.expected, "worst": o.worst} for n, o in opt.outcomes.items()}
+            f.write(json.dumps({"name": opt.option.name, "outcomes": outcomes}) + "\n")
+
+
+@pytest.fixture(params=["csv", "jsonl"])
+def dataset(request, tmp_path):
+    options = sample_options(503)
+    path = str(tmp_path / f"options.{request.param}")
+    (write_csv if request.param == "csv" else write_jsonl)(path, options)
+    return path, options
+
+
+def test_chunks_are_bounded_and_complete(dataset):
+    path, options = dataset
+    chunks = list(read_chunks(path, CRITERIA, chunk_size=100))
+    assert [c.n_options for c in chunks] == [100] * 5 + [3]
+    assert [n for c in chunks for n in c.option_names] == [opt.option.name for opt in options]
+
+
+@pytest.mark.parametrize("name", ["expected_value", "risk_averse", "regret_minimization"])
+@pytest.mark.parametrize("risk_weight", [0.0, 0.5, 1.0])
+def test_stream_scores_match_in_memory_exactly(dataset, name, risk_weight):
+    path, options = dataset
+    strategy = StrategyFactory.get_strategy(name)
+    expected = strategy.evaluate(options, CRITERIA, risk_weight=risk_weight)
+    streamed = {}
+    for names, scores in stream_scores(path, CRITERIA, strategy, risk_weight, chunk_size=64):
+        streamed.update(zip(names, scores.tolist()))
+    assert streamed == expected
+
+    top = stream_top_k(path, CRITERIA, strategy, 10, risk_weight, chunk_size=64)
+    assert top == sorted(expected.items(), key=lambda x: x[1], reverse=True)[:10]
+
+
+def test_streaming_z_score_and_non_streaming_normalizers(dataset):
+    path, options = dataset
+    strategy = StrategyFactory.get_strategy("risk_averse")
+    with using_normalizer(ZScoreNormalizer()):
+        expected = strategy.evaluate(options, CRITERIA)
+        streamed = {}
+        for names, scores in stream_scores(path, CRITERIA, strategy, chunk_size=50):
+            streamed.update(zip(names, scores.tolist()))
+    assert streamed == pytest.approx(expected)
+    with using_normalizer(RankNormalizer()), pytest.raises(ValueError):
+        list(stream_scores(path, CRITERIA, strategy))
+
+
+def test_missing_outcome_is_reported_per_chunk(tmp_path):
+    options = sample_options(10)
+    path = str(tmp_path / "options.csv")
+    write_csv(path, options)
+    with pytest.raises(ValueError, match="missing outcomes"):
+        list(read_chunks(path, CRITERIA + [Criterion("extra", 0.1)], chunk_size=4))
+
+
+def test_peak_memory_follows_chunk_size(tmp_path):
+    path = str(tmp_path / "options.csv")
+    write_csv(path, sample_options(4_000, seed=1))
+    strategy = StrategyFactory.get_strategy("expected_value")
+
+    def peak(chunk_size):
+        tracemalloc.start()
+        for _ in stream_scores(path, CRITERIA, strategy, chunk_size=chunk_size):
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    assert peak(200) * 4 < peak(4_000)
+
+
+def test_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+    options = sample_options(50)
+    rows = [(opt.option.name, n, o.best, o.expected, o.worst) for opt in options for n, o in opt.outcomes.items()]
+    table = pa.table({k: list(v) for k, v in zip(["option", "criterion", "best", "expected", "worst"], zip(*rows))})
+    path = str(tmp_path / "options.parquet")
+    pq.write_table(table, path)
+    strategy = StrategyFactory.get_strategy("risk_averse")
+    streamed = {}
+    for names, scores in stream_scores(path, CRITERIA, strategy, chunk_size=7):
+        streamed.update(zip(names, scores.tolist()))
+    assert streamed == strategy.evaluate(options, CRITERIA)
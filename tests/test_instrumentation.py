@@ -0,0 +1,78 @@
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.agent import risk_aware_agent
+from core.sensitivity import sensitivity_analysis
+from core.strategies import RiskAverseStrategy
+import pytest
+
+from core.instrumentation import (
+    HistogramSink, PrometheusSink, NullSink, Sink, instrumented, get_sink, size_class, stage
+)
+
+options = [
+    OptionEvaluation(option=Option("A"), outcomes={"c": Outcome(10, 8, 5), "d": Outcome(3, 2, 1)}),
+    OptionEvaluation(option=Option("B"), outcomes={"c": Outcome(8, 7, 6), "d": Outcome(4, 2, 2)}),
+]
+criteria = [Criterion("c", 0.7), Criterion("d", 0.3, False)]
+
+
+def test_agent_and_sensitivity_stages():
+    sink = HistogramSink()
+    with instrumented(sink):
+        result = risk_aware_agent(options, criteria, strategy=RiskAverseStrategy(), risk_weight=0.5)
+        assert "agent.breakdown" not in sink.totals()
+        dict(result["breakdown"])
+        sensitivity_analysis(options, criteria, RiskAverseStrategy(), risk_weights=[0.0, 0.5, 1.0])
+    assert isinstance(get_sink(), NullSink)
+
+    totals = sink.totals()
+    for name in ["agent.validation", "agent.scoring", "agent.ranking"]:
+        assert totals[name][0] == 1
+    # breakdown rows are timed when read, one per option
+    assert totals["agent.breakdown"][0] == 2
+    # two criteria per evaluation: one agent run plus three sensitivity weights
+    assert totals["strategy.criterion"][0] == 8
+    assert totals["sensitivity.risk_weight"][0] == 3
+    tags = dict(next(t for (name, t) in sink.histograms if name == "agent.scoring"))
+    assert tags == {"n_options": "1-9", "n_criteria": "1-9", "strategy": "RiskAverseStrategy"}
+    labels = {key for (_, t) in sink.histograms for key, _ in t}
+    assert labels == {"n_options", "n_criteria", "strategy"}
+
+
+def test_disabled_stage_is_shared_noop():
+    assert stage("anything", n_options=1) is stage("other")
+
+
+def test_prometheus_text():
+    sink = PrometheusSink()
+    with instrumented(sink):
+        with stage("agent.scoring", n_options=2):
+            pass
+    text = sink.render()
+    assert "# TYPE decision_stage_seconds histogram" in text
+    assert 'decision_stage_seconds_bucket{stage="agent.scoring",n_options="1-9",le="+Inf"} 1' in text
+    assert 'decision_stage_seconds_count{stage="agent.scoring",n_options="1-9"} 1' in text
+
+
+def test_size_classes():
+    assert [size_class(n) for n in (0, 1, 9, 10, 99, 250, 1000)] == [
+        "0", "1-9", "1-9", "10-99", "10-99", "100-999", "1000-9999"
+    ]
+
+
+def test_series_are_capped():
+    sink = HistogramSink(max_series=3)
+    with instrumented(sink):
+        for n in range(1, 10 ** 5, 7):
+            with stage("agent.scoring", n_options=n, risk_weight=n / 7, criterion=f"c{n}"):
+                pass
+        with stage("agent.ranking", strategy="a"), stage("agent.ranking", strategy="b"):
+            pass
+    # three scoring series, then one overflow series per stage
+    assert len(sink.histograms) == 5
+    assert sink.histograms[("agent.ranking", (("overflow", "true"),))].count == 2
+    assert sink.totals()["agent.scoring"][0] == len(range(1, 10 ** 5, 7))
+
+
+def test_sink_is_abstract():
+    with pytest.raises(TypeError):
+        Sink()
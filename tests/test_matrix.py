@@ -0,0 +1,97 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.models import Criterion
+from core.matrix import DecisionMatrix, normalize_columns
+from core.normalization import normalize
+from core.scoring import calculate_scores, calculate_scores_with_risk
+from core.strategies import Strategy, StrategyFactory
+from conftest import random_problem
+
+
+@pytest.mark.parametrize("strategy_name", ["expected_value", "risk_averse", "regret_minimization"])
+@pytest.mark.parametrize("risk_weight", [0.0, 0.3, 1.0])
+def test_matrix_strategies_match_reference(strategy_name, risk_weight):
+    options, criteria = random_problem(40, 5, weights=(0, 1))
+    matrix = DecisionMatrix.from_evaluations(options, criteria)
+    strat = StrategyFactory.get_strategy(strategy_name)
+
+    expected = strat.evaluate(options, criteria, risk_weight=risk_weight)
+    assert strat.evaluate(matrix, criteria, risk_weight=risk_weight) == expected
+    assert matrix.scores_dict(strat.evaluate_matrix(matrix, risk_weight)) == expected
+
+
+def test_matrix_scoring_functions_match_reference():
+    options, criteria = random_problem(40, 5, seed=1, weights=(0, 1))
+    matrix = DecisionMatrix.from_evaluations(options, criteria)
+    assert calculate_scores(matrix, criteria) == calculate_scores(options, criteria)
+    assert calculate_scores_with_risk(matrix, None, 0.7) == calculate_scores_with_risk(options, criteria, 0.7)
+
+
+def test_normalize_columns_constant_column():
+    values = np.array([[3.0, 1.0], [3.0, 2.0], [3.0, 5.0]])
+    result = normalize_columns(values, np.array([True, False]))
+    assert result[:, 0].tolist() == [1.0, 1.0, 1.0]
+    assert result[:, 1].tolist() == normalize([1.0, 2.0, 5.0], maximize=False)
+
+
+def test_with_criteria_reorders_and_reweights():
+    options, criteria = random_problem(40, 5, seed=2, weights=(0, 1))
+    matrix = DecisionMatrix.from_evaluations(options, criteria)
+    subset = [Criterion(criteria[3].name, 0.9, True), Criterion(criteria[0].name, 0.1, False)]
+    strat = StrategyFactory.get_strategy("risk_averse")
+    assert strat.evaluate(matrix, subset) == strat.evaluate(options, subset)
+    assert matrix.with_criteria(criteria) is matrix
+    with pytest.raises(ValueError):
+        matrix.with_criteria([Criterion("unknown", 1.0)])
+
+
+def test_matrix_is_drop_in_for_custom_strategy():
+    class WorstCaseStrategy(Strategy):
+        def evaluate(self, options, criteria, risk_weight=0.5):
+            return {
+                opt.option.name: sum(opt.outcomes[c.name].worst * c.weight for c in criteria)
+                for opt in options
+            }
+
+    options, criteria = random_problem(5, 5, seed=3, weights=(0, 1))
+    matrix = DecisionMatrix.from_evaluations(options, criteria)
+    strat = WorstCaseStrategy()
+    assert strat.evaluate(matrix, criteria) == strat.evaluate(options, criteria)
+    assert matrix.scores_dict(strat.evaluate_matrix(matrix)) == strat.evaluate(options, criteria)
+
+
+def test_bulk_constructors_match_from_evaluations():
+    options, criteria = random_problem(6, 5, seed=4, weights=(0, 1))
+    reference = DecisionMatrix.from_evaluations(options, criteria)
+    from_arrays = DecisionMatrix.from_arrays(
+        reference.option_names, criteria, reference.best, reference.expected, reference.worst
+    )
+    records = [
+        (opt.option.name, name, out.best, out.expected, out.worst)
+        for opt in reversed(options) for name, out in opt.outcomes.items()
+    ]
+    from_records = DecisionMatrix.from_records(reversed(records), criteria)
+    for matrix in (from_arrays, from_records):
+        assert matrix.option_names == reference.option_names
+        assert np.array_equal(matrix.best, reference.best)
+        assert np.array_equal(matrix.worst, reference.worst)
+        assert matrix.to_evaluations() == reference.to_evaluations()
+    with pytest.raises(ValueError):
+        DecisionMatrix.from_records(records[1:], criteria)
+    with pytest.raises(ValueError):
+        DecisionMatrix.from_arrays(["a"], criteria, [[1.0]], [[1.0]], [[1.0]])
+
+
+def test_vectorized_validate():
+    options, criteria = random_problem(6, 5, seed=5, weights=(0, 1))
+    matrix = DecisionMatrix.from_evaluations(options, criteria)
+    matrix.validate()
+    broken = np.array(matrix.expected)
+    broken[2, 1] = matrix.best[2, 1] + 1
+    with pytest.raises(ValueError, match="opt2"):
+        DecisionMatrix.from_arrays(matrix.option_names, criteria, matrix.best, broken, matrix.worst).validate()
+    heavy = [Criterion(c.name, 1.5, c.maximize) for c in criteria]
+    with pytest.raises(ValueError):
+        matrix.with_criteria(heavy).validate()
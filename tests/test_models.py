@@ -18,3 +18,8 @@ def test_invalid_criterion_weight():
     c = Criterion(name="risk", weight=1.5)
     with pytest.raises(ValueError):
         c.validate()
+
+def test_models_are_slotted():
+    o = Outcome(best=3, expected=2, worst=1)
+    assert not hasattr(o, "__dict__")
+    assert o.best == 3
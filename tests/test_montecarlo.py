@@ -0,0 +1,126 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.matrix import DecisionMatrix
+from core.montecarlo import monte_carlo, sample_outcomes
+from core.strategies import Strategy, StrategyFactory, RiskAverseStrategy
+
+options = [
+    OptionEvaluation(
+        option=Option("A"),
+        outcomes={"salary": Outcome(120, 100, 80), "growth": Outcome(10, 7, 5), "risk": Outcome(5, 7, 10)}
+    ),
+    OptionEvaluation(
+        option=Option("B"),
+        outcomes={"salary": Outcome(110, 95, 80), "growth": Outcome(12, 8, 4), "risk": Outcome(3, 5, 8)}
+    ),
+    OptionEvaluation(
+        option=Option("C"),
+        outcomes={"salary": Outcome(100, 100, 100), "growth": Outcome(6, 6, 6), "risk": Outcome(6, 6, 6)}
+    ),
+]
+
+criteria = [
+    Criterion("salary", 0.5, True),
+    Criterion("growth", 0.3, True),
+    Criterion("risk", 0.2, False)
+]
+
+
+@pytest.mark.parametrize("distribution", ["triangular", "pert"])
+def test_samples_stay_in_range(distribution):
+    matrix = DecisionMatrix.from_evaluations(options, criteria)
+    samples = sample_outcomes(matrix, 500, np.random.default_rng(0), distribution)
+    assert samples.shape == (500, 3, 3)
+    low = np.minimum(matrix.best, matrix.worst)
+    high = np.maximum(matrix.best, matrix.worst)
+    assert (samples >= low).all() and (samples <= high).all()
+    # zero-width outcomes are returned exactly
+    assert (samples[:, 2, 0] == 100).all()
+
+
+@pytest.mark.parametrize("strategy_name", ["expected_value", "risk_averse", "regret_minimization"])
+def test_probabilities_are_consistent(strategy_name):
+    strat = StrategyFactory.get_strategy(strategy_name)
+    result = monte_carlo(options, criteria, strat, n_samples=2_500, k=2, chunk_size=1_000)
+    assert result.first.sum() == pytest.approx(1.0)
+    assert result.top_k.sum() == pytest.approx(2.0)
+    assert (result.top_k >= result.first).all()
+    q = result.quantiles([0.05, 0.5, 0.95])
+    assert q.shape == (3, 3)
+    assert (np.diff(q, axis=0) >= 0).all()
+    assert ((q >= 0) & (q <= 1.0 + 1e-12)).all()
+
+
+def test_reproducible_across_worker_counts():
+    strat = RiskAverseStrategy()
+    serial = monte_carlo(options, criteria, strat, n_samples=3_000, seed=7, chunk_size=500)
+    parallel = monte_carlo(options, criteria, strat, n_samples=3_000, seed=7, chunk_size=500, workers=2)
+    assert serial.first.tolist() == parallel.first.tolist()
+    assert serial.mean.tolist() == parallel.mean.tolist()
+    assert np.array_equal(serial.counts, parallel.counts)
+    other = monte_carlo(options, criteria, strat, n_samples=3_000, seed=8, chunk_size=500)
+    assert other.mean.tolist() != serial.mean.tolist()
+
+
+def test_default_evaluate_samples_matches_kernels():
+    class Wrapped(Strategy):
+        def __init__(self, inner):
+            self.inner = inner
+
+        def evaluate(self, options, criteria, risk_weight=0.5):
+            return self.inner.evaluate(options, criteria, risk_weight)
+
+    matrix = DecisionMatrix.from_evaluations(options, criteria)
+    samples = sample_outcomes(matrix, 20, np.random.default_rng(1))
+    for name in ["expected_value", "regret_minimization"]:
+        strat = StrategyFactory.get_strategy(name)
+        assert np.allclose(Wrapped(strat).evaluate_samples(matrix, samples), strat.evaluate_samples(matrix, samples))
+
+
+def test_unknown_distribution():
+    with pytest.raises(ValueError):
+        monte_carlo(options, criteria, RiskAverseStrategy(), distribution="normal")
+
+
+def test_histogram_follows_normalizer_bounds():
+    from core.normalization import ZScoreNormalizer, using_normalizer
+
+    with using_normalizer(ZScoreNormalizer()):
+        result = monte_carlo(options, criteria, RiskAverseStrategy(), n_samples=2_000, chunk_size=500)
+    # z-scores go negative; nothing may pile up in the clipped end bins
+    assert result.edges[0] < 0 < result.edges[-1]
+    assert result.counts[:, 0].sum() == 0 and result.counts[:, -1].sum() == 0
+    q = result.quantiles([0.0, 0.5, 1.0])
+    width = result.edges[1] - result.edges[0]
+    assert (q[0] <= result.mean + width).all() and (result.mean <= q[2] + width).all()
+    assert (q[0] < 0).any()
+
+
+def test_unbounded_normalizer_is_rejected():
+    from core.normalization import Normalizer, using_normalizer
+
+    class Identity(Normalizer):
+        def __call__(self, values, maximize=True):
+            return list(values)
+
+        def columns(self, values, maximize=True, axis=0):
+            return values
+
+    with using_normalizer(Identity()), pytest.raises(ValueError, match="bounds"):
+        monte_carlo(options, criteria, RiskAverseStrategy(), n_samples=10)
+
+
+def test_chunks_return_sparse_histograms():
+    import core.montecarlo as mc
+    from core.normalization import get_normalizer
+
+    matrix = DecisionMatrix.from_evaluations(options, criteria)
+    edges = mc.histogram_edges(get_normalizer(), matrix.n_options, matrix.weights)
+    mc._init_worker(matrix, RiskAverseStrategy(), "triangular", 2, edges, get_normalizer())
+    *_, (cells, counts) = mc._run_chunk(np.random.SeedSequence(0), 50)
+    # never more cells than the chunk has scores, whatever the number of bins
+    assert len(cells) <= 50 * matrix.n_options and counts.sum() == 50 * matrix.n_options
+    assert (np.diff(cells) > 0).all()
@@ -0,0 +1,127 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.matrix import DecisionMatrix
+from core.normalization import (
+    normalize, RunningStats, MinMaxNormalizer, ZScoreNormalizer, RankNormalizer, QuantileNormalizer,
+    get_normalizer, set_normalizer, using_normalizer,
+)
+from core.scoring import calculate_scores, calculate_scores_with_risk
+from core.batch import evaluate_batch
+from core.cache import fingerprint
+from core.strategies import StrategyFactory
+from conftest import random_problem
+
+NORMALIZERS = [
+    MinMaxNormalizer(), MinMaxNormalizer(constant=0.0), ZScoreNormalizer(), RankNormalizer(), QuantileNormalizer(0.1, 0.9)
+]
+
+
+@pytest.mark.parametrize("normalizer", NORMALIZERS, ids=repr)
+def test_list_and_array_paths_agree(normalizer):
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 4, (9, 5)).astype(float)
+    values[:, 2] = 3.0
+    maximize = np.array([True, False, True, False, True])
+    columns = normalizer.columns(values, maximize)
+    for j in range(values.shape[1]):
+        assert columns[:, j] == pytest.approx(normalizer(values[:, j].tolist(), bool(maximize[j])))
+    # any axis gives the same result
+    stacked = normalizer.columns(np.stack([values.T, values.T]), maximize[:, None], axis=2)
+    assert stacked[1].T == pytest.approx(columns)
+
+
+def test_running_stats_merge_matches_one_pass():
+    values = [random.Random(1).uniform(-1e3, 1e3) for _ in range(1_000)]
+    merged = MinMaxNormalizer().fit(values[i : i + 37] for i in range(0, len(values), 37))
+    whole = RunningStats().update(values)
+    assert merged.count == whole.count
+    assert (merged.min, merged.max) == (whole.min, whole.max)
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.std == pytest.approx(float(np.std(values)))
+
+
+@pytest.mark.parametrize("normalizer", [MinMaxNormalizer(), ZScoreNormalizer()], ids=repr)
+def test_streaming_transform_matches_in_memory(normalizer):
+    values = [random.Random(2).uniform(0, 10) for _ in range(200)]
+    stats = normalizer.fit([values[:50], values[50:120], values[120:]])
+    streamed = normalizer.transform(values[:50], stats) + normalizer.transform(values[50:], stats)
+    assert streamed == pytest.approx(normalizer(values))
+
+
+def test_min_max_default_is_unchanged_and_constant_is_configurable():
+    assert MinMaxNormalizer()([3.0, 1.0, 2.0], False) == normalize([3.0, 1.0, 2.0], False)
+    assert MinMaxNormalizer(constant=0.0)([2.0, 2.0]) == [0.0, 0.0]
+    assert RankNormalizer()([2.0, 2.0, 2.0]) == [0.5, 0.5, 0.5]
+    assert ZScoreNormalizer()([2.0, 2.0]) == [0.0, 0.0]
+
+
+@pytest.mark.parametrize("normalizer", NORMALIZERS, ids=repr)
+@pytest.mark.parametrize("name", ["expected_value", "risk_averse", "regret_minimization"])
+def test_every_strategy_uses_the_active_normalizer(normalizer, name):
+    options, criteria = random_problem(10, seed=3, low=-5, high=5, spread=3, step=1.0)
+    strategy = StrategyFactory.get_strategy(name)
+    matrix = DecisionMatrix.from_evaluations(options, criteria)
+    with using_normalizer(normalizer):
+        objects = strategy.evaluate(options, criteria, risk_weight=0.3)
+        vectorized = matrix.scores_dict(strategy.evaluate_matrix(matrix, 0.3))
+        batched = next(evaluate_batch([(options, criteria, strategy, 0.3)] * 2))["scores"]
+    assert vectorized == pytest.approx(objects)
+    assert batched == pytest.approx(objects)
+    assert get_normalizer() is not normalizer
+
+
+def test_scoring_functions_take_a_normalizer():
+    options, criteria = random_problem(10, seed=4, low=-5, high=5, spread=3, step=1.0)
+    rank = RankNormalizer()
+    with using_normalizer(rank):
+        expected = calculate_scores_with_risk(options, criteria, 0.5)
+        plain = calculate_scores(options, criteria)
+    assert calculate_scores_with_risk(options, criteria, 0.5, normalizer=rank) == expected
+    assert calculate_scores(options, criteria, normalizer=rank) == plain
+    assert calculate_scores_with_risk(options, criteria, 0.5) != expected
+
+
+def test_set_normalizer_and_cache_key():
+    options, criteria = random_problem(10, seed=5, low=-5, high=5, spread=3, step=1.0)
+    strategy = StrategyFactory.get_strategy("risk_averse")
+    default_key = fingerprint(options, criteria, strategy)
+    previous = set_normalizer(ZScoreNormalizer())
+    try:
+        assert fingerprint(options, criteria, strategy) != default_key
+    finally:
+        set_normalizer(previous)
+    assert fingerprint(options, criteria, strategy) == default_key
+    with pytest.raises(ValueError):
+        QuantileNormalizer(0.9, 0.1)
+
+
+@pytest.mark.parametrize("normalizer", NORMALIZERS, ids=repr)
+def test_values_stay_within_bounds(normalizer):
+    rng = np.random.default_rng(3)
+    for n in (1, 2, 5, 200):
+        values = np.vstack([rng.normal(size=(n, 3)) * 100, np.full((1, 3), 1e6)])[:n]
+        low, high = normalizer.bounds(n)
+        normalized = normalizer.columns(values, np.array([True, False, True]))
+        assert (normalized >= low - 1e-12).all() and (normalized <= high + 1e-12).all()
+
+
+def test_normalizer_interfaces_are_abstract():
+    from core.normalization import Normalizer, StreamingMixin
+
+    with pytest.raises(TypeError):
+        Normalizer()
+
+    class Partial(StreamingMixin, Normalizer):
+        def __call__(self, values, maximize=True):
+            return values
+
+        def columns(self, values, maximize=True, axis=0):
+            return values
+
+    with pytest.raises(TypeError):
+        Partial()
+    assert [n.streaming for n in NORMALIZERS] == [True, True, True, False, False]
+    assert Normalizer.bounds(RankNormalizer(), 3) is None
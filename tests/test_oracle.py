@@ -0,0 +1,67 @@
+import json
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from benchmarks import oracle
+from core.matrix import DecisionMatrix
+from core.problems import problem_from_dict
+
+
+def test_every_path_agrees_with_the_references(monkeypatch):
+    monkeypatch.setitem(oracle.PROFILES, "tiny", {"cases": 8, "max_options": 40, "max_criteria": 4})
+    result = oracle.run("tiny", seed=3)
+    assert {p.name for p in oracle.PATHS} == set(result["paths"])
+    for name, report in result["paths"].items():
+        assert report["cases"] > 0 and report["failures"] == [], name
+    assert result["meta"]["seed"] == 3
+    assert oracle.run("tiny", seed=3) == result
+
+
+def test_broken_path_is_caught_and_shrunk(monkeypatch, capsys):
+    def ignores_direction(case):
+        # scores every criterion as if it were maximized
+        flipped = [type(c)(c.name, c.weight, True) for c in case.criteria]
+        strategy = oracle.StrategyFactory.get_strategy(case.strategy)
+        return strategy.evaluate(DecisionMatrix.from_evaluations(case.options, flipped), None, case.risk_weight), None
+
+    monkeypatch.setattr(oracle, "PATHS", list(oracle.PATHS))
+    oracle.register(oracle.FastPath("broken", ignores_direction, ("expected_value",)))
+    monkeypatch.setitem(oracle.PROFILES, "tiny", {"cases": 6, "max_options": 60, "max_criteria": 5})
+    assert oracle.main(["--profile", "tiny", "--only", "broken", "--seed", "1"]) == 1
+    assert "FAIL broken" in capsys.readouterr().err
+
+    report = oracle.run("tiny", seed=1, only="broken")["paths"]["broken"]
+    assert report["failures"] and report["rank_disagreements"] > 0
+    for failure in report["failures"]:
+        reproducer = json.loads(json.dumps(failure["reproducer"]))
+        options, criteria = problem_from_dict(reproducer)
+        assert len(options) <= 3 and len(criteria) == 1 and not criteria[0].maximize
+        assert all(set(opt.outcomes) == {criteria[0].name} for opt in options)
+        case = oracle.Case(options, criteria, reproducer["strategy"], reproducer["risk_weight"])
+        assert oracle.check(oracle.PATHS[-1], case).failed(oracle.PATHS[-1])
+
+
+def test_rank_disagreements():
+    reference = {"a": 3.0, "b": 2.0, "c": 2.0, "d": 1.0}
+    assert oracle.rank_disagreements(reference, ["a", "c", "b", "d"]) == 0
+    assert oracle.rank_disagreements(reference, ["b", "a", "c", "d"]) == 1
+    assert oracle.rank_disagreements(reference, ["a", "d"]) == 2
+    assert oracle.rank_disagreements({"a": 1.0, "b": 1.0 + 1e-15}, ["a", "b"], 1e-12) == 0
+
+
+def test_generated_problems_cover_edge_cases():
+    rng = random.Random(0)
+    seen = set()
+    for _ in range(300):
+        options, criteria = oracle.make_case(rng, 50, 4)
+        matrix = DecisionMatrix.from_evaluations(options, criteria)
+        matrix.validate()
+        seen.add(("single", matrix.n_options == 1))
+        seen.add(("negative", bool((matrix.worst < 0).any())))
+        seen.add(("zero weight", bool((matrix.weights == 0).any())))
+        if matrix.n_options > 1:
+            seen.add(("constant column", bool((matrix.expected.min(axis=0) == matrix.expected.max(axis=0)).any())))
+            seen.add(("tie", len(set(matrix.expected[:, 0].tolist())) < matrix.n_options))
+    assert {(name, True) for name, _ in seen} <= seen
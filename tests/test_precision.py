@@ -0,0 +1,171 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.matrix import DecisionMatrix
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.normalization import RankNormalizer, using_normalizer
+from core.precision import Float32Strategy, float32_scores, near_ties
+from core.sensitivity import sensitivity_analysis
+from core.strategies import StrategyFactory
+
+STRATEGIES = ["expected_value", "risk_averse", "regret_minimization"]
+
+
+def tied_matrix(n=2000, m=5, offset=1e5, seed=0):
+    """Large magnitudes with small spreads, plus options a hair apart"""
+    rng = np.random.default_rng(seed)
+    worst = rng.random((n, m)) * 10 + offset
+    expected = worst + rng.random((n, m))
+    best = expected + rng.random((n, m))
+    for values in (worst, expected, best):
+        values[:40] = values[40:80] + 1e-9
+    criteria = [Criterion(f"c{j}", 1 / m, bool(j % 2)) for j in range(m)]
+    return DecisionMatrix.from_arrays([f"opt{i}" for i in range(n)], criteria, best, expected, worst)
+
+
+def ranking(scores):
+    return np.argsort(-np.asarray(scores), kind="stable").tolist()
+
+
+@pytest.mark.parametrize("name", STRATEGIES)
+@pytest.mark.parametrize("offset", [0.0, 1e5])
+def test_ranking_matches_float64(name, offset):
+    matrix = tied_matrix(offset=offset)
+    strategy = StrategyFactory.get_strategy(name)
+    reference = strategy.evaluate_matrix(matrix, 0.3)
+    scores, rescored, report = float32_scores(matrix, strategy, 0.3)
+    assert ranking(scores) == ranking(reference)
+    assert scores[rescored].tolist() == reference[rescored].tolist()
+    assert 0 < report.rescored < matrix.n_options or offset == 1e5
+    assert np.abs(scores - reference).max() <= report.margin
+
+
+@pytest.mark.parametrize("name", STRATEGIES)
+def test_top_k_rescores_less(name):
+    matrix = tied_matrix(offset=0.0, seed=1)
+    strategy = StrategyFactory.get_strategy(name)
+    reference = ranking(strategy.evaluate_matrix(matrix, 0.5))
+    full = float32_scores(matrix, strategy)[2]
+    for k in (1, 10, 100):
+        scores, _, report = float32_scores(matrix, strategy, k=k)
+        assert ranking(scores)[:k] == reference[:k]
+        assert report.rescored <= full.rescored
+
+
+def test_near_ties_clusters():
+    scores = np.array([0.9, 0.5, 0.5004, 0.1, 0.1001, 0.8], dtype=np.float32)
+    assert near_ties(scores, 0.001).tolist() == [1, 2, 3, 4]
+    assert near_ties(scores, 0.001, k=3).tolist() == [1, 2]
+    assert near_ties(scores, 0.001, k=2).tolist() == []
+    assert near_ties(scores, 0.0).tolist() == []
+
+
+def test_report_and_wrapper():
+    matrix = tied_matrix(n=500, offset=0.0)
+    strategy = Float32Strategy(StrategyFactory.get_strategy("risk_averse"), measure_baseline=True)
+    scores = strategy.evaluate(matrix, None)
+    report = strategy.last_report
+    assert report.n_options == 500
+    assert report.bytes_float64 == (5 * 500 * 5 + 500) * 8
+    assert report.modeled_saved_bytes == report.bytes_float64 // 2 - report.rescored * (5 * 5 + 1) * 8
+    assert report.saved_seconds is not None
+    assert ranking(list(scores.values())) == ranking(StrategyFactory.get_strategy("risk_averse").evaluate_matrix(matrix))
+
+
+def test_sensitivity_analysis_float32():
+    rng = random.Random(3)
+    criteria = [Criterion("salary", 0.6), Criterion("risk", 0.4, False)]
+    options = [
+        OptionEvaluation(Option(f"opt{i}"), {
+            c.name: Outcome(w + rng.uniform(2, 4), w + rng.uniform(0, 2), w)
+            for c in criteria for w in [rng.uniform(0, 10)]
+        })
+        for i in range(60)
+    ]
+    strategy = StrategyFactory.get_strategy("expected_value")
+    exact = sensitivity_analysis(options, criteria, strategy)
+    reduced = sensitivity_analysis(options, criteria, strategy, precision="float32")
+    for rw in exact:
+        assert sorted(reduced[rw], key=reduced[rw].get) == sorted(exact[rw], key=exact[rw].get)
+        assert reduced[rw] == pytest.approx(exact[rw], abs=1e-5)
+    with pytest.raises(ValueError):
+        sensitivity_analysis(options, criteria, strategy, precision="float16")
+
+
+def test_evaluations_go_straight_to_float32(monkeypatch):
+    matrix = tied_matrix(n=300)
+    options = list(matrix)
+    criteria = [
+        Criterion(name, float(w), bool(mx))
+        for name, w, mx in zip(matrix.criterion_names, matrix.weights, matrix.maximize)
+    ]
+    strategy = StrategyFactory.get_strategy("risk_averse")
+    expected = ranking(strategy.evaluate_matrix(matrix, 0.3))
+
+    built = []
+    original = DecisionMatrix.from_evaluations.__func__
+
+    def from_evaluations(cls, options, criteria, dtype=float):
+        built.append((len(options), np.dtype(dtype)))
+        return original(cls, options, criteria, dtype)
+
+    monkeypatch.setattr(DecisionMatrix, "from_evaluations", classmethod(from_evaluations))
+    astype = DecisionMatrix.astype
+
+    def no_copy(self, dtype):
+        result = astype(self, dtype)
+        assert result is self, "unexpected cast"
+        return result
+
+    monkeypatch.setattr(DecisionMatrix, "astype", no_copy)
+    reduced = Float32Strategy(strategy)
+    scores = reduced.evaluate(options, criteria, 0.3)
+    assert ranking(list(scores.values())) == expected
+    assert built[0] == (300, np.float32)
+    # only anchor and near-tie rows are rebuilt in float64
+    assert all(dtype == np.float64 and n < 300 for n, dtype in built[1:])
+
+    built.clear()
+    sensitivity_analysis(options, criteria, strategy, risk_weights=[0.0, 0.5, 1.0], precision="float32")
+    assert [n for n, dtype in built if dtype == np.float32] == [300]
+
+
+def test_unsupported_configurations():
+    matrix = tied_matrix(n=100)
+    with pytest.raises(ValueError):
+        Float32Strategy(StrategyFactory.get_strategy("scenario_regret"))
+    with using_normalizer(RankNormalizer()), pytest.raises(ValueError, match="min-max"):
+        float32_scores(matrix, StrategyFactory.get_strategy("expected_value"))
+
+
+def test_batch_keeps_float32_wrappers_apart(monkeypatch):
+    from core.agent import risk_aware_agent
+    from core.batch import evaluate_batch
+    import core.precision
+
+    rng = random.Random(5)
+    criteria = [Criterion("salary", 0.6), Criterion("risk", 0.4, False)]
+    wrapped = [
+        Float32Strategy(StrategyFactory.get_strategy("risk_averse")),
+        Float32Strategy(StrategyFactory.get_strategy("regret_minimization")),
+        Float32Strategy(StrategyFactory.get_strategy("risk_averse"), k=1),
+    ]
+    assert len({s.cache_key() for s in wrapped}) == len(wrapped)
+    problems = [
+        ([OptionEvaluation(Option(f"opt{i}"), {
+            c.name: Outcome(w + rng.uniform(2, 4), w + rng.uniform(0, 2), w)
+            for c in criteria for w in [rng.uniform(0, 10)]
+        }) for i in range(6)], criteria, wrapped[p % 3], 0.5)
+        for p in range(9)
+    ]
+    calls = []
+    original = core.precision.float32_scores
+    monkeypatch.setattr(core.precision, "float32_scores", lambda *a: calls.append(a) or original(*a))
+    for problem, result in zip(problems, evaluate_batch(problems)):
+        expected = risk_aware_agent(problem[0], criteria, problem[2].strategy, 0.5)
+        k = problem[2].k or len(problem[0])
+        assert [name for name, _ in result["ranking"][:k]] == [name for name, _ in expected["ranking"][:k]]
+        assert result["scores"] == pytest.approx(expected["scores"], abs=1e-5)
+    assert len(calls) == len(problems)
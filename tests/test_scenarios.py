@@ -0,0 +1,176 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.cache import fingerprint
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.problems import problem_from_dict, problem_to_dict
+from core.scenarios import ScenarioMatrix, regret_matrix, aggregate_regret, scenario_regret_values
+from core.strategies import ScenarioRegretStrategy, RegretMinimizationStrategy, StrategyFactory
+
+CRITERIA = [Criterion("profit", 0.7, True), Criterion("cost", 0.3, False)]
+
+
+def scenario_options(n, scenarios, seed=0):
+    rng = random.Random(seed)
+    return [
+        OptionEvaluation(
+            Option(f"opt{i}"),
+            {c.name: Outcome.from_scenarios([rng.uniform(0, 100) for _ in range(scenarios)]) for c in CRITERIA},
+        )
+        for i in range(n)
+    ]
+
+
+def reference_regrets(options, criterion, aggregation, probabilities=None):
+    """Per-option regret computed scenario by scenario in plain Python"""
+    vectors = [opt.outcomes[criterion.name].scenarios for opt in options]
+    result = []
+    for vector in vectors:
+        regrets = []
+        for s, value in enumerate(vector):
+            column = [v[s] for v in vectors]
+            regrets.append(max(column) - value if criterion.maximize else value - min(column))
+        if aggregation == "max":
+            result.append(max(regrets))
+        else:
+            weights = probabilities or [1 / len(regrets)] * len(regrets)
+            result.append(sum(w * r for w, r in zip(weights, regrets)))
+    return result
+
+
+def test_outcome_from_scenarios():
+    outcome = Outcome.from_scenarios([3, 1, 2], probabilities=[0.5, 0.25, 0.25])
+    assert (outcome.best, outcome.worst, outcome.scenarios) == (3.0, 1.0, (3.0, 1.0, 2.0))
+    assert outcome.expected == pytest.approx(2.25)
+    outcome.validate()
+    with pytest.raises(ValueError):
+        Outcome(2, 1, 0, scenarios=(3.0,)).validate()
+
+
+def test_regret_matrix_per_scenario():
+    values = np.array([[10.0, 0.0], [4.0, 6.0]])
+    assert regret_matrix(values, True).tolist() == [[0.0, 6.0], [6.0, 0.0]]
+    assert regret_matrix(values, False).tolist() == [[6.0, 0.0], [0.0, 6.0]]
+    regret = regret_matrix(values, True)
+    assert aggregate_regret(regret, "max").tolist() == [6.0, 6.0]
+    assert aggregate_regret(regret, "expected", [0.75, 0.25]).tolist() == [1.5, 4.5]
+
+
+@pytest.mark.parametrize("aggregation", ["max", "expected"])
+def test_matches_python_reference(aggregation):
+    options = scenario_options(30, 50)
+    matrix = ScenarioMatrix.from_evaluations(options, CRITERIA)
+    assert all(s.flags.c_contiguous and s.shape == (30, 50) for s in matrix.scenarios)
+    values = scenario_regret_values(matrix, aggregation)
+    for j, c in enumerate(CRITERIA):
+        assert values[:, j].tolist() == pytest.approx(reference_regrets(options, c, aggregation))
+
+
+def test_list_matrix_and_array_inputs_agree():
+    options = scenario_options(20, 40, seed=1)
+    strategy = ScenarioRegretStrategy("expected", probabilities=[1 / 40] * 40)
+    scores = strategy.evaluate(options, CRITERIA)
+    matrix = ScenarioMatrix.from_evaluations(options, CRITERIA)
+    assert strategy.evaluate(matrix, None) == scores
+    tensor = np.array([[opt.outcomes[c.name].scenarios for c in CRITERIA] for opt in options])
+    arrays = ScenarioMatrix.from_scenario_arrays([o.option.name for o in options], CRITERIA, tensor)
+    assert strategy.evaluate(arrays, None) == scores
+    reordered = arrays.with_criteria(CRITERIA[::-1])
+    assert isinstance(reordered, ScenarioMatrix)
+    assert strategy.evaluate(reordered, None) == pytest.approx(scores)
+    assert list(matrix)[3] == options[3]
+
+
+def test_three_point_falls_back_to_regret_minimization():
+    rng = random.Random(2)
+    options = []
+    for i in range(25):
+        outcomes = {}
+        for c in CRITERIA:
+            worst = rng.uniform(0, 50)
+            outcomes[c.name] = Outcome(worst + 20, worst + 10, worst)
+        options.append(OptionEvaluation(Option(f"opt{i}"), outcomes))
+    expected = RegretMinimizationStrategy().evaluate(options, CRITERIA)
+    for aggregation in ("max", "expected"):
+        assert ScenarioRegretStrategy(aggregation).evaluate(options, CRITERIA) == expected
+
+
+def test_mixed_criteria():
+    options = scenario_options(10, 5, seed=3)
+    options = [
+        OptionEvaluation(opt.option, {**opt.outcomes, "cost": Outcome(*(opt.outcomes["cost"].best,) * 3)})
+        for opt in options
+    ]
+    matrix = ScenarioMatrix.from_evaluations(options, CRITERIA)
+    assert matrix.scenarios[1] is None
+    values = scenario_regret_values(matrix)
+    assert values[:, 0].tolist() == pytest.approx(reference_regrets(options, CRITERIA[0], "max"))
+    assert values[:, 1].tolist() == (matrix.worst[:, 1].max() - matrix.worst[:, 1]).tolist()
+
+
+def test_inconsistent_scenarios_rejected():
+    options = scenario_options(3, 4)
+    short = OptionEvaluation(Option("short"), {c.name: Outcome.from_scenarios([1, 2]) for c in CRITERIA})
+    with pytest.raises(ValueError, match="same number"):
+        ScenarioRegretStrategy().evaluate(options + [short], CRITERIA)
+    bare = OptionEvaluation(Option("bare"), {c.name: Outcome(2, 1, 0) for c in CRITERIA})
+    with pytest.raises(ValueError, match="some options only"):
+        ScenarioRegretStrategy().evaluate(options + [bare], CRITERIA)
+    with pytest.raises(ValueError):
+        ScenarioRegretStrategy("median")
+
+
+def test_problem_dicts_and_cache_keys_carry_scenarios():
+    options = scenario_options(4, 3)
+    parsed, criteria = problem_from_dict(problem_to_dict(options, CRITERIA))
+    assert parsed == options and criteria == CRITERIA
+    short, _ = problem_from_dict({"criteria": [], "options": [{"name": "x", "outcomes": {"a": {"scenarios": [1, 3]}}}]})
+    assert short[0].outcomes["a"] == Outcome(3.0, 2.0, 1.0, (1.0, 3.0))
+
+    strategy = StrategyFactory.get_strategy("scenario_regret")
+    changed = [OptionEvaluation(options[0].option, {
+        **options[0].outcomes,
+        "profit": Outcome(*[getattr(options[0].outcomes["profit"], f) for f in ("best", "expected", "worst")],
+                          scenarios=options[0].outcomes["profit"].scenarios[::-1]),
+    })] + options[1:]
+    assert fingerprint(options, CRITERIA, strategy) != fingerprint(changed, CRITERIA, strategy)
+
+
+def test_vectorized_paths_keep_scenarios():
+    from core.agent import risk_aware_agent
+    from core.batch import evaluate_batch
+    from core.fused import compare_strategies
+    from core.matrix import DecisionMatrix
+    from core.sensitivity import sensitivity_sweep
+
+    options = scenario_options(12, 6, seed=4)
+    matrix = DecisionMatrix.from_evaluations(options, CRITERIA)
+    assert isinstance(matrix, ScenarioMatrix)
+    assert matrix.rows(slice(2, 5)).scenarios[0].tolist() == matrix.scenarios[0][2:5].tolist()
+    assert matrix.astype(np.float32).scenarios[1].dtype == np.float32
+
+    for aggregation in ("max", "expected"):
+        strategy = ScenarioRegretStrategy(aggregation)
+        expected = risk_aware_agent(options, CRITERIA, strategy)["scores"]
+        assert strategy.evaluate(matrix, None) == expected
+        assert sensitivity_sweep(options, CRITERIA, strategy, [0.5]).as_dict()[0.5] == expected
+        batched = list(evaluate_batch([(options, CRITERIA, strategy, 0.5), (options[:5], CRITERIA, strategy, 0.5)]))
+        assert batched[0]["scores"] == expected
+    assert compare_strategies(options, CRITERIA, ["scenario_regret"]).table()["scenario_regret"] == (
+        ScenarioRegretStrategy().evaluate(options, CRITERIA)
+    )
+
+
+def test_batch_keeps_differently_configured_strategies_apart(tmp_path):
+    from core.batch import evaluate_batch
+    from core.storage import save_problem
+
+    options = scenario_options(8, 4, seed=5)
+    strategies = [ScenarioRegretStrategy("max"), ScenarioRegretStrategy("expected")]
+    assert strategies[0].cache_key() != strategies[1].cache_key()
+    results = list(evaluate_batch([(options, CRITERIA, s, 0.5) for s in strategies]))
+    assert [r["scores"] for r in results] == [s.evaluate(options, CRITERIA) for s in strategies]
+    with pytest.raises(ValueError, match="scenario"):
+        save_problem(str(tmp_path / "p.dmx"), options, CRITERIA)
@@ -1,3 +1,4 @@
+import pytest
 from core.models import Option, Outcome, OptionEvaluation, Criterion
 from core.strategies import ExpectedValueStrategy
 from core.sensitivity import sensitivity_analysis
@@ -28,3 +29,36 @@ def test_sensitivity_realistic():
         scores = results[rw]
         ranked_options = sorted(scores.items(), key=lambda x: x[1], reverse=True)
         assert ranked_options[0][0] in ["A", "B"], f"Unexpected top option at risk_weight={rw}"
+
+
+def test_sensitivity_sweep_matches_loop():
+    pytest.importorskip("numpy")
+    from core.sensitivity import sensitivity_sweep
+    from core.strategies import StrategyFactory
+
+    options = [
+        OptionEvaluation(option=Option("A"), outcomes={"c": Outcome(10, 8, 5), "d": Outcome(3, 2, 1)}),
+        OptionEvaluation(option=Option("B"), outcomes={"c": Outcome(8, 7, 6), "d": Outcome(4, 2, 2)}),
+        OptionEvaluation(option=Option("C"), outcomes={"c": Outcome(9, 6, 6), "d": Outcome(2, 2, 2)}),
+    ]
+    criteria = [Criterion("c", 0.7), Criterion("d", 0.3, False)]
+    risk_weights = [i / 20 for i in range(21)]
+
+    for name in ["expected_value", "risk_averse", "regret_minimization"]:
+        strategy = StrategyFactory.get_strategy(name)
+        sweep = sensitivity_sweep(options, criteria, strategy, risk_weights=risk_weights)
+        assert sweep.scores.shape == (21, 3)
+        assert dict(sweep.as_dict()) == sensitivity_analysis(options, criteria, strategy, risk_weights)
+
+
+def test_sensitivity_sweep_winners():
+    pytest.importorskip("numpy")
+    from core.sensitivity import sensitivity_sweep
+
+    options = [
+        OptionEvaluation(option=Option("A"), outcomes={"c": Outcome(10, 8, 5)}),
+        OptionEvaluation(option=Option("B"), outcomes={"c": Outcome(8, 7, 6)})
+    ]
+    sweep = sensitivity_sweep(options, [Criterion("c", 1.0)], ExpectedValueStrategy(), [0.0, 1.0])
+    assert sweep.winners() == ["A", "B"]
+    assert list(sweep.as_dict()) == [0.0, 1.0]
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import random
+import threading
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.agent import risk_aware_agent
+from core.strategies import StrategyFactory
+from core.problems import problem_to_dict, result_to_dict
+from service.server import DecisionService, ServiceOverloaded, serve, parse_problem
+from conftest import random_options
+
+CRITERIA = [Criterion("salary", 0.6, True), Criterion("risk", 0.4, False)]
+
+
+def random_request(rng, strategy="risk_averse"):
+    options = random_options(rng, rng.randint(2, 6), CRITERIA)
+    return options, CRITERIA, StrategyFactory.get_strategy(strategy), rng.choice([0.0, 0.5, 1.0])
+
+
+def payload(problem):
+    options, criteria, _, risk_weight = problem
+    return {**problem_to_dict(options, criteria), "strategy": "risk_averse", "risk_weight": risk_weight}
+
+
+def test_concurrent_requests_share_batches():
+    rng = random.Random(0)
+    problems = [random_request(rng, rng.choice(["expected_value", "regret_minimization"])) for _ in range(200)]
+
+    async def run():
+        async with DecisionService(max_batch=64, max_delay=0.01) as service:
+            results = await asyncio.gather(*(service.submit(*p) for p in problems))
+            return results, service.stats
+
+    results, stats = asyncio.run(run())
+    for problem, result in zip(problems, results):
+        expected = risk_aware_agent(*problem)
+        assert [name for name, _ in result["ranking"]] == [name for name, _ in expected["ranking"]]
+        assert result["scores"] == pytest.approx(expected["scores"])
+        for name, row in expected["breakdown"].items():
+            assert result["breakdown"][name] == pytest.approx(row)
+    assert stats.completed == 200
+    assert stats.batches < 200
+    assert stats.latency.count == 200
+
+
+def test_invalid_problem_fails_alone():
+    rng = random.Random(1)
+    good = random_request(rng)
+    options, criteria, strategy, rw = random_request(rng)
+    bad = ([OptionEvaluation(Option("broken"), {"salary": Outcome(1, 1, 1)})] + options, criteria, strategy, rw)
+
+    async def run():
+        async with DecisionService(max_delay=0.01) as service:
+            return await asyncio.gather(service.submit(*good), service.submit(*bad), return_exceptions=True)
+
+    ok, error = asyncio.run(run())
+    assert ok["ranking"] == risk_aware_agent(*good)["ranking"]
+    assert isinstance(error, ValueError)
+
+
+def test_lone_invalid_problem_is_answered():
+    rng = random.Random(4)
+    options, criteria, strategy, rw = random_request(rng)
+    bad = ([OptionEvaluation(Option("broken"), {"salary": Outcome(1, 1, 1)})] + options, criteria, strategy, rw)
+
+    async def run():
+        async with DecisionService(max_delay=0.0) as service:
+            with pytest.raises(ValueError):
+                await asyncio.wait_for(service.submit(*bad), 3)
+            return service.stats
+
+    stats = asyncio.run(run())
+    assert stats.failed == 1
+
+
+def test_backpressure_and_deadlines():
+    rng = random.Random(2)
+    release = threading.Event()
+
+    class Blocking(type(StrategyFactory.get_strategy("risk_averse"))):
+        def evaluate_padded(self, batch):
+            release.wait(5)
+            return super().evaluate_padded(batch)
+
+        def evaluate_detailed(self, options, criteria, risk_weight=0.5):
+            release.wait(5)
+            return super().evaluate_detailed(options, criteria, risk_weight)
+
+    async def run():
+        async with DecisionService(max_pending=2, max_delay=0.0, concurrency=1) as service:
+            first = asyncio.create_task(service.submit(*random_request(rng)[:2], Blocking()))
+            await asyncio.sleep(0.01)
+            second = asyncio.create_task(service.submit(*random_request(rng)[:2], Blocking(), deadline=0.05))
+            await asyncio.sleep(0.01)
+            with pytest.raises(ServiceOverloaded):
+                await service.submit(*random_request(rng))
+            with pytest.raises(TimeoutError):
+                await second
+            release.set()
+            await first
+            return service.stats
+
+    stats = asyncio.run(run())
+    assert stats.rejected == 1
+    assert stats.expired == 1
+    assert stats.completed == 1
+    # the expired request never reached the executor
+    assert stats.batched == 1
+
+
+def test_http_round_trip(tmp_path):
+    rng = random.Random(3)
+    problem = random_request(rng)
+
+    async def request(reader, writer, method, target, body=b""):
+        writer.write(
+            f"{method} {target} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+        status = int((await reader.readline()).split()[1])
+        length = 0
+        while (line := await reader.readline()) != b"\r\n":
+            name, _, value = line.decode().partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await reader.readexactly(length))
+
+    async def run():
+        async with DecisionService(max_delay=0.0) as service:
+            server = await serve(service, path=str(tmp_path / "decisions.sock"))
+            async with server:
+                reader, writer = await asyncio.open_unix_connection(str(tmp_path / "decisions.sock"))
+                decided = await request(reader, writer, "POST", "/decide", json.dumps(payload(problem)).encode())
+                bad = await request(reader, writer, "POST", "/decide", b"{}")
+                # parses, then fails scoring: the broken option has no "risk" outcome
+                unscorable = payload(problem)
+                unscorable["options"] = [
+                    {"name": "broken", "outcomes": {"salary": {"best": 1, "expected": 1, "worst": 1}}}
+                ]
+                failed = await asyncio.wait_for(
+                    request(reader, writer, "POST", "/decide", json.dumps(unscorable).encode()), 3
+                )
+                stats = await request(reader, writer, "GET", "/stats")
+                writer.close()
+                return decided, bad, failed, stats
+
+    (status, body), (bad_status, _), (failed_status, failed_body), (_, stats) = asyncio.run(run())
+    assert status == 200
+    expected = result_to_dict(risk_aware_agent(*parse_problem(payload(problem))[0]))
+    assert [name for name, _ in body["ranking"]] == [name for name, _ in expected["ranking"]]
+    assert body["scores"] == pytest.approx(expected["scores"])
+    assert bad_status == 400
+    assert failed_status == 400 and "missing outcomes" in json.dumps(failed_body)
+    assert stats["completed"] == 1
@@ -0,0 +1,73 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.models import Criterion
+from core.matrix import DecisionMatrix
+from core.normalization import ZScoreNormalizer, using_normalizer
+from core.scoring import calculate_scores_with_risk
+from core.sharding import sharded_evaluate, ProcessBackend
+from core.storage import save_problem
+from core.strategies import StrategyFactory
+from conftest import random_options
+
+CRITERIA = [Criterion("salary", 0.5, True), Criterion("growth", 0.3, True), Criterion("risk", 0.2, False)]
+
+
+def sample_options(n, seed=0):
+    # eighth steps repeat values, making ties
+    return random_options(random.Random(seed), n, CRITERIA, -5.0, 5.0, 2.5, step=0.125)
+
+
+def split(options, sizes):
+    shards, start = [], 0
+    for size in sizes:
+        shards.append(options[start : start + size])
+        start += size
+    return shards
+
+
+@pytest.mark.parametrize("risk_weight", [0.0, 0.5, 1.0])
+@pytest.mark.parametrize("name", ["expected_value", "risk_averse", "regret_minimization"])
+def test_matches_single_process_exactly(name, risk_weight):
+    options = sample_options(400)
+    strategy = StrategyFactory.get_strategy(name)
+    expected = strategy.evaluate(options, CRITERIA, risk_weight=risk_weight)
+    result = sharded_evaluate(
+        split(options, [1, 150, 99, 150]), CRITERIA, strategy, risk_weight, k=25, chunk_size=40, return_scores=True
+    )
+    assert result.scores == expected
+    assert result.ranking == sorted(expected.items(), key=lambda x: x[1], reverse=True)[:25]
+    if name != "regret_minimization":
+        assert expected == calculate_scores_with_risk(options, CRITERIA, risk_weight)
+
+
+def test_mixed_shard_kinds_over_processes(tmp_path):
+    options = sample_options(300, seed=1)
+    dmx = str(tmp_path / "part.dmx")
+    save_problem(dmx, options[100:200], CRITERIA)
+    csv = tmp_path / "part.csv"
+    csv.write_text("option,criterion,best,expected,worst\n" + "".join(
+        f"{opt.option.name},{n},{o.best!r},{o.expected!r},{o.worst!r}\n"
+        for opt in options[200:] for n, o in opt.outcomes.items()
+    ))
+    shards = [DecisionMatrix.from_evaluations(options[:100], CRITERIA), dmx, str(csv)]
+    strategy = StrategyFactory.get_strategy("risk_averse")
+    with ProcessBackend(2) as backend:
+        result = sharded_evaluate(shards, CRITERIA, strategy, 0.3, k=10, backend=backend, return_scores=True)
+    assert result.scores == calculate_scores_with_risk(options, CRITERIA, 0.3)
+    assert sum(s.count for s in result.stats) == 3 * len(options)
+
+
+def test_normalizer_travels_to_workers():
+    options = sample_options(120, seed=2)
+    strategy = StrategyFactory.get_strategy("expected_value")
+    with using_normalizer(ZScoreNormalizer()):
+        expected = strategy.evaluate(options, CRITERIA)
+        with ProcessBackend(2) as backend:
+            result = sharded_evaluate(split(options, [60, 60]), CRITERIA, strategy, k=5, backend=backend, return_scores=True)
+    assert result.scores == pytest.approx(expected)
+    assert [name for name, _ in result.ranking] == [
+        name for name, _ in sorted(expected.items(), key=lambda x: x[1], reverse=True)[:5]
+    ]
@@ -0,0 +1,53 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.models import Option, Outcome, OptionEvaluation, Criterion
+from core.skyline import pareto_front, pareto_layers, front_indices, layer_indices
+
+
+def brute_front(points):
+    keep = []
+    for i, p in enumerate(points):
+        if not any((q >= p).all() and (q > p).any() for q in points):
+            keep.append(i)
+    return keep
+
+
+@pytest.mark.parametrize("m", [1, 2, 3, 4, 6])
+@pytest.mark.parametrize("seed", range(5))
+def test_front_matches_brute_force(m, seed):
+    rng = np.random.default_rng(seed)
+    # small integer grid forces ties and duplicates
+    points = rng.integers(0, 6, size=(300, m)).astype(float)
+    assert front_indices(points).tolist() == brute_front(points)
+
+
+def test_bnl_block_size_does_not_change_result():
+    points = np.random.default_rng(9).normal(size=(500, 5))
+    assert front_indices(points, max_bytes=200).tolist() == front_indices(points).tolist()
+
+
+def test_layers_partition_points():
+    points = np.random.default_rng(3).integers(0, 8, size=(200, 3)).astype(float)
+    layers = layer_indices(points)
+    assert sorted(np.concatenate(layers).tolist()) == list(range(200))
+    remaining = list(range(200))
+    for layer in layers:
+        sub = points[remaining]
+        assert layer.tolist() == [remaining[i] for i in brute_front(sub)]
+        remaining = [i for i in remaining if i not in set(layer.tolist())]
+    assert len(layer_indices(points, max_layers=2)) == 2
+
+
+def test_pareto_front_honors_maximize_and_risk():
+    options = [
+        OptionEvaluation(option=Option("A"), outcomes={"salary": Outcome(10, 8, 6), "cost": Outcome(3, 2, 1)}),
+        OptionEvaluation(option=Option("B"), outcomes={"salary": Outcome(9, 7, 5), "cost": Outcome(4, 3, 2)}),
+        OptionEvaluation(option=Option("C"), outcomes={"salary": Outcome(20, 9, 0), "cost": Outcome(6, 5, 4)}),
+    ]
+    criteria = [Criterion("salary", 0.5, True), Criterion("cost", 0.5, False)]
+    assert pareto_front(options, criteria) == ["A", "C"]
+    # C's wide salary range drops its risk-adjusted value below A's
+    assert pareto_front(options, criteria, risk_weight=0.5) == ["A"]
+    assert pareto_layers(options, criteria, risk_weight=0.5) == [["A"], ["B"], ["C"]]
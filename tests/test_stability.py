@@ -0,0 +1,90 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.models import Criterion
+from core.scoring import calculate_scores_with_risk
+from core.stability import WeightStability
+from core.strategies import Strategy, StrategyFactory
+from conftest import random_problem
+
+
+def winner_with(options, criteria, j, t, mode):
+    weights = [c.weight for c in criteria]
+    total = sum(weights)
+    if mode == "proportional":
+        weights = [w * (total - t) / (total - weights[j]) for w in weights]
+    weights[j] = t
+    reweighted = [Criterion(c.name, w, c.maximize) for c, w in zip(criteria, weights)]
+    scores = calculate_scores_with_risk(options, reweighted, 0.5)
+    return max(scores, key=scores.get)
+
+
+def test_scores_match_reference():
+    options, criteria = random_problem()
+    engine = WeightStability(options, criteria)
+    reference = calculate_scores_with_risk(options, criteria, 0.5)
+    assert engine.scores(engine.weights).tolist() == pytest.approx([reference[n] for n in engine.option_names])
+
+
+@pytest.mark.parametrize("mode", ["proportional", "independent"])
+@pytest.mark.parametrize("seed", range(5))
+def test_intervals_are_exact(mode, seed):
+    options, criteria = random_problem(seed=seed)
+    engine = WeightStability(options, criteria)
+    for j, interval in enumerate(engine.intervals(mode)):
+        assert interval.lower <= interval.weight <= interval.upper
+        eps = 1e-7
+        for t in np.linspace(interval.lower + eps, interval.upper - eps, 7):
+            assert winner_with(options, criteria, j, t, mode) == interval.winner
+        if interval.lower_rival is not None:
+            assert winner_with(options, criteria, j, interval.lower - 1e-6, mode) != interval.winner
+        if interval.upper_rival is not None:
+            assert winner_with(options, criteria, j, interval.upper + 1e-6, mode) != interval.winner
+
+
+def test_sampled_win_probabilities():
+    options, criteria = random_problem(seed=3)
+    engine = WeightStability(options, criteria, strategy=StrategyFactory.get_strategy("regret_minimization"))
+    probabilities = engine.sample(5_000, seed=1, chunk_size=1_000)
+    assert sum(probabilities.values()) == pytest.approx(1.0)
+    assert engine.sample(5_000, seed=1, chunk_size=1_000) == probabilities
+
+
+def test_strategy_without_intermediates():
+    class Plain(Strategy):
+        def evaluate(self, options, criteria, risk_weight=0.5):
+            return {opt.option.name: 0.0 for opt in options}
+
+    options, criteria = random_problem()
+    with pytest.raises(ValueError):
+        WeightStability(options, criteria, strategy=Plain())
+
+
+def test_proportional_mode_rejects_out_of_range_weights():
+    options, criteria = random_problem()
+    criteria[1] = Criterion(criteria[1].name, 1.5, criteria[1].maximize)
+    engine = WeightStability(options, criteria)
+    with pytest.raises(ValueError, match="c1"):
+        engine.intervals("proportional")
+    interval = engine.intervals("independent")[1]
+    assert interval.lower <= 1.5 <= interval.upper
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_proportional_intervals_keep_every_weight_in_range(seed):
+    options, criteria = random_problem(seed=seed, weights=(0.3, 1.0))
+    engine = WeightStability(options, criteria)
+    total = engine.weights.sum()
+    for j, interval in enumerate(engine.intervals("proportional")):
+        for t in np.linspace(interval.lower, interval.upper, 9):
+            others = np.delete(engine.weights, j) * (total - t) / (total - engine.weights[j])
+            assert (others >= -1e-12).all() and (others <= 1 + 1e-12).all()
+
+
+def test_proportional_interval_stops_where_another_weight_reaches_one():
+    options, criteria = random_problem(n_criteria=2)
+    criteria = [Criterion(criteria[0].name, 1.0, True), Criterion(criteria[1].name, 0.5, True)]
+    second = WeightStability(options, criteria).intervals("proportional")[1]
+    # lowering c1 below 0.5 would push c0 past 1
+    assert second.lower == pytest.approx(0.5)
@@ -0,0 +1,79 @@
+import pickle
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.models import Option, OptionEvaluation, Criterion
+from core.matrix import DecisionMatrix
+from core.montecarlo import monte_carlo
+from core.storage import MappedMatrix, open_problem, save_problem, load_problem, MAGIC
+from core.strategies import StrategyFactory
+from conftest import random_options
+
+CRITERIA = [Criterion("salary", 0.5, True), Criterion("growth", 0.3, True), Criterion("risk", 0.2, False)]
+
+
+def sample_options(n, seed=0):
+    return random_options(
+        random.Random(seed), n, CRITERIA, option=lambda i: Option(f"opt {i} é", "note" if i % 3 == 0 else None)
+    )
+
+
+def test_round_trip_is_lossless(tmp_path):
+    path = str(tmp_path / "problem.dmx")
+    options = sample_options(40)
+    save_problem(path, options, CRITERIA)
+    loaded, criteria = load_problem(path)
+    assert loaded == options
+    assert criteria == CRITERIA
+
+    matrix = open_problem(path)
+    again = str(tmp_path / "again.dmx")
+    save_problem(again, matrix)
+    assert load_problem(again)[0] == options
+
+
+def test_arrays_are_read_only_views_of_the_mapping(tmp_path):
+    path = str(tmp_path / "problem.dmx")
+    options = sample_options(25)
+    save_problem(path, DecisionMatrix.from_evaluations(options, CRITERIA))
+    matrix = open_problem(path)
+    assert isinstance(matrix, MappedMatrix)
+    assert not matrix.best.flags.writeable
+    assert matrix.best.base is matrix.worst.base
+    strategy = StrategyFactory.get_strategy("risk_averse")
+    assert strategy.evaluate(matrix, None) == strategy.evaluate(options, CRITERIA)
+    # pickles as a path, not as the data
+    assert len(pickle.dumps(matrix)) < 200 + len(path)
+    assert np.array_equal(pickle.loads(pickle.dumps(matrix)).worst, matrix.worst)
+
+
+def test_workers_share_the_mapping(tmp_path):
+    path = str(tmp_path / "problem.dmx")
+    save_problem(path, sample_options(30), CRITERIA)
+    matrix = open_problem(path)
+    strategy = StrategyFactory.get_strategy("expected_value")
+    serial = monte_carlo(matrix, None, strategy, n_samples=2_000, chunk_size=500)
+    parallel = monte_carlo(matrix, None, strategy, n_samples=2_000, chunk_size=500, workers=2)
+    assert serial.first_dict() == parallel.first_dict()
+
+
+def test_empty_problem_and_bad_files(tmp_path):
+    path = str(tmp_path / "empty.dmx")
+    save_problem(path, [], CRITERIA)
+    matrix = open_problem(path)
+    assert matrix.n_options == 0 and matrix.criteria == CRITERIA
+
+    bad = tmp_path / "bad.dmx"
+    bad.write_bytes(b"not a problem file at all, just some bytes" * 4)
+    with pytest.raises(ValueError):
+        open_problem(str(bad))
+    future = tmp_path / "future.dmx"
+    data = bytearray(open(path, "rb").read())
+    data[len(MAGIC)] = 99
+    future.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="version"):
+        open_problem(str(future))
+    with pytest.raises(ValueError):
+        save_problem(path, [OptionEvaluation(Option("a\x00b"), sample_options(1)[0].outcomes)], CRITERIA)
@@ -1,6 +1,6 @@
 import pytest
 from core.models import Option, Outcome, OptionEvaluation, Criterion
-from core.strategies import StrategyFactory
+from core.strategies import Strategy, StrategyFactory
 
 # -------------------------
 # Sample Options & Criteria
@@ -64,3 +64,21 @@ def test_all_strategies(strategy_name):
     assert all(opt.option.name in scores for opt in options)
     # ensure scores are numbers
     assert all(isinstance(score, (int, float)) for score in scores.values())
+
+
+def test_factory_names():
+    names = StrategyFactory.names()
+    assert names[:3] == ["expected_value", "risk_averse", "regret_minimization"]
+    assert all(isinstance(StrategyFactory.get_strategy(name), Strategy) for name in names)
+    names.clear()
+    assert StrategyFactory.names()
+
+
+@pytest.mark.parametrize("strategy_name", ["expected_value", "risk_averse", "regret_minimization"])
+def test_evaluate_detailed_matches_evaluate(strategy_name):
+    strat = StrategyFactory.get_strategy(strategy_name)
+    detailed = strat.evaluate_detailed(options, criteria, risk_weight=0.5)
+    assert detailed.scores == strat.evaluate(options, criteria, risk_weight=0.5)
+    assert len(detailed.raw) == len(detailed.normalized) == len(criteria)
+    for column in detailed.normalized:
+        assert all(0.0 <= v <= 1.0 for v in column)